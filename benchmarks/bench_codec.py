@@ -0,0 +1,73 @@
+# benchmarks/bench_codec.py
+"""
+JSON codec backends per pipeline stage, on synthetic operations payloads.
+
+    python benchmarks/bench_codec.py [--records 2000]
+
+Stages: decoding response bodies, saving raw payloads, appending interim
+segment lines, re-encoding payloads into an archive and loading a `write`
+records file.  Each is compared with what the pipeline did before the
+codec layer: stdlib json.loads, and json.dumps with indent=2 for writes.
+Backends that aren't installed are skipped.
+"""
+
+import argparse
+import json
+import logging
+import time
+
+from payloads import synthetic_operations_payload
+
+from aged_care_pipeline.parsers.operations.operations_parser import OperationsParser
+from aged_care_pipeline.utils import codec
+
+
+def timed(fn, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=2000)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    payloads = [synthetic_operations_payload(n + 1) for n in range(args.records)]
+    bodies = [json.dumps(p).encode() for p in payloads]
+    parser = OperationsParser()
+    interim = [{"nid": p["nid"], "rows": parser.parse(p)} for p in payloads]
+    records = [json.dumps([r for i in interim for r in i["rows"]]).encode()]
+
+    def pretty(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode()
+
+    backends = [(name, codec.get_codec(name)) for name in codec.available()]
+    print(f"{args.records} payloads, {sum(map(len, bodies)) / 1e6:.1f} MB as JSON")
+    print(f"  {'stage':16s}" + "".join(f"{name:>14s}" for name, _ in backends))
+    stages = [
+        ("response decode", bodies, lambda c: c.loads, json.loads),
+        ("raw save", payloads, lambda c: c.dumps, pretty),
+        ("interim line", interim, lambda c: c.dumps, pretty),
+        (
+            "archive line",
+            bodies,
+            lambda c: lambda b: c.dumps(c.loads(b)),
+            lambda b: pretty(json.loads(b)),
+        ),
+        ("write load", records, lambda c: c.loads, json.loads),
+    ]
+    for stage, items, pick, before in stages:
+        base = timed(before, items)
+        cells = []
+        for _, c in backends:
+            secs = timed(pick(c), items)
+            cells.append(f"{secs * 1e3:7.1f} {base / secs:3.1f}x")
+        print(f"  {stage:16s}" + "".join(f"{cell:>14s}" for cell in cells))
+    print("  (ms, and speed-up over the old stdlib code)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/bench_field_paths.py
+"""
+Per-record cost of OperationsParser field extraction: one get_path() call
+per FIELD_PATHS column vs the compiled trie extractor.
+
+    python benchmarks/bench_field_paths.py [--records 2000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from payloads import synthetic_operations_payload
+
+from aged_care_pipeline.parsers.field_extractor import compile_field_paths
+from aged_care_pipeline.parsers.operations.operations_field_paths import (
+    FIELD_PATHS,
+    get_path,
+)
+
+
+def per_column(raw):
+    return {col: get_path(raw, path) for col, path in FIELD_PATHS.items()}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    payloads = [synthetic_operations_payload(n) for n in range(args.records)]
+    sparse = [{"nid": n, "operationsData": {}} for n in range(args.records)]
+    compiled = compile_field_paths(FIELD_PATHS)
+    assert all(per_column(p) == compiled(p) for p in payloads + sparse)
+
+    print(f"{len(FIELD_PATHS)} columns, {args.records} records, best of {args.repeat}")
+    for label, data in (("full payload", payloads), ("sparse payload", sparse)):
+        timings = {}
+        for name, fn in (("get_path", per_column), ("compiled", compiled)):
+            best = min(
+                timeit.repeat(
+                    lambda fn=fn, data=data: [fn(p) for p in data],
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            timings[name] = best / len(data) * 1e6
+        print(
+            f"  {label:15s} get_path {timings['get_path']:7.2f} µs/record   "
+            f"compiled {timings['compiled']:7.2f} µs/record   "
+            f"{timings['get_path'] / timings['compiled']:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# benchmarks/bench_parse_batch.py
+"""
+Rows-then-DataFrame vs OperationsParser.parse_batch (column buffers).
+
+    python benchmarks/bench_parse_batch.py [--records 2000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import timeit
+
+import pandas as pd
+from payloads import synthetic_operations_payload
+
+from aged_care_pipeline.parsers.operations.operations_parser import OperationsParser
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=2000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    parser = OperationsParser()
+    payloads = [synthetic_operations_payload(n + 1) for n in range(args.records)]
+
+    def via_rows():
+        return pd.DataFrame([row for raw in payloads for row in parser.parse(raw)])
+
+    def via_batch():
+        return parser.parse_batch(payloads, backend="pandas")
+
+    print(f"{args.records} records, best of {args.repeat}")
+    for name, fn in (("parse + DataFrame", via_rows), ("parse_batch", via_batch)):
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        per_record = best / args.records * 1e6
+        print(f"  {name:18s} {best * 1e3:8.1f} ms  ({per_record:.1f} µs/record)")
+
+
+if __name__ == "__main__":
+    main()
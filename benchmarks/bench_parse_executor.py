@@ -0,0 +1,46 @@
+# benchmarks/bench_parse_executor.py
+"""
+ParseExecutor in-process vs a worker pool, across chunk sizes.
+
+    python benchmarks/bench_parse_executor.py [--records 20000] [--workers 4]
+"""
+
+import argparse
+import logging
+import time
+
+from payloads import synthetic_operations_payload
+
+from aged_care_pipeline.parsers.executor import ParseExecutor
+from aged_care_pipeline.parsers.operations.operations_parser import OperationsParser
+
+
+def timed(executor: ParseExecutor, payloads: list) -> float:
+    start = time.perf_counter()
+    executor.map(payloads)
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--records", type=int, default=20000)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    parser = OperationsParser()
+    payloads = [synthetic_operations_payload(n + 1) for n in range(args.records)]
+
+    print(f"{args.records} records")
+    runs = [("in-process", 1, None)] + [
+        (f"{args.workers} workers, chunk {c}", args.workers, c) for c in (16, 64, 256)
+    ]
+    for name, workers, chunk in runs:
+        with ParseExecutor(parser, workers=workers, chunk_size=chunk) as executor:
+            executor.map(payloads[: args.workers * 2])  # start the pool
+            secs = timed(executor, payloads)
+        print(f"  {name:24s} {secs * 1e3:8.1f} ms  ({args.records / secs:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
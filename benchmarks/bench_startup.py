@@ -0,0 +1,129 @@
+# benchmarks/bench_startup.py
+"""
+CLI start-up cost: interpreter + imports for the quick commands, and
+loading the NID lists with and without the NIDS_CACHE_DIR cache.
+
+    python benchmarks/bench_startup.py [--repeat 7] [--budget-ms 150]
+
+Each command is started --repeat times in a fresh interpreter and the
+median wall time is reported next to a bare `python -c pass`.  The
+slowest imports come from `-X importtime`.  Exits non-zero when importing
+the CLI costs more than --budget-ms over the bare interpreter, or when it
+pulls in a module that should only load for the commands that need it.
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from aged_care_pipeline.config.global_settings import NIDS_CSV, RADS_NIDS_CSV
+from aged_care_pipeline.utils.nids import load_nids, read_nids
+
+# only `run`/`scrape` (or output formats) need these
+HEAVY = ("pandas", "pyarrow", "requests", "asyncio", "multiprocessing")
+
+
+def wall_ms(code: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def _importtime(code: str) -> list[tuple[int, int, str]]:
+    """(depth, cumulative µs, module) for each import `code` triggers."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    found = []
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            name = parts[2].rstrip()
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            found.append((depth, int(parts[1]), name.strip()))
+    return found
+
+
+def slowest_imports(code: str, n: int = 8) -> list[tuple[int, str]]:
+    """The costliest modules `code` imports, leaving out the interpreter's own."""
+    startup = {name for _, _, name in _importtime("pass")}
+    found = [
+        (us, name)
+        for depth, us, name in _importtime(code)
+        if depth == 1 and name not in startup
+    ]
+    return sorted(found, reverse=True)[:n]
+
+
+def per_call_ms(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1e3 / repeat
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=7)
+    ap.add_argument("--budget-ms", type=float, default=150)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    base = wall_ms("pass", args.repeat)
+    cli = wall_ms("import aged_care_pipeline.cli", args.repeat)
+    print(f"  {'python -c pass':30s}{base:7.1f} ms")
+    print(f"  {'import aged_care_pipeline.cli':30s}{cli - base:7.1f} ms more")
+    for us, name in slowest_imports("import aged_care_pipeline.cli"):
+        print(f"  {us / 1e3:6.1f} ms  {name}")
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, aged_care_pipeline.cli; "
+                f"print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+            ),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    print("NID lists (per load)")
+    with tempfile.TemporaryDirectory() as cache:
+        for csv_path in (NIDS_CSV, RADS_NIDS_CSV):
+            if not os.path.exists(csv_path):
+                continue
+            n = len(load_nids(csv_path, cache_dir=cache))  # fills the cache
+            csv_ms = per_call_ms(lambda p=csv_path: read_nids(p), 20)
+            cached_ms = per_call_ms(
+                lambda p=csv_path: load_nids(p, cache_dir=cache), 20
+            )
+            print(
+                f"  {os.path.basename(csv_path):24s} {n} NIDs: "
+                f"csv {csv_ms:5.2f} ms, cached {cached_ms:5.2f} ms"
+            )
+
+    failed = False
+    if cli - base > args.budget_ms:
+        print(f"over budget: {cli - base:.1f} ms > {args.budget_ms:.0f} ms")
+        failed = True
+    if loaded:
+        print(f"imported at start-up: {', '.join(loaded)}")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# benchmarks/payloads.py
+"""Synthetic provider payloads for the microbenchmarks."""
+
+from aged_care_pipeline.parsers.operations.operations_field_paths import FIELD_PATHS
+
+
+def synthetic_operations_payload(nid: int = 1, field_paths=FIELD_PATHS) -> dict:
+    """A payload with a value at every FIELD_PATHS path (lists where indexed)."""
+    root: dict = {}
+    for i, path in enumerate(field_paths.values()):
+        node = root
+        for depth, key in enumerate(path):
+            last = depth == len(path) - 1
+            if last:
+                value = nid if key == "nid" else f"value-{i}"
+            else:
+                value = [] if isinstance(path[depth + 1], int) else {}
+            if isinstance(node, list):
+                node.extend({} for _ in range(key + 1 - len(node)))
+                if last or not node[key]:
+                    node[key] = value
+            elif last:
+                node[key] = value
+            else:
+                node.setdefault(key, value)
+            node = node[key]
+    # a realistic amount of data the parser never reads
+    root["noise"] = [{"k": j, "v": "x" * 40} for j in range(50)]
+    return root
@@ -4,14 +4,15 @@
 
 import os
 
-from aged_care_pipeline.logging_config import init_logging
-from aged_care_pipeline.scrapers.rads_scraper import run_scraper
-
 from .cli import main
 
 
 def cli() -> None:
     """Entry-point for console_scripts and direct invocation."""
+    # imported here so `python -m aged_care_pipeline` (main) doesn't pay for them
+    from aged_care_pipeline.logging_config import init_logging
+    from aged_care_pipeline.scrapers.rads_scraper import run_scraper
+
     # configure logging before any work
     init_logging(
         level=os.getenv("LOG_LEVEL", "INFO"),
@@ -2,17 +2,56 @@
 import argparse
 import glob
 import importlib
-import json
+import itertools
 import logging
 import os
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 
-import pandas as pd
-
 import aged_care_pipeline.config.global_settings as gs
+from aged_care_pipeline.processors.shard_merge import (
+    ShardMerge,
+    find_parts,
+    part_name,
+)
+from aged_care_pipeline.storage.archive import (
+    ARCHIVE_SUFFIX,
+    ArchiveReader,
+    is_archive,
+    iter_archive,
+    new_archive_path,
+    write_archive,
+)
+from aged_care_pipeline.storage.fingerprints import FingerprintStore
+from aged_care_pipeline.storage.journal import (
+    RunJournal,
+    body_hash,
+    new_run_id,
+)
+from aged_care_pipeline.storage.raw_index import RawIndex
+from aged_care_pipeline.storage.raw_store import (
+    list_raw_files,
+    log_raw_stats,
+    read_raw,
+    read_raw_bytes,
+    reset_raw_stats,
+    strip_raw_suffix,
+)
+from aged_care_pipeline.storage.segment import (
+    SEGMENT_SUFFIX,
+    SegmentReader,
+    SegmentWriter,
+    segment_name,
+)
+from aged_care_pipeline.utils import codec
 from aged_care_pipeline.utils.limiter import apply_limit
 from aged_care_pipeline.utils.logger import setup_logger
-from aged_care_pipeline.writers.csv_writer import CSVWriter
+from aged_care_pipeline.utils.nids import (
+    load_nids,
+    parse_shard,
+    select_shard,
+    shard_tag,
+)
 
 # Pipeline registry: add your pipelines here
 PIPELINES = {
@@ -36,6 +75,35 @@ PIPELINES = {
     },
 }
 
+# Output formats: file extension and writer class
+WRITERS = {
+    "csv": ("csv", ("aged_care_pipeline.writers.csv_writer", "CSVWriter")),
+    "csv.gz": ("csv.gz", ("aged_care_pipeline.writers.csv_writer", "CSVWriter")),
+    "parquet": (
+        "parquet",
+        ("aged_care_pipeline.writers.parquet_writer", "ParquetWriter"),
+    ),
+    "sqlite": ("sqlite", ("aged_care_pipeline.writers.sqlite_writer", "SQLiteWriter")),
+}
+
+
+# sqlite shards upsert into the one database, so there's nothing to merge
+MERGE_FORMATS = ("csv", "csv.gz", "parquet")
+
+
+def _shard_arg(spec: str) -> tuple[int, int]:
+    try:
+        return parse_shard(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _add_shard_arg(p: argparse.ArgumentParser, help_: str) -> None:
+    p.add_argument("--shard", metavar="I/N", type=_shard_arg, help=help_)
+
+
+SHARD_HELP = "only shard I of N of the NIDs (1/4 … 4/4, by NID hash)"
+
 
 def add_subcommands(subparsers):
     # Shared verbose
@@ -47,22 +115,113 @@ def add_subcommands(subparsers):
         "run", parents=[parent], help="scrape → parse → write"
     )
     run_p.add_argument("--limit", type=int, help="only first N items")
+    run_p.add_argument(
+        "--concurrency", type=int, help="max requests in flight while scraping"
+    )
+    run_p.add_argument("--resume", metavar="RUN_ID", help="continue an interrupted run")
+    run_p.add_argument(
+        "--from-archive",
+        action="store_true",
+        default=gs.ARCHIVE_CACHE,
+        help="serve NIDs with no raw file from past cleanup archives "
+        "(operations; default: ARCHIVE_CACHE)",
+    )
+    run_p.add_argument(
+        "--workers", type=int, help="parse processes (default: PARSE_WORKERS)"
+    )
+    run_p.add_argument(
+        "--format",
+        choices=WRITERS,
+        default=gs.OUTPUT_FORMAT,
+        help="output file format (default: OUTPUT_FORMAT)",
+    )
+    run_p.add_argument(
+        "--no-diff",
+        action="store_true",
+        default=not gs.DETECT_CHANGES,
+        help="skip comparing this run with the previous one",
+    )
+    run_p.add_argument(
+        "--incremental",
+        action="store_true",
+        default=gs.INCREMENTAL,
+        help="only parse NIDs whose payload changed since the last run",
+    )
+    _add_shard_arg(run_p, SHARD_HELP + "; combine the parts with `merge`")
 
     # scrape
     scr_p = subparsers.add_parser("scrape", parents=[parent], help="only run scraper")
     scr_p.add_argument("--limit", type=int)
+    scr_p.add_argument(
+        "--concurrency", type=int, help="max requests in flight while scraping"
+    )
+    scr_p.add_argument(
+        "--resume", metavar="RUN_ID", help="continue an interrupted scrape"
+    )
+    scr_p.add_argument(
+        "--from-archive",
+        action="store_true",
+        default=gs.ARCHIVE_CACHE,
+        help="serve NIDs with no raw file from past cleanup archives "
+        "(operations; default: ARCHIVE_CACHE)",
+    )
+    _add_shard_arg(scr_p, SHARD_HELP)
 
     # parse
     par_p = subparsers.add_parser(
         "parse", parents=[parent], help="only run parser on JSON"
     )
-    par_p.add_argument("json_file", help="path to raw JSON file")
+    par_p.add_argument(
+        "json_file",
+        help="raw JSON file (.json, .json.gz or .json.zst) or a cleanup archive",
+    )
+    par_p.add_argument(
+        "--workers", type=int, help="parse processes (default: PARSE_WORKERS)"
+    )
+    par_p.add_argument(
+        "--nid",
+        type=int,
+        action="append",
+        help="only parse this NID from an indexed archive (repeatable)",
+    )
 
     # write
     wri_p = subparsers.add_parser(
         "write", parents=[parent], help="only run writer on records JSON"
     )
     wri_p.add_argument("records_file", help="path to JSON list of dicts")
+    wri_p.add_argument(
+        "--format",
+        choices=WRITERS,
+        default=gs.OUTPUT_FORMAT,
+        help="output file format (default: OUTPUT_FORMAT)",
+    )
+
+    # inspect
+    insp_p = subparsers.add_parser(
+        "inspect", parents=[parent], help="show an interim segment or one NID in it"
+    )
+    insp_p.add_argument("segment", help=f"interim segment (*{SEGMENT_SUFFIX})")
+    insp_p.add_argument("--nid", type=int, help="print this NID's parsed rows")
+
+    # merge
+    merge_p = subparsers.add_parser(
+        "merge",
+        parents=[parent],
+        help="combine a sharded run's parts into the dated output",
+    )
+    merge_p.add_argument(
+        "--date", help="run date as dd_mm_yyyy (default: today)", default=None
+    )
+    merge_p.add_argument(
+        "--format",
+        choices=MERGE_FORMATS,
+        default=gs.OUTPUT_FORMAT if gs.OUTPUT_FORMAT in MERGE_FORMATS else "csv",
+        help="format the shards were written in (default: OUTPUT_FORMAT)",
+    )
+    merge_p.add_argument(
+        "--shards", type=int, help="shard count, if parts of several are present"
+    )
 
     # cleanup
     clean_p = subparsers.add_parser(
@@ -71,60 +230,673 @@ def add_subcommands(subparsers):
     clean_p.add_argument(
         "--keep-raw", action="store_true", help="retain per-ID raw files after merging"
     )
+    _add_shard_arg(clean_p, "clean up this shard's raw/interim dirs")
 
     return parent
 
 
-def _do_cleanup(pipeline: str, raw_dir: str, interim_dir: str, keep_raw: bool):
+def _do_cleanup(
+    pipeline: str,
+    raw_dir: str,
+    interim_dir: str,
+    keep_raw: bool,
+    shard: tuple[int, int] | None = None,
+):
     """
-    Merge all per-ID raw JSONs for `pipeline`, archive them, delete
-    originals and purge interim.  `keep_raw` controls retention of
-    the individual raw files.
+    Stream all per-ID raw payloads for `pipeline` into one JSON-lines
+    archive, delete the archived originals and purge interim.  `keep_raw`
+    controls retention of the individual raw files.  A shard's archive is
+    named after it, so shards cleaning up on one host don't collide.
     """
     cleanup_logger = logging.getLogger(f"{pipeline}.cleanup")
     archive_root = os.path.join(gs.RAW_DIR, "archive", pipeline)
     os.makedirs(archive_root, exist_ok=True)
 
-    # Gather raw jsons, skipping already-merged
-    raw_paths = [
-        p
-        for p in glob.glob(f"{raw_dir}/*.json")
-        if not os.path.basename(p).startswith(f"{pipeline}_all_raw_")
-    ]
-
-    # Load and append
-    merged = []
-    for p in raw_paths:
-        try:
-            with open(p, "r", encoding="utf-8") as f:
-                merged.append(json.load(f))
-        except Exception as e:
-            cleanup_logger.warning(f"Skipping {p}: {e}")
-
-    # Write single big archive file
-    ts = datetime.now().strftime("%d_%m_%Y")
-    archive_file = os.path.join(archive_root, f"{pipeline}_all_raw_{ts}.json")
-    with open(archive_file, "w", encoding="utf-8") as f:
-        json.dump(merged, f, ensure_ascii=False, indent=2)
-    cleanup_logger.info(f"Merged {len(merged)} raw files → {archive_file}")
+    # Raw payloads (any format); archives live elsewhere and never match
+    raw_paths = list_raw_files(raw_dir)
+    archived, skipped = [], []
+    if raw_paths:
+        ts = datetime.now().strftime("%d_%m_%Y")
+        name = f"{pipeline}_{shard_tag(*shard)}" if shard else pipeline
+        archive_file = new_archive_path(archive_root, name, ts)
+        archived, skipped = write_archive(archive_file, raw_paths)
+        cleanup_logger.info(f"Archived {len(archived)} raw files → {archive_file}")
+    else:
+        cleanup_logger.info("No raw files to archive")
 
-    # Delete per-ID raw files (unless we want to keep them)
+    # Delete archived raw files (unless we want to keep them); unreadable
+    # ones stay for inspection
     if not keep_raw:
-        for p in raw_paths:
+        for p in archived:
             try:
                 os.remove(p)
             except Exception as e:
                 cleanup_logger.warning(f"Failed to delete {p}: {e}")
-        cleanup_logger.info(f"Deleted {len(raw_paths)} raw JSONs")
+        cleanup_logger.info(
+            f"Deleted {len(archived)} raw files"
+            + (f"; kept {len(skipped)} unreadable" if skipped else "")
+        )
 
-    # Purge interim JSONs
-    interim_paths = glob.glob(f"{interim_dir}/*.json")
+    # Purge interim segments (and any per-NID JSONs from older runs)
+    interim_paths = glob.glob(f"{interim_dir}/*.json") + glob.glob(
+        f"{interim_dir}/*{SEGMENT_SUFFIX}"
+    )
     for p in interim_paths:
         try:
             os.remove(p)
         except Exception as e:
             cleanup_logger.warning(f"Failed to delete interim file {p}: {e}")
-    cleanup_logger.info(f"Deleted {len(interim_paths)} interim JSONs")
+    cleanup_logger.info(f"Deleted {len(interim_paths)} interim files")
+
+
+def _pipeline_dirs(
+    pipeline: str, shard: tuple[int, int] | None = None
+) -> tuple[str, str, str]:
+    """
+    Create and return the raw, interim and output dirs for `pipeline`.  A
+    shard gets raw and interim dirs of its own, so shards running on one
+    host never clean up each other's files; outputs share the output dir.
+    """
+    sub = (shard_tag(*shard),) if shard else ()
+    dirs = (
+        os.path.join(gs.RAW_DIR, pipeline, *sub),
+        os.path.join(gs.INTERIM_DIR, pipeline, *sub),
+        os.path.join(gs.OUTPUT_DIR, pipeline),
+    )
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+    return dirs
+
+
+def _load_class(conf: dict, role: str):
+    """Dynamically import a pipeline's "scraper" or "parser" class."""
+    module, cls = conf[role]
+    return getattr(importlib.import_module(module), cls)
+
+
+def _make_writer(
+    fmt: str,
+    output_dir: str,
+    fieldnames: Iterable[str] | None = None,
+    key_columns: Iterable[str] | None = None,
+    column_types: dict[str, type] | None = None,
+):
+    """(writer, file extension) for an output format in WRITERS."""
+    ext, (module, cls) = WRITERS[fmt]
+    Writer = getattr(importlib.import_module(module), cls)
+    options = {"fieldnames": fieldnames}
+    if fmt == "sqlite" and key_columns is not None:
+        options["key_columns"] = key_columns  # upsert key per snapshot
+    if fmt == "parquet" and column_types:
+        options["column_types"] = column_types  # the declared schema
+    return Writer(output_dir=output_dir, **options), ext
+
+
+def _load_nids(conf: dict, shard: tuple[int, int] | None = None) -> list[int]:
+    """The pipeline's NIDs (just `shard`'s, if given), then LIMIT."""
+    nids = load_nids(conf["nids_csv"])
+    if shard:
+        nids = select_shard(nids, *shard)
+    return apply_limit(nids)
+
+
+def _open_journal(
+    pipeline: str,
+    cmd: str,
+    resume: str | None,
+    shard: tuple[int, int] | None = None,
+    run_id: str | None = None,
+) -> RunJournal:
+    """
+    Start a new run journal (under `run_id`, if given), or re-open
+    `resume`'s.  A shard's run ID ends in its tag, so shards started in the
+    same second don't share a journal.
+    """
+    spec = f"{shard[0]}/{shard[1]}" if shard else None
+    if resume:
+        journal = RunJournal.resume(gs.JOURNAL_DIR, pipeline, resume)
+        if journal.header.get("shard") != spec:
+            journal.close()
+            was = journal.header.get("shard") or "none"
+            raise ValueError(
+                f"run {resume} was started with --shard {was}; "
+                "resume it with the same --shard"
+            )
+        return journal
+    if shard:
+        journal = RunJournal.start(
+            gs.JOURNAL_DIR,
+            pipeline,
+            run_id=f"{run_id or new_run_id()}_{shard_tag(*shard)}",
+            cmd=cmd,
+            shard=spec,
+        )
+    else:
+        journal = RunJournal.start(gs.JOURNAL_DIR, pipeline, run_id=run_id, cmd=cmd)
+    logging.getLogger(pipeline).info(
+        f"Run ID {journal.run_id} (continue with --resume {journal.run_id})"
+    )
+    return journal
+
+
+def _interim_path(journal: RunJournal | None, nid: int) -> str | None:
+    """Interim file an earlier attempt of this run parsed `nid` into, if any."""
+    if journal is None:
+        return None
+    entry = journal.state_of(nid)
+    path = entry.get("path")
+    if entry.get("state") not in ("parsed", "written") or not path:
+        return None
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None
+    if "offset" in entry and entry["offset"] + entry["length"] > size:
+        return None  # journaled, but its segment batch never reached disk
+    return path
+
+
+def _read_interim(journal: RunJournal, nid: int) -> list[dict]:
+    """Rows an earlier attempt parsed `nid` into (segment record or file)."""
+    entry = journal.state_of(nid)
+    if "offset" in entry:
+        _, rows = SegmentReader(entry["path"]).read_at(entry["offset"], entry["length"])
+        return rows
+    with open(entry["path"], "rb") as f:  # one file per NID
+        return codec.loads(f.read())
+
+
+class _JournaledFetch:
+    """
+    Per-NID fetch for a journaled run: a payload the journal already has on
+    disk (and whose file still matches the recorded hash) is read back
+    instead of re-requested; every new fetch is checkpointed as it lands.
+    Bodies are journaled by a hash of their bytes and decoded once for the
+    parser, or, with `lazy`, returned undecoded.
+    """
+
+    def __init__(
+        self,
+        scraper,
+        journal: RunJournal,
+        raw_dir: str,
+        prefix: str,
+        lazy: bool = False,
+    ):
+        self.scraper = scraper
+        self.journal = journal
+        self.index = RawIndex(raw_dir, prefix=prefix)
+        self.lazy = lazy
+        self.logger = logging.getLogger(prefix)
+        self.reused = 0
+
+    def _resumed(self, nid: int) -> bytes | None:
+        sha = self.journal.state_of(nid).get("body_sha256")
+        path = self.index.lookup(nid) if sha else None
+        if path is None:
+            return None
+        try:
+            blob = read_raw_bytes(path)
+        except (OSError, ValueError):
+            return None
+        return blob if body_hash(blob) == sha else None
+
+    def body(self, nid: int) -> bytes | None:
+        """`nid`'s body: read back if journaled, else fetched and journaled."""
+        body = self._resumed(nid)
+        if body is not None:
+            self.reused += 1
+            return body
+        body = self.scraper._scrape_raw_or_none(nid)
+        if body is not None:
+            self.journal.record(
+                nid, "fetched", body_sha256=body_hash(body), bytes=len(body)
+            )
+        return body
+
+    def adopt(self, nid: int, body: bytes) -> None:
+        """Save and journal `body`, fetched by another pipeline, as `nid`'s."""
+        self.scraper.save_raw(nid, body)
+        self.journal.record(
+            nid, "fetched", body_sha256=body_hash(body), bytes=len(body), shared=True
+        )
+
+    def decode(self, nid: int, body: bytes | None) -> dict | None:
+        if body is None:
+            return None
+        try:
+            return codec.loads(body)  # the one decode, for the parser
+        except ValueError as e:
+            self.logger.warning(f"[Scraper] NID {nid}: unreadable payload: {e}")
+            return None
+
+    def __call__(self, nid: int) -> dict | bytes | None:
+        body = self.body(nid)
+        return body if self.lazy else self.decode(nid, body)
+
+
+def _journaled_bulk(
+    scraper,
+    nids: list[int],
+    journal: RunJournal,
+    raw_dir: str,
+    prefix: str,
+    concurrency: int | None = None,
+    lazy: bool = False,
+) -> list[dict | bytes | None]:
+    """
+    Like scraper.bulk(), but resuming from / checkpointing to `journal`;
+    `lazy` stores and returns bodies undecoded (see _JournaledFetch).
+    """
+    from aged_care_pipeline.utils.async_engine import run_ordered
+
+    fetch = _JournaledFetch(scraper, journal, raw_dir, prefix, lazy=lazy)
+    concurrency = concurrency or gs.SCRAPE_CONCURRENCY
+    logging.getLogger(prefix).info(
+        f"[Scraper] Bulk scraping {len(nids)} NIDs (concurrency={concurrency})"
+    )
+    payloads = run_ordered(fetch, nids, concurrency)
+    if fetch.reused:
+        logging.getLogger(prefix).info(
+            f"Resume: {fetch.reused} NIDs already fetched were read from disk"
+        )
+    return payloads
+
+
+def _interim_saver(
+    pipeline: str,
+    conf: dict,
+    total: int,
+    segment: SegmentWriter,
+    journal: RunJournal | None = None,
+    done: set[int] | None = None,
+    store: FingerprintStore | None = None,
+    unchanged: set[int] | None = None,
+) -> Callable[[int, dict | None, list[dict]], list[dict]]:
+    """
+    Finish step of `run`'s parse stage: append each NID's parsed rows to
+    the run's interim `segment` (and journal where they went) in NID order,
+    as they come out of the ParseExecutor.  NIDs in `done` (already parsed
+    by an interrupted attempt) are read back from the interim instead; NIDs in
+    `unchanged` (incremental runs) get their rows from `store`, which also
+    stages every other NID's rows under its payload hash.
+    """
+    logger = logging.getLogger(pipeline)
+    done = done or set()
+    unchanged = unchanged if unchanged is not None else set()
+    counter = itertools.count(1)
+
+    def finish(nid: int, raw: dict | None, rows: list[dict]) -> list[dict]:
+        idx = next(counter)
+        if nid in unchanged:
+            logger.debug(f"[{idx}/{total}] {nid} unchanged since the last run")
+            return store.rows(nid)
+
+        if nid in done:
+            logger.debug(f"[{idx}/{total}] {nid} already parsed")
+            rows = _read_interim(journal, nid)
+        else:
+            # save interim
+            offset, length = segment.append(nid, rows)
+            logger.info(f"[{idx}/{total}] Parsed {nid} → {segment.path}@{offset}")
+            if journal is not None and raw is not None:
+                journal.record(
+                    nid,
+                    "parsed",
+                    path=str(segment.path),
+                    offset=offset,
+                    length=length,
+                    rows=len(rows),
+                )
+
+        if store is not None and journal is not None:
+            sha = journal.state_of(nid).get("body_sha256")
+            if sha:
+                store.stage(nid, sha, rows)
+        return rows
+
+    return finish
+
+
+def _write_rows(
+    pipeline: str,
+    conf: dict,
+    nids: list[int],
+    parsed: Iterable[tuple[int, list[dict]]],
+    output_dir: str,
+    journal: RunJournal | None = None,
+    fmt: str = "csv",
+    fieldnames: Iterable[str] | None = None,
+    key_columns: Iterable[str] | None = None,
+    column_types: dict[str, type] | None = None,
+    detect_changes: bool = False,
+    shard: tuple[int, int] | None = None,
+) -> None:
+    """
+    Write stage of `run`: log field completeness for each NID's rows as they
+    stream in, write them straight to the dated output file (CSV or another
+    format in WRITERS, with `fieldnames` as its header; formats that key or
+    type their columns also get `key_columns` and `column_types`) and report
+    NID coverage.  With `detect_changes`, rows are also hashed on the way
+    through and compared with the previous run
+    (processors.change_detector); a LIMITed run, or
+    one where NIDs returned nothing, only compares the NIDs it wrote.  A
+    `shard` writes its part of the output (see processors.shard_merge) and
+    skips change detection, which compares whole runs.
+    """
+    logger = logging.getLogger(pipeline)
+    if shard and detect_changes:
+        logger.info("Sharded run: change detection is skipped")
+        detect_changes = False
+
+    # — Validation state —
+    expected_nids = set(nids)
+    scraped_nids = set()
+
+    # We'll discover expected_fields dynamically on first non-empty row.
+    expected_fields = None
+
+    def validated_rows() -> Iterator[dict]:
+        nonlocal expected_fields
+        for nid, rows in parsed:
+            # track NID coverage
+            if not rows:
+                logger.warning(f"NID {nid} returned no data; skipping")
+                continue
+            scraped_nids.add(nid)
+
+            # On the very first parsed row, grab its field‐count
+            if expected_fields is None:
+                expected_fields = len(rows[0].keys())
+                logger.debug(f"Detected {expected_fields} total fields per row")
+
+            # For each row (usually one per NID) compute completeness
+            for row in rows:
+                present = sum(1 for v in row.values() if v not in (None, "", [], {}))
+                missing = expected_fields - present
+                pct_miss = missing / expected_fields * 100
+
+                tag = "COMPLETE" if missing == 0 else "INCOMPLETE"
+                level = logging.DEBUG if missing == 0 else logging.WARNING
+                logger.log(
+                    level,
+                    f"[{tag}] NID {nid}: "
+                    f"{present}/{expected_fields} fields present, "
+                    f"{missing} missing ({pct_miss:.1f}%)",
+                )
+            yield from rows
+
+    rows = validated_rows()
+    detector = None
+    if detect_changes:
+        from aged_care_pipeline.processors.change_detector import ChangeDetector
+
+        detector = ChangeDetector(
+            os.path.join(gs.CHANGES_DIR, pipeline),
+            key_columns=key_columns or ("nid",),
+            columns=fieldnames,
+        )
+        rows = detector.observe(rows)
+
+    # write output as rows arrive
+    writer, ext = _make_writer(fmt, output_dir, fieldnames, key_columns, column_types)
+    ts = datetime.now().strftime("%d_%m_%Y")
+    if shard:
+        ofile = part_name(conf["prefix"], ts, ext, *shard)
+    else:
+        ofile = f"{conf['prefix']}_{ts}.{ext}"
+    writer.write(rows, ofile)
+
+    total_expected = len(expected_nids)
+    total_seen = len(scraped_nids)
+    missed_nids = expected_nids - scraped_nids
+    pct_covered = total_seen / total_expected * 100 if total_expected else 0.0
+
+    logger.info(
+        f"NID coverage: {total_seen}/{total_expected} "
+        f"({pct_covered:.1f}%) scraped; "
+        f"{len(missed_nids)} missing: {sorted(missed_nids)}"
+    )
+    logger.info(f"Wrote {ext.upper()} → {writer.location(ofile)}")
+    if detector is not None:
+        partial = bool(missed_nids) or os.getenv("LIMIT", "").strip().isdigit()
+        detector.finish(ts, covered=scraped_nids if partial else None)
+    if journal is not None:
+        journal.record_many(sorted(scraped_nids), "written")
+
+
+def _log_shard_coverage(logger: logging.Logger, merge: ShardMerge) -> None:
+    """Log each shard's NID coverage after `merge`, then the overall figure."""
+    written = expected = 0
+    for cov in merge.coverage():
+        label = f"Shard {cov['shard']}/{merge.count}"
+        written += cov["written"]
+        expected += cov["expected"]
+        if cov["path"] is None:
+            logger.warning(f"{label}: no part written; {cov['expected']} NIDs missing")
+            continue
+        pct = cov["written"] / cov["expected"] * 100 if cov["expected"] else 100.0
+        logger.info(
+            f"{label}: {cov['written']}/{cov['expected']} NIDs ({pct:.1f}%) "
+            f"from {os.path.basename(cov['path'])}"
+        )
+        if cov["missing"]:
+            logger.warning(f"{label}: missing {cov['missing']}")
+        if cov["stray"]:
+            logger.warning(
+                f"{label}: holds NIDs of other shards (was it run with another "
+                f"NID list or shard count?): {cov['stray']}"
+            )
+    pct = written / expected * 100 if expected else 0.0
+    logger.info(
+        f"NID coverage: {written}/{expected} ({pct:.1f}%) across "
+        f"{len(merge.parts)}/{merge.count} shards; {merge.rows_written} rows"
+    )
+
+
+def _stream_run(
+    pipeline: str,
+    conf: dict,
+    Parser,
+    nids: list[int],
+    journal: RunJournal,
+    fetch: Callable[[int], bytes | None],
+    decode: Callable[[int, bytes | None], dict | None],
+    dirs: tuple[str, str, str],
+    args,
+    shard: tuple[int, int] | None = None,
+) -> None:
+    """
+    Parse and write half of `run` for one pipeline: stream the bodies
+    `fetch` journals, once `decode`d, through the parser into the dated
+    output, journaling as it goes, then mark the run complete and clean up.
+    """
+    from aged_care_pipeline.parsers.executor import ParseExecutor
+    from aged_care_pipeline.services.streaming import StreamingPipeline
+
+    logger = logging.getLogger(pipeline)
+    raw_dir, interim_dir, output_dir = dirs
+
+    # NIDs an interrupted attempt already parsed aren't fetched again
+    done = {n for n in nids if _interim_path(journal, n)}
+
+    # incremental: a body whose hash matches the last successful run isn't
+    # decoded or parsed; its stored rows are carried forward
+    store = None
+    if getattr(args, "incremental", False):
+        store = FingerprintStore.open(gs.STATE_DIR, pipeline, schema=Parser.schema_id())
+        logger.info(f"Incremental: {len(store)} NIDs fingerprinted")
+    unchanged: set[int] = set()
+
+    def fetch_new(nid: int) -> dict | None:
+        if nid in done:
+            return None
+        body = fetch(nid)
+        # compared by the hash fetch journaled, before any decoding
+        if (
+            store is not None
+            and body is not None
+            and store.unchanged(nid, journal.state_of(nid).get("body_sha256"))
+        ):
+            unchanged.add(nid)
+            return None
+        return decode(nid, body)
+
+    executor = ParseExecutor(Parser(), workers=args.workers)
+    segment = SegmentWriter(
+        os.path.join(interim_dir, segment_name(conf["prefix"], journal.run_id))
+    )
+    stream = StreamingPipeline(
+        fetch=fetch_new,
+        executor=executor,
+        finish=_interim_saver(
+            pipeline,
+            conf,
+            len(nids),
+            segment,
+            journal=journal,
+            done=done,
+            store=store,
+            unchanged=unchanged,
+        ),
+        concurrency=args.concurrency,
+    )
+    if done:
+        logger.info(f"Resume: {len(done)} NIDs already parsed")
+    try:
+        _write_rows(
+            pipeline,
+            conf,
+            nids,
+            stream.run(nids),
+            output_dir,
+            journal=journal,
+            fmt=args.format,
+            fieldnames=Parser.columns,
+            key_columns=Parser.key_columns,
+            column_types=Parser.column_types,
+            detect_changes=not args.no_diff,
+            shard=shard,
+        )
+        if store is not None:
+            store.commit(journal.run_id)
+    finally:
+        executor.close()
+        segment.close()
+        if store is not None:
+            store.close()
+    executor.log_stats()
+    journal.mark_complete()
+    journal.close()
+
+    # now automatically clean up raw+interim
+    _do_cleanup(
+        pipeline=pipeline,
+        raw_dir=raw_dir,
+        interim_dir=interim_dir,
+        keep_raw=False,
+        shard=shard,
+    )
+
+
+def _run_all(args) -> None:
+    """
+    `all run` / `all scrape`: every registered pipeline under one run ID.
+    Each pipeline keeps its own journal (so `--resume` works as for one
+    pipeline) and raw files; a SharedFetcher fetches NIDs several pipelines
+    want once they're shown to get identical bodies.  `run` streams the
+    pipelines side by side through _stream_run, so a shared NID is fetched
+    once for all of them.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aged_care_pipeline.scrapers.shared_fetch import SharedFetcher
+    from aged_care_pipeline.utils.async_engine import run_ordered
+    from aged_care_pipeline.utils.request_handler import (
+        log_http_stats,
+        reset_http_state,
+    )
+
+    if args.limit is not None:
+        os.environ["LIMIT"] = str(args.limit)
+    reset_http_state()
+    reset_raw_stats()
+
+    run_id = args.resume or new_run_id()
+    jobs = {}
+    for name, conf in PIPELINES.items():
+        journal = _open_journal(name, args.cmd, args.resume, args.shard, run_id)
+        if journal.complete:
+            logging.getLogger(name).info(
+                f"Run {journal.run_id} already completed; nothing to resume"
+            )
+            journal.close()
+            continue
+        dirs = _pipeline_dirs(name, args.shard)
+        scraper = _load_class(conf, "scraper")(raw_dir=dirs[0])
+        jobs[name] = {
+            "conf": conf,
+            "journal": journal,
+            "dirs": dirs,
+            "nids": _load_nids(conf, args.shard),
+            "fetch": _JournaledFetch(scraper, journal, dirs[0], conf["prefix"]),
+        }
+    # a NID an interrupted attempt already parsed isn't fetched for that
+    # pipeline again (see _stream_run), so it isn't shared with it either
+    wanted = {
+        name: [n for n in job["nids"] if not _interim_path(job["journal"], n)]
+        for name, job in jobs.items()
+    }
+    concurrency = args.concurrency or gs.SCRAPE_CONCURRENCY
+    fetcher = SharedFetcher(
+        {name: (job["fetch"], wanted[name]) for name, job in jobs.items()},
+        concurrency=concurrency,
+    )
+
+    if args.cmd == "scrape":
+        union = fetcher.union()
+        logging.getLogger("all").info(
+            f"[Scraper] Scraping {len(union)} NIDs for {', '.join(jobs)} "
+            f"(concurrency={concurrency})"
+        )
+
+        def scrape(nid: int) -> None:
+            fetcher.fetch(nid)  # bodies are on disk; don't hold them here
+
+        run_ordered(scrape, union, concurrency)
+        for job in jobs.values():
+            job["journal"].mark_complete()
+            job["journal"].close()
+    elif jobs:
+        # the fetcher caps requests in flight across every stream
+        with ThreadPoolExecutor(len(jobs), thread_name_prefix="all") as pool:
+            runs = []
+            for name, job in jobs.items():
+                runs.append(
+                    pool.submit(
+                        _stream_run,
+                        name,
+                        job["conf"],
+                        _load_class(job["conf"], "parser"),
+                        job["nids"],
+                        job["journal"],
+                        fetcher.source(name),
+                        job["fetch"].decode,
+                        job["dirs"],
+                        args,
+                        shard=args.shard,
+                    )
+                )
+            for run in runs:
+                run.result()
+    for name, job in jobs.items():
+        if job["fetch"].reused:
+            logging.getLogger(name).info(
+                f"Resume: {job['fetch'].reused} fetched NIDs were read from disk"
+            )
+    fetcher.log_stats()
+    log_http_stats()
+    log_raw_stats()
 
 
 def main():
@@ -139,7 +911,50 @@ def main():
         sub = p.add_subparsers(dest="cmd", required=True)
         add_subcommands(sub)
 
+    # every pipeline in one pass over their NIDs
+    all_p = pipe_sp.add_parser(
+        "all",
+        help="run every pipeline in one pass, fetching shared NIDs once "
+        "when their responses match",
+    )
+    all_sub = all_p.add_subparsers(dest="cmd", required=True)
+    for cmd, help_ in (("run", "scrape → parse → write"), ("scrape", "only scrape")):
+        cmd_p = all_sub.add_parser(cmd, help=help_)
+        cmd_p.add_argument("-v", "--verbose", action="store_true", help="DEBUG logs")
+        cmd_p.add_argument("--limit", type=int, help="only first N items")
+        cmd_p.add_argument(
+            "--concurrency", type=int, help="max requests in flight while scraping"
+        )
+        cmd_p.add_argument(
+            "--resume", metavar="RUN_ID", help="continue an interrupted run"
+        )
+        _add_shard_arg(cmd_p, SHARD_HELP)
+        if cmd == "run":
+            cmd_p.add_argument(
+                "--workers", type=int, help="parse processes (default: PARSE_WORKERS)"
+            )
+            cmd_p.add_argument(
+                "--format",
+                choices=WRITERS,
+                default=gs.OUTPUT_FORMAT,
+                help="output file format (default: OUTPUT_FORMAT)",
+            )
+            cmd_p.add_argument(
+                "--no-diff",
+                action="store_true",
+                default=not gs.DETECT_CHANGES,
+                help="skip comparing this run with the previous one",
+            )
+
     args = parser.parse_args()
+    if getattr(args, "format", None) == "parquet":
+        # fail before any journal, directory or request exists
+        from aged_care_pipeline.writers.parquet_writer import require_pyarrow
+
+        try:
+            require_pyarrow()
+        except RuntimeError as e:
+            parser.error(str(e))
 
     # configure logging
     if getattr(args, "verbose", False):
@@ -148,6 +963,10 @@ def main():
     setup_logger()
     logger = logging.getLogger(f"{args.pipeline}")
 
+    if args.pipeline == "all":
+        _run_all(args)
+        return
+
     # pipeline config
     if args.pipeline not in PIPELINES:
         logger.error(f"Unknown pipeline: {args.pipeline}")
@@ -155,194 +974,181 @@ def main():
     conf = PIPELINES[args.pipeline]
 
     # prepare dirs
-    raw_dir = os.path.join(gs.RAW_DIR, args.pipeline)
-    interim_dir = os.path.join(gs.INTERIM_DIR, args.pipeline)
-    output_dir = os.path.join(gs.OUTPUT_DIR, args.pipeline)
-    os.makedirs(raw_dir, exist_ok=True)
-    os.makedirs(interim_dir, exist_ok=True)
-    os.makedirs(output_dir, exist_ok=True)
-
-    # dynamic import
-    mod_scr, cls_scr = conf["scraper"]
-    mod_par, cls_par = conf["parser"]
-    Scraper = getattr(importlib.import_module(mod_scr), cls_scr)
-    Parser = getattr(importlib.import_module(mod_par), cls_par)
+    shard = getattr(args, "shard", None)
+    raw_dir, interim_dir, output_dir = _pipeline_dirs(args.pipeline, shard)
+
+    # dynamic import: only what the command needs, so quick commands
+    # (parse, inspect, cleanup) don't load the HTTP stack
+    Scraper = Parser = None
+    if args.cmd in ("run", "scrape"):
+        Scraper = _load_class(conf, "scraper")
+    if args.cmd in ("run", "parse", "write", "merge"):
+        Parser = _load_class(conf, "parser")
 
     # run commands
-    if args.cmd == "run":
+    if args.cmd in ("run", "scrape"):
+        from aged_care_pipeline.utils.request_handler import (
+            log_http_stats,
+            reset_http_state,
+        )
+
+        reset_http_state()
+        reset_raw_stats()
         if args.limit is not None:
             os.environ["LIMIT"] = str(args.limit)
+        if args.from_archive:
+            os.environ["ARCHIVE_CACHE"] = "1"
 
-        df = pd.read_csv(conf["nids_csv"])
-        nids = df.nid.dropna().astype(int).tolist()
-        nids = apply_limit(nids)
+    if args.cmd in ("run", "scrape"):
+        journal = _open_journal(args.pipeline, args.cmd, args.resume, shard)
+        if journal.complete:
+            logger.info(f"Run {journal.run_id} already completed; nothing to resume")
+            journal.close()
+            return
 
+    if args.cmd == "run":
+        nids = _load_nids(conf, shard)
+        if shard:
+            logger.info(f"Shard {shard[0]}/{shard[1]}: {len(nids)} NIDs")
         scraper = Scraper(raw_dir=raw_dir)
-        parser_ = Parser()
-        all_rows = []
-
-        # — Validation state —
-        expected_nids = set(nids)
-        scraped_nids = set()
-
-        # We'll discover expected_fields dynamically on first non-empty row.
-        expected_fields = None
-
-        for idx, nid in enumerate(nids, start=1):
-            logger.info(f"[{idx}/{len(nids)}] Scraping {nid}")
-            raw = scraper.scrape(nid)
-
-            logger.info(f"[{idx}/{len(nids)}] Parsing {nid}")
-            rows = parser_.parse(raw)
-
-            # save interim
-            ts = datetime.now().strftime("%d_%m_%Y")
-            fname = f"{conf['prefix']}_{nid}_{ts}_parsed.json"
-            ipath = os.path.join(interim_dir, fname)
-            with open(ipath, "w", encoding="utf-8") as wf:
-                json.dump(rows, wf, ensure_ascii=False, indent=2)
-            logger.info(f"Parsed → {ipath}")
-            parsed = parser_.parse(raw)
-
-            # track NID coverage
-            if parsed:
-                scraped_nids.add(nid)
-
-                # On the very first parsed row, grab its field‐count
-                if expected_fields is None:
-                    expected_fields = len(parsed[0].keys())
-                    logger.debug(f"Detected {expected_fields} total fields per row")
-
-                # For each row (usually one per NID) compute completeness
-                for row in parsed:
-                    present = sum(
-                        1 for v in row.values() if v not in (None, "", [], {})
-                    )
-                    missing = expected_fields - present
-                    pct_miss = missing / expected_fields * 100
-
-                    tag = "COMPLETE" if missing == 0 else "INCOMPLETE"
-                    level = logging.DEBUG if missing == 0 else logging.WARNING
-                    logger.log(
-                        level,
-                        f"[{tag}] NID {nid}: "
-                        f"{present}/{expected_fields} fields present, "
-                        f"{missing} missing ({pct_miss:.1f}%)",
-                    )
-
-                all_rows.extend(parsed)
-            else:
-                logger.warning(f"NID {nid} returned no data; skipping")
-
-        # write CSV
-        ts = datetime.now().strftime("%d_%m_%Y")
-        ofile = f"{conf['prefix']}_{ts}.csv"
-        CSVWriter(output_dir=output_dir).write(all_rows, ofile)
-        total_expected = len(expected_nids)
-        total_seen = len(scraped_nids)
-        missed_nids = expected_nids - scraped_nids
-        pct_covered = total_seen / total_expected * 100
-
-        logger.info(
-            f"NID coverage: {total_seen}/{total_expected} "
-            f"({pct_covered:.1f}%) scraped; "
-            f"{len(missed_nids)} missing: {sorted(missed_nids)}"
-        )
-
-        # finally, write your CSV
-        CSVWriter(output_dir=output_dir).write(all_rows, ofile)
-        logger.info(f"Wrote CSV → {os.path.join(output_dir, ofile)}")
-
-        # now automatically clean up raw+interim
-        _do_cleanup(
-            pipeline=args.pipeline,
-            raw_dir=raw_dir,
-            interim_dir=interim_dir,
-            keep_raw=False,
+        fetch = _JournaledFetch(scraper, journal, raw_dir, conf["prefix"])
+        _stream_run(
+            args.pipeline,
+            conf,
+            Parser,
+            nids,
+            journal,
+            fetch.body,
+            fetch.decode,
+            (raw_dir, interim_dir, output_dir),
+            args,
+            shard=shard,
         )
+        if fetch.reused:
+            logger.info(f"Resume: {fetch.reused} fetched NIDs were read from disk")
+        log_http_stats()
+        log_raw_stats()
 
     elif args.cmd == "scrape":
-        if args.limit is not None:
-            os.environ["LIMIT"] = str(args.limit)
-        df = pd.read_csv(conf["nids_csv"])
-        nids = apply_limit(df.nid.dropna().astype(int).tolist())
-        Scraper(raw_dir=raw_dir).bulk(nids)
+        nids = _load_nids(conf, shard)
+        _journaled_bulk(
+            Scraper(raw_dir=raw_dir),
+            nids,
+            journal,
+            raw_dir,
+            conf["prefix"],
+            concurrency=args.concurrency,
+            lazy=True,  # nothing is parsed: store the bodies as received
+        )
+        log_http_stats()
+        log_raw_stats()
+        journal.mark_complete()
+        journal.close()
 
     elif args.cmd == "parse":
-        with open(args.json_file, encoding="utf-8") as f:
-            raw = json.load(f)
-        rows = Parser().parse(raw)
+        from aged_care_pipeline.parsers.executor import ParseExecutor
+
+        if args.nid:
+            # seek straight to the NIDs through the archive's index
+            try:
+                with ArchiveReader(args.json_file) as reader:
+                    found = reader.get_many(args.nid)
+            except (FileNotFoundError, ValueError) as e:
+                parser.error(f"--nid needs a cleanup archive with its index: {e}")
+            missing = sorted(set(args.nid) - found.keys())
+            if missing:
+                logger.warning(f"NIDs not in {args.json_file}: {missing}")
+            raw = [found[n] for n in dict.fromkeys(args.nid) if n in found]
+        elif is_archive(args.json_file):
+            raw = iter_archive(args.json_file)  # streamed, one payload per NID
+        else:
+            raw = read_raw(args.json_file)
+        if isinstance(raw, dict):
+            rows = Parser().parse(raw)
+        else:
+            # a merged archive: one payload per NID
+            rows = []
+            with ParseExecutor(Parser(), workers=args.workers) as executor:
+                for _, parsed in executor.imap(raw):
+                    rows.extend(parsed)
+                executor.log_stats()
         logger.info(f"Parsed {len(rows)} rows from {args.json_file}")
-        base = os.path.splitext(os.path.basename(args.json_file))[0]
+        base = os.path.basename(args.json_file).removesuffix(ARCHIVE_SUFFIX)
+        base = strip_raw_suffix(base)
         out = f"{base}_parsed.json"
-        with open(os.path.join(interim_dir, out), "w", encoding="utf-8") as wf:
-            json.dump(rows, wf, ensure_ascii=False, indent=2)
+        with open(os.path.join(interim_dir, out), "wb") as wf:
+            wf.write(codec.dumps(rows, pretty=True))
         logger.info(f"Saved → {os.path.join(interim_dir, out)}")
 
     elif args.cmd == "write":
-        with open(args.records_file, encoding="utf-8") as f:
-            records = json.load(f)
-        fname = os.path.basename(args.records_file).replace(".json", ".csv")
-        CSVWriter(output_dir=output_dir).write(records, fname)
-        logger.info(f"Wrote CSV → {os.path.join(output_dir, fname)}")
+        with open(args.records_file, "rb") as f:
+            records = codec.loads(f.read())
+        # records are all in memory: the header covers every key
+        fieldnames = list(dict.fromkeys(k for r in records for k in r))
+        writer, ext = _make_writer(
+            args.format,
+            output_dir,
+            fieldnames,
+            Parser.key_columns,
+            Parser.column_types,
+        )
+        fname = os.path.basename(args.records_file).replace(".json", f".{ext}")
+        writer.write(records, fname)
+        logger.info(f"Wrote {ext.upper()} → {writer.location(fname)}")
+
+    elif args.cmd == "inspect":
+        reader = SegmentReader(args.segment)
+        if args.nid is None:
+            print(codec.dumps(reader.summary(), pretty=True).decode("utf-8"))
+        else:
+            rows = reader.rows(args.nid)
+            if rows is None:
+                logger.error(f"NID {args.nid} is not in {args.segment}")
+                return
+            print(codec.dumps(rows, pretty=True).decode("utf-8"))
+
+    elif args.cmd == "merge":
+        stamp = args.date or datetime.now().strftime("%d_%m_%Y")
+        ext = WRITERS[args.format][0]
+        by_count = find_parts(output_dir, conf["prefix"], stamp, ext)
+        if args.shards is not None:
+            by_count = {args.shards: by_count.get(args.shards, {})}
+        if not any(by_count.values()):
+            logger.error(f"No shard parts for {stamp} ({ext}) in {output_dir}")
+            return
+        if len(by_count) > 1:
+            logger.error(
+                f"Parts of {sorted(by_count)}-way runs for {stamp}; pick one "
+                "with --shards"
+            )
+            return
+        ((count, parts),) = by_count.items()
+        merge = ShardMerge(parts, count, load_nids(conf["nids_csv"]))
+        writer, ext = _make_writer(
+            args.format,
+            output_dir,
+            Parser.columns,
+            Parser.key_columns,
+            Parser.column_types,
+        )
+        ofile = f"{conf['prefix']}_{stamp}.{ext}"
+        writer.write(merge.rows(), ofile)
+
+        _log_shard_coverage(logger, merge)
+        logger.info(f"Wrote {ext.upper()} → {writer.location(ofile)}")
 
     elif args.cmd == "cleanup":
         # allow DEBUG if requested
         if getattr(args, "verbose", False):
             os.environ["LOG_LEVEL"] = "DEBUG"
             setup_logger()
-        cleanup_logger = logging.getLogger(f"{args.pipeline}.cleanup")
-
-        # A) Prepare pipeline‐specific archive dir
-        archive_root = os.path.join(gs.RAW_DIR, "archive", args.pipeline)
-        os.makedirs(archive_root, exist_ok=True)
-
-        # B) Find all per‐NID raw JSONs for this pipeline
-        raw_paths = [
-            p
-            for p in glob.glob(f"{raw_dir}/*.json")
-            if not os.path.basename(p).startswith("all_raw_")
-        ]
-
-        # C) Load & append each JSON object
-        merged = []
-        for p in raw_paths:
-            try:
-                with open(p, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                merged.append(data)  # <<< append the dict, not extend!
-            except Exception as e:
-                cleanup_logger.warning(f"Skipping {p}: {e}")
-
-        # D) Write out one big archive file
-        timestamp = datetime.now().strftime("%d_%m_%Y")
-        # put merged files in data/raw/archive/<pipeline>/
-        archive_root = os.path.join(gs.RAW_DIR, "archive", args.pipeline)
-        os.makedirs(archive_root, exist_ok=True)
-        archive_file = os.path.join(
-            archive_root, f"{args.pipeline}_all_raw_{timestamp}.json"
+        _do_cleanup(
+            pipeline=args.pipeline,
+            raw_dir=raw_dir,
+            interim_dir=interim_dir,
+            keep_raw=args.keep_raw,
+            shard=shard,
         )
-        with open(archive_file, "w", encoding="utf-8") as f:
-            json.dump(merged, f, ensure_ascii=False, indent=2)
-        cleanup_logger.info(f"Merged {len(merged)} files into {archive_file}")
-
-        # E) Delete originals (unless user asked to keep them)
-        if not args.keep_raw:
-            for p in raw_paths:
-                try:
-                    os.remove(p)
-                except Exception as e:
-                    cleanup_logger.warning(f"Failed to delete {p}: {e}")
-            cleanup_logger.info(f"Deleted {len(raw_paths)} individual raw JSONs")
-
-        # F) Purge all interim JSONs
-        interim_paths = glob.glob(f"{interim_dir}/*.json")
-        for p in interim_paths:
-            try:
-                os.remove(p)
-            except Exception as e:
-                cleanup_logger.warning(f"Failed to delete interim file {p}: {e}")
-        cleanup_logger.info(f"Deleted {len(interim_paths)} interim JSONs")
 
 
 if __name__ == "__main__":
@@ -50,6 +50,10 @@ RAW_DIR = Path(os.getenv("RAW_DIR", DATA_ROOT / "raw"))
 INTERIM_DIR = Path(os.getenv("INTERIM_DIR", DATA_ROOT / "interim"))
 OUTPUT_DIR = Path(os.getenv("OUTPUT_DIR", DATA_ROOT / "processed"))
 LOG_DIR = Path(os.getenv("LOG_DIR", DATA_ROOT / "logs"))
+CACHE_DIR = Path(os.getenv("CACHE_DIR", DATA_ROOT / "cache"))
+JOURNAL_DIR = Path(os.getenv("JOURNAL_DIR", DATA_ROOT / "journal"))
+CHANGES_DIR = Path(os.getenv("CHANGES_DIR", DATA_ROOT / "changes"))
+STATE_DIR = Path(os.getenv("STATE_DIR", DATA_ROOT / "state"))
 
 # convenient per-pipeline dirs (used by the scrapers & CLI)
 OPERATIONS_RAW_DIR = RAW_DIR / "operations"
@@ -58,6 +62,67 @@ OPERATIONS_INTERIM_DIR = INTERIM_DIR / "operations"
 RADS_RAW_DIR = RAW_DIR / "rads"
 RADS_INTERIM_DIR = INTERIM_DIR / "rads"
 
+# JSON codec for payloads, interim, archives and journals: "auto" (orjson,
+# then msgspec, then the stdlib), or one of "orjson", "msgspec", "json"
+JSON_CODEC = os.getenv("JSON_CODEC", "auto")
+
+# raw payload files: "json" (compact), "gzip" or "zstd" (needs `zstandard`);
+# the level applies to whichever compressor is chosen
+RAW_FORMAT = os.getenv("RAW_FORMAT", "json")
+RAW_COMPRESSION_LEVEL = int(os.getenv("RAW_COMPRESSION_LEVEL", "6"))
+
+# cleanup archives (RAW_DIR/archive/<pipeline>/*.jsonl.gz): gzip level,
+# threads reading raw files ahead of the compressor and the uncompressed size
+# of each separately indexed gzip block (smaller = cheaper single-NID reads,
+# larger = better compression)
+ARCHIVE_COMPRESSION_LEVEL = int(os.getenv("ARCHIVE_COMPRESSION_LEVEL", "6"))
+ARCHIVE_READERS = int(os.getenv("ARCHIVE_READERS", "4"))
+ARCHIVE_BLOCK_SIZE = int(os.getenv("ARCHIVE_BLOCK_SIZE", str(256 << 10)))
+# the operations scraper also serves NIDs from those archives when no raw
+# file is cached (CLI: --from-archive)
+ARCHIVE_CACHE = os.getenv("ARCHIVE_CACHE", "0") == "1"
+
+# output: "csv", "csv.gz", "parquet" (needs `pyarrow`) or "sqlite" (--format).
+# Parquet rows per row group (the most a run holds before writing; column
+# types come from the parser), compression codec and string columns stored
+# dictionary-encoded
+OUTPUT_FORMAT = os.getenv("OUTPUT_FORMAT", "csv")
+PARQUET_ROW_GROUP_SIZE = int(os.getenv("PARQUET_ROW_GROUP_SIZE", "1000"))
+PARQUET_COMPRESSION = os.getenv("PARQUET_COMPRESSION", "zstd")
+PARQUET_DICTIONARY_COLUMNS = tuple(
+    os.getenv(
+        "PARQUET_DICTIONARY_COLUMNS", "state,city,approvedProvider,room_type"
+    ).split(",")
+)
+
+# parsed rows kept for resuming go into one append-only segment per run,
+# written and fsynced every INTERIM_BATCH_SIZE NIDs or INTERIM_FSYNC_SECONDS
+INTERIM_BATCH_SIZE = int(os.getenv("INTERIM_BATCH_SIZE", "100"))
+INTERIM_FSYNC_SECONDS = float(os.getenv("INTERIM_FSYNC_SECONDS", "5"))
+
+# CSV rows are buffered into blocks of CSV_BLOCK_SIZE bytes and each block is
+# flushed whole (and at least every CSV_FLUSH_SECONDS), so a file cut short
+# by a crash still ends on a complete row
+CSV_BLOCK_SIZE = int(os.getenv("CSV_BLOCK_SIZE", str(1 << 20)))
+CSV_FLUSH_SECONDS = float(os.getenv("CSV_FLUSH_SECONDS", "5"))
+
+# compare each run with the previous one and write a delta of added, removed
+# and changed rows to CHANGES_DIR/<pipeline>/ (CLI: --no-diff turns it off)
+DETECT_CHANGES = os.getenv("DETECT_CHANGES", "1") != "0"
+
+# incremental runs: NIDs whose payload hash matches the last successful run
+# are not re-parsed; their stored rows (STATE_DIR) are carried forward
+# (CLI: --incremental)
+INCREMENTAL = os.getenv("INCREMENTAL", "0") == "1"
+
+# SQLite snapshot store (--format sqlite): database file in each pipeline's
+# output dir, rows per upsert transaction and the columns indexed for lookups
+SQLITE_DB_NAME = os.getenv("SQLITE_DB_NAME", "snapshots.sqlite")
+SQLITE_BATCH_SIZE = int(os.getenv("SQLITE_BATCH_SIZE", "1000"))
+SQLITE_INDEX_COLUMNS = tuple(
+    os.getenv("SQLITE_INDEX_COLUMNS", "nid,state,postcode").split(",")
+)
+
 
 # ── 3. the rest (URLs, headers) stays as-is ────────────────────────────────
 OPERATIONS_BASE_URL = (
@@ -84,3 +149,65 @@ RADS_HEADERS = {
     ),
     "Referer": "https://www.myagedcare.gov.au/find-a-provider/",
 }
+
+
+# ── 4. network behaviour ───────────────────────────────────────────────────
+# max requests in flight during bulk scrapes (CLI: --concurrency)
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "8"))
+
+# `all` runs: NIDs several pipelines want are fetched through each of them
+# and compared until SHARED_FETCH_PROBE have matched; from then on each is
+# fetched once and saved for all of them, except every SHARED_FETCH_RECHECK-th,
+# which is compared again (one mismatch stops sharing).  0 never shares.
+SHARED_FETCH_PROBE = int(os.getenv("SHARED_FETCH_PROBE", "5"))
+SHARED_FETCH_RECHECK = int(os.getenv("SHARED_FETCH_RECHECK", "50"))
+
+# payloads / parsed batches buffered between the streaming run's fetch,
+# parse and write stages before the upstream stage has to wait
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "32"))
+
+# parse worker processes (<= 1 parses in-process; pickling a payload usually
+# costs more than parsing it; CLI: --workers) and payloads per worker task
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "1"))
+PARSE_CHUNK_SIZE = int(os.getenv("PARSE_CHUNK_SIZE", "64"))
+
+# shared HTTP session: seconds before a request times out, how many hosts
+# keep their own connection pool and how many keep-alive sockets each holds
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", str(SCRAPE_CONCURRENCY)))
+
+# adaptive per-host token bucket: starting rate, floor and ceiling in
+# requests/second, and how many requests may go out back-to-back.
+# RATE_LIMIT_RPS=0 switches rate limiting off.
+RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "4"))
+RATE_LIMIT_MIN_RPS = float(os.getenv("RATE_LIMIT_MIN_RPS", "0.5"))
+RATE_LIMIT_MAX_RPS = float(os.getenv("RATE_LIMIT_MAX_RPS", "16"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", str(SCRAPE_CONCURRENCY)))
+
+# retries: attempts per request, exponential backoff base/cap in seconds and
+# how many retries one run may spend in total before failing fast
+RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "4"))
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "1"))
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "30"))
+RETRY_BUDGET = int(os.getenv("RETRY_BUDGET", "250"))
+
+# circuit breaker: consecutive failures before pausing the whole scrape,
+# first pause length (doubles per trip) and trips before giving up
+CIRCUIT_THRESHOLD = int(os.getenv("CIRCUIT_THRESHOLD", "8"))
+CIRCUIT_COOLDOWN = float(os.getenv("CIRCUIT_COOLDOWN", "30"))
+CIRCUIT_MAX_TRIPS = int(os.getenv("CIRCUIT_MAX_TRIPS", "4"))
+
+# on-disk HTTP cache shared by every scraper: entries younger than the TTL
+# (seconds) are served without a request, older ones are revalidated with
+# ETag/Last-Modified; total size is capped (LRU).  HTTP_CACHE=0 disables it.
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE", "1") != "0"
+HTTP_CACHE_DIR = Path(os.getenv("HTTP_CACHE_DIR", CACHE_DIR / "http"))
+HTTP_CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", str(24 * 3600)))
+HTTP_CACHE_MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "512"))
+
+# NID lists (NIDS_CSV, RADS_NIDS_CSV) are kept as binary int arrays under
+# NIDS_CACHE_DIR and re-read from the CSV only when it changes.  NIDS_CACHE=0
+# disables it.
+NIDS_CACHE_ENABLED = os.getenv("NIDS_CACHE", "1") != "0"
+NIDS_CACHE_DIR = Path(os.getenv("NIDS_CACHE_DIR", CACHE_DIR / "nids"))
@@ -1,10 +1,48 @@
 # interfaces/base_parser.py
 
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+
+from aged_care_pipeline.parsers.columnar import rows_to_columns, to_table
 
 
 class BaseParser(ABC):
+    # the columns every parsed row has, in output order; writers use it as
+    # their schema (None: take it from the first row)
+    columns: tuple[str, ...] | None = None
+    # Python type (int, float, bool) of columns that typed outputs such as
+    # Parquet store as more than text; unlisted columns are text
+    column_types: dict[str, type] | None = None
+    # the columns that identify a row within one run's output
+    key_columns: tuple[str, ...] = ("nid",)
+    # column → payload path, for parsers driven by a path table
+    field_paths: dict[str, list] | None = None
+    # bump whenever parse() starts returning different rows for the same
+    # payload, so incremental runs stop carrying forward the old rows
+    version: int = 1
+
+    @classmethod
+    def schema_id(cls) -> str:
+        """Short hash of this parser's name, version, columns and paths."""
+        # stdlib json on purpose: the id must not change with JSON_CODEC
+        blob = json.dumps(
+            [cls.__name__, cls.version, list(cls.columns or ()), cls.field_paths]
+        )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
     @abstractmethod
     def parse(self, raw: dict) -> list[dict]:
         """Turn raw JSON into a list of flat records."""
         ...
+
+    def parse_batch(self, raws: Iterable[dict], backend: str = "auto"):
+        """
+        Parse many payloads into one table: a pandas DataFrame, or a pyarrow
+        Table when `backend` is "arrow" ("auto" picks arrow if installed).
+        Parsers override this to fill column buffers directly; the default
+        goes through parse().
+        """
+        rows = [row for raw in raws for row in self.parse(raw)]
+        return to_table(rows_to_columns(rows), backend)
@@ -1,7 +1,14 @@
 # src/aged_care_pipeline/interfaces/base_scraper.py
 
+import logging
 from abc import ABC, abstractmethod
 
+from aged_care_pipeline.config.global_settings import SCRAPE_CONCURRENCY
+from aged_care_pipeline.utils import codec
+from aged_care_pipeline.utils.async_engine import run_ordered
+
+logger = logging.getLogger(__name__)
+
 
 class BaseScraper(ABC):
     @abstractmethod
@@ -9,9 +16,58 @@ class BaseScraper(ABC):
         """Fetch raw JSON for a given NID."""
         ...
 
-    def bulk(self, nids: list[int]) -> None:
+    @abstractmethod
+    def fetch_raw(self, nid: int) -> bytes:
+        """Request `nid`'s response body, as received, without touching disk."""
+        ...
+
+    def fetch(self, nid: int) -> dict:
+        """Request the payload for `nid` without touching disk."""
+        return codec.loads(self.fetch_raw(nid))
+
+    def scrape_raw(self, nid: int) -> bytes:
+        """
+        Like scrape(), but return the payload's JSON bytes without decoding
+        them, for runs that only store payloads (`scrape`).  Scrapers that
+        can't pass the body through encode scrape()'s result instead.
         """
-        Default bulk‐scrape: iterate scrape() over each NID.
+        return codec.dumps(self.scrape(nid))
+
+    @abstractmethod
+    def save_raw(self, nid: int, data: dict | bytes) -> str:
         """
-        for nid in nids:
-            self.scrape(nid)
+        Persist a payload (or its body as received) as this pipeline's raw
+        file, e.g. one fetched by another pipeline, and return its path.
+        """
+        ...
+
+    def bulk(
+        self, nids: list[int], concurrency: int | None = None
+    ) -> list[dict | None]:
+        """
+        Default bulk‐scrape: run scrape() over every NID on the async engine,
+        with at most `concurrency` requests in flight.
+
+        Payloads come back in the same order as `nids`; a NID whose scrape
+        raised is logged and returned as None so one bad provider can't sink
+        the whole run.
+        """
+        concurrency = concurrency or SCRAPE_CONCURRENCY
+        logger.info(
+            f"[Scraper] Bulk scraping {len(nids)} NIDs (concurrency={concurrency})"
+        )
+        return run_ordered(self._scrape_or_none, nids, concurrency)
+
+    def _scrape_or_none(self, nid: int) -> dict | None:
+        try:
+            return self.scrape(nid)
+        except Exception as e:
+            logger.warning(f"[Scraper] NID {nid} failed: {e}")
+            return None
+
+    def _scrape_raw_or_none(self, nid: int) -> bytes | None:
+        try:
+            return self.scrape_raw(nid)
+        except Exception as e:
+            logger.warning(f"[Scraper] NID {nid} failed: {e}")
+            return None
@@ -1,10 +1,16 @@
 # interfaces/base_writer.py
 
+import os
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 
 class BaseWriter(ABC):
     @abstractmethod
-    def write(self, records: list[dict], filename: str) -> None:
+    def write(self, records: Iterable[dict], filename: str) -> None:
         """Persist parsed records to storage (CSV, DB, etc.)."""
         ...
+
+    def location(self, filename: str) -> str:
+        """Where write(records, filename) puts the records, for logging."""
+        return os.path.join(self.output_dir, filename)
@@ -0,0 +1,76 @@
+# parsers/columnar.py
+"""
+Turn column buffers (column name → list of values) into a table.
+
+parse_batch() implementations fill one list per column straight from the
+payloads and hand them here; no per-row dicts are built.  Each column gets
+a real type: pandas' nullable dtypes (Int64, Float64, boolean, string) or
+Arrow types, inferred from the values, with None as missing.  Columns whose
+values don't share a type fall back to object (pandas) or strings (Arrow).
+"""
+
+from aged_care_pipeline.utils import codec
+
+BACKENDS = ("auto", "pandas", "arrow")
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def resolve_backend(backend: str = "auto") -> str:
+    """'auto' → 'arrow' when pyarrow is installed, else 'pandas'."""
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}; expected one of {BACKENDS}")
+    if backend == "auto":
+        return "arrow" if _pyarrow() is not None else "pandas"
+    if backend == "arrow" and _pyarrow() is None:
+        raise RuntimeError("backend='arrow' needs pyarrow (pip install pyarrow)")
+    return backend
+
+
+def as_text(value):
+    """Text form of a value for a string column (dicts and lists as JSON)."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return codec.dumps(value).decode()
+    return str(value)
+
+
+def _pandas_column(values: list):
+    import pandas as pd
+
+    try:
+        return pd.array(values)
+    except (TypeError, ValueError):
+        return pd.array(values, dtype=object)
+
+
+def _arrow_column(pa, values: list):
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([as_text(v) for v in values], type=pa.string())
+
+
+def to_table(columns: dict[str, list], backend: str = "auto"):
+    """Build a DataFrame (pandas) or Table (arrow) from column buffers."""
+    backend = resolve_backend(backend)
+    if backend == "arrow":
+        pa = _pyarrow()
+        return pa.table({name: _arrow_column(pa, v) for name, v in columns.items()})
+
+    import pandas as pd
+
+    return pd.DataFrame({name: _pandas_column(v) for name, v in columns.items()})
+
+
+def rows_to_columns(rows: list[dict]) -> dict[str, list]:
+    """Column buffers from row dicts (columns in first-seen order)."""
+    names = dict.fromkeys(k for row in rows for k in row)
+    return {name: [row.get(name) for row in rows] for name in names}
@@ -0,0 +1,156 @@
+# parsers/executor.py
+"""
+Run a parser over many payloads, optionally across worker processes.
+
+Parsing is pure CPU over independent payloads, so ParseExecutor can shard
+the work over a process pool: payloads are sent in chunks (one pickle
+round-trip per chunk, not per payload), a bounded number of chunks is kept
+in flight, and results come back in input order.  With workers <= 1 it
+parses in-process, which is the right call whenever pickling a payload
+costs more than parsing it (the default; see PARSE_WORKERS).
+
+Every chunk reports which process parsed it and how long it took, so a run
+can log per-worker throughput.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, TypeVar
+
+from aged_care_pipeline.config.global_settings import (
+    PARSE_CHUNK_SIZE,
+    PARSE_WORKERS,
+)
+from aged_care_pipeline.interfaces.base_parser import BaseParser
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# set in each worker process by _init_worker
+_worker_parser: BaseParser | None = None
+
+
+def _init_worker(parser: BaseParser) -> None:
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_all(parser: BaseParser, payloads: list) -> list[list[dict]]:
+    # a failed fetch (None) has nothing to parse
+    return [parser.parse(p) if p is not None else [] for p in payloads]
+
+
+def _parse_chunk(payloads: list) -> tuple[list[list[dict]], int, float]:
+    start = time.perf_counter()
+    rows = _parse_all(_worker_parser, payloads)
+    return rows, os.getpid(), time.perf_counter() - start
+
+
+class ParseExecutor:
+    def __init__(
+        self,
+        parser: BaseParser,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+    ):
+        """
+        parser: the parser to run (copied into each worker process).
+        workers: processes to use; <= 1 parses in this process.
+        chunk_size: payloads sent to a worker per task.
+        """
+        self.parser = parser
+        self.workers = PARSE_WORKERS if workers is None else workers
+        self.chunk_size = max(1, chunk_size or PARSE_CHUNK_SIZE)
+        self._pool: ProcessPoolExecutor | None = None
+        self._stats: dict[str, list] = {}
+
+    def _record(self, worker: str, payloads: int, seconds: float) -> None:
+        entry = self._stats.setdefault(worker, [0, 0.0])
+        entry[0] += payloads
+        entry[1] += seconds
+
+    def imap(
+        self, items: Iterable[T], key: Callable[[T], Any] | None = None
+    ) -> Iterator[tuple[T, list[dict]]]:
+        """
+        Yield (item, rows) for every item, in input order; `key(item)` is
+        the payload to parse (default: the item itself).  `items` is read
+        lazily, so this can sit in the middle of a stream.
+        """
+        key = key or (lambda item: item)
+        if self.workers <= 1:
+            for item in items:
+                payload = key(item)
+                start = time.perf_counter()
+                (rows,) = _parse_all(self.parser, [payload])
+                if payload is not None:  # skipped NIDs aren't throughput
+                    self._record("main", 1, time.perf_counter() - start)
+                yield item, rows
+            return
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.parser,),
+            )
+        source = iter(items)
+        pending: deque = deque()
+
+        def submit() -> bool:
+            chunk = list(islice(source, self.chunk_size))
+            if not chunk:
+                return False
+            payloads = [key(item) for item in chunk]
+            n = sum(p is not None for p in payloads)
+            pending.append((chunk, n, self._pool.submit(_parse_chunk, payloads)))
+            return True
+
+        try:
+            while len(pending) < self.workers * 2 and submit():
+                pass
+            while pending:
+                chunk, n, future = pending.popleft()
+                results, pid, seconds = future.result()
+                self._record(f"pid {pid}", n, seconds)
+                yield from zip(chunk, results)
+                while len(pending) < self.workers * 2 and submit():
+                    pass
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
+    def map(self, payloads: Iterable) -> list[list[dict]]:
+        """Parse every payload; one list of rows per payload, in order."""
+        return [rows for _, rows in self.imap(payloads)]
+
+    def stats(self) -> dict[str, dict]:
+        return {
+            worker: {"payloads": n, "seconds": secs}
+            for worker, (n, secs) in self._stats.items()
+        }
+
+    def log_stats(self) -> None:
+        """One line per worker: payloads parsed and payloads per second."""
+        for worker, (n, secs) in sorted(self._stats.items()):
+            rate = n / secs if secs else float("inf")
+            logger.info(
+                f"[ParseExec] {worker}: {n} payloads in {secs:.2f}s ({rate:.0f}/s)"
+            )
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,126 @@
+# parsers/field_extractor.py
+"""
+Compile a FIELD_PATHS mapping into one generated extractor function.
+
+Calling get_path() per column re-walks shared prefixes (operationsData →
+financialReport → annual → …) from the root for every field.  Here the
+paths are folded into a prefix trie and turned into straight-line Python:
+each trie node is looked up once per payload, its type is checked once,
+and every column under it reads from that one local variable.  The same
+walk can also write into column buffers (compile_column_filler) for
+parse_batch().
+
+Semantics match get_path(raw, path) with the default of None exactly:
+dict steps use .get (also for int keys), int steps on lists index with the
+same `key < len(list)` guard, and anything else yields None.
+"""
+
+import itertools
+from collections.abc import Callable
+from typing import Any
+
+
+class _Node:
+    __slots__ = ("children", "columns")
+
+    def __init__(self):
+        self.children: dict = {}
+        self.columns: list[str] = []
+
+
+def _build_trie(field_paths: dict[str, list]) -> _Node:
+    root = _Node()
+    for column, path in field_paths.items():
+        node = root
+        for key in path:
+            node = node.children.setdefault(key, _Node())
+        node.columns.append(column)
+    return root
+
+
+class _Codegen:
+    """Emit the trie walk; `target(column)` is the lvalue a value goes to."""
+
+    def __init__(self, target: Callable[[str], str]):
+        self.target = target
+        self.lines: list[str] = []
+        self.names = itertools.count(1)
+
+    def child(self, child: _Node, var: str, expr: str, depth: int) -> None:
+        pad = "    " * depth
+        if not child.children and len(child.columns) == 1:
+            # plain leaf: no need for a local
+            self.lines.append(f"{pad}{self.target(child.columns[0])} = {expr}")
+            return
+        self.lines.append(f"{pad}{var} = {expr}")
+        self.node(child, var, depth)
+
+    def node(self, node: _Node, var: str, depth: int) -> None:
+        pad = "    " * depth
+        for column in node.columns:
+            self.lines.append(f"{pad}{self.target(column)} = {var}")
+        if not node.children:
+            return
+
+        children = [
+            (key, child, f"n{next(self.names)}") for key, child in node.children.items()
+        ]
+        self.lines.append(f"{pad}if isinstance({var}, dict):")
+        for key, child, child_var in children:
+            self.child(child, child_var, f"{var}.get({key!r})", depth + 1)
+
+        indexed = [c for c in children if isinstance(c[0], int)]
+        if indexed:
+            self.lines.append(f"{pad}elif isinstance({var}, list):")
+            for key, child, child_var in indexed:
+                expr = f"{var}[{key!r}] if {key!r} < len({var}) else None"
+                self.child(child, child_var, expr, depth + 1)
+
+
+def _generate(field_paths, header: list[str], target, footer: list[str], name: str):
+    gen = _Codegen(target)
+    gen.lines.extend(header)
+    gen.node(_build_trie(field_paths), "n0", 1)
+    gen.lines.extend(footer)
+    source = "\n".join(gen.lines) + "\n"
+
+    namespace = {"COLUMNS": tuple(field_paths)}
+    # the source is built only from the parsers' own FIELD_PATHS constants,
+    # with every key and column name emitted via repr(), never from payloads
+    exec(compile(source, "<compiled field paths>", "exec"), namespace)  # noqa: S102
+    fn = namespace[name]
+    fn.source = source
+    return fn
+
+
+def compile_field_paths(field_paths: dict[str, list]) -> Callable[[Any], dict]:
+    """
+    Return extract(raw) → {column: value} for every column in `field_paths`
+    (same key order).  The generated source is kept on `extract.source`.
+    """
+    return _generate(
+        field_paths,
+        ["def extract(n0):", "    row = dict.fromkeys(COLUMNS)"],
+        lambda column: f"row[{column!r}]",
+        ["    return row"],
+        "extract",
+    )
+
+
+def compile_column_filler(
+    field_paths: dict[str, list],
+) -> Callable[[Any, list[list], int], None]:
+    """
+    Return fill(raw, cols, i), which writes raw's value for the k-th column
+    of `field_paths` into cols[k][i] (same values as compile_field_paths,
+    but into pre-sized column buffers instead of a row dict).  Buffers must
+    start out as None so missing subtrees need no writes.
+    """
+    index = {column: k for k, column in enumerate(field_paths)}
+    return _generate(
+        field_paths,
+        ["def fill(n0, cols, i):"],
+        lambda column: f"cols[{index[column]}][i]",
+        ["    return None"],
+        "fill",
+    )
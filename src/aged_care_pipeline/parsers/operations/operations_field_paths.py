@@ -694,3 +694,21 @@ FIELD_PATHS = {
     "rating_qualityMeasures": ["ratings", "qualityMeasures", 0, "rating"],
     "rating_compliance": ["ratings", "compliance", 0, "rating"],
 }
+
+# columns typed outputs (Parquet) store as numbers; the rest stay text, as
+# published ("91-100%" ranges, comparison labels, IDs, flags)
+FIELD_TYPES = {
+    "nid": int,
+    **{
+        name: float
+        for name, path in FIELD_PATHS.items()
+        if "financialReport" in path
+        and name not in ("reportingPeriod_value", "ach_median_comparison")
+    },
+    **{
+        name: float
+        for name, path in FIELD_PATHS.items()
+        if path[-1] in ("target", "achieved", "combined", "topUp")
+    },
+    **{name: int for name in FIELD_PATHS if name.startswith("rating_")},
+}
@@ -1,20 +1,34 @@
 # parsers/operations_parser.py
 
 import logging
+from collections.abc import Iterable
 
 import structlog
 
 from aged_care_pipeline.interfaces.base_parser import BaseParser
+from aged_care_pipeline.parsers.columnar import to_table
+from aged_care_pipeline.parsers.field_extractor import (
+    compile_column_filler,
+    compile_field_paths,
+)
 
-from .operations_field_paths import FIELD_PATHS, get_path
+from .operations_field_paths import FIELD_PATHS, FIELD_TYPES, get_path
 
 log = structlog.get_logger(__name__).bind(component="scraper", scraper="rads")
 
 
 logger = logging.getLogger(__name__)
 
+# FIELD_PATHS folded into one function that walks each shared prefix once
+extract_fields = compile_field_paths(FIELD_PATHS)
+fill_columns = compile_column_filler(FIELD_PATHS)
+
 
 class OperationsParser(BaseParser):
+    columns = tuple(FIELD_PATHS)
+    column_types = FIELD_TYPES
+    field_paths = FIELD_PATHS
+
     def parse(self, raw: dict) -> list[dict]:
         nid = get_path(raw, ["nid"])
         if not raw or not nid:
@@ -22,6 +36,19 @@ class OperationsParser(BaseParser):
             return []
 
         logger.debug(f"[Parser] Parsing data for NID {nid}")
-        row = {col: get_path(raw, path) for col, path in FIELD_PATHS.items()}
+        row = extract_fields(raw)
         logger.info(f"[Parser] Parsed {len(row)} fields for NID {nid}")
         return [row]
+
+    def parse_batch(self, raws: Iterable[dict], backend: str = "auto"):
+        """
+        Parse a batch straight into column buffers (one list per FIELD_PATHS
+        column, no row dicts) and return them as a DataFrame / Arrow table.
+        Payloads parse() would skip are skipped here too.
+        """
+        valid = [raw for raw in raws if raw and get_path(raw, ["nid"])]
+        cols = [[None] * len(valid) for _ in FIELD_PATHS]
+        for i, raw in enumerate(valid):
+            fill_columns(raw, cols, i)
+        logger.info(f"[Parser] Parsed {len(valid)} payloads into {len(cols)} columns")
+        return to_table(dict(zip(FIELD_PATHS, cols)), backend)
@@ -1,15 +1,32 @@
 import logging
+from collections.abc import Iterable
 
 import structlog
 
 from aged_care_pipeline.interfaces.base_parser import BaseParser
+from aged_care_pipeline.parsers.columnar import to_table
 
 log = structlog.get_logger(__name__).bind(component="scraper", scraper="rads")
 
 logger = logging.getLogger(__name__)
 
+COLUMNS = (
+    "nid",
+    "provider_name",
+    "room_type",
+    "maximumRAD",
+    "address",
+    "suburb_postcode",
+    "state",
+)
+COLUMN_TYPES = {"nid": int}
+
 
 class RadsParser(BaseParser):
+    columns = COLUMNS
+    column_types = COLUMN_TYPES
+    key_columns = ("nid", "room_type")
+
     def parse(self, raw: dict) -> list[dict]:
         if not raw or not raw.get("nid"):
             return []
@@ -39,3 +56,39 @@ class RadsParser(BaseParser):
             )
         logger.info(f"[RadsParser] Parsed {len(rows)} room record(s) for NID {nid}")
         return rows
+
+    def parse_batch(self, raws: Iterable[dict], backend: str = "auto"):
+        """
+        Same records as parse() (one per room subtype), appended column by
+        column instead of as row dicts, returned as a DataFrame / Arrow table.
+        """
+        cols = {name: [] for name in COLUMNS}
+        nids, names, rooms, rads = (
+            cols["nid"],
+            cols["provider_name"],
+            cols["room_type"],
+            cols["maximumRAD"],
+        )
+        addresses, suburbs, states = (
+            cols["address"],
+            cols["suburb_postcode"],
+            cols["state"],
+        )
+        for raw in raws:
+            if not raw or not raw.get("nid"):
+                continue
+            svc = raw.get("serviceProvider", {})
+            city, postcode = svc.get("city"), svc.get("postcode")
+            suburb_postcode = f"{city} {postcode}" if city and postcode else None
+            subtypes = raw.get("ach_room_costs", {}).get("subtypes", [])
+            for room in subtypes:
+                rooms.append(room.get("productName"))
+                rads.append(room.get("maximumRAD"))
+            n = len(subtypes)
+            nids.extend([raw["nid"]] * n)
+            names.extend([raw.get("name")] * n)
+            addresses.extend([svc.get("address")] * n)
+            suburbs.extend([suburb_postcode] * n)
+            states.extend([svc.get("state")] * n)
+        logger.info(f"[RadsParser] Parsed {len(nids)} room record(s) into columns")
+        return to_table(cols, backend)
@@ -0,0 +1,223 @@
+# processors/change_detector.py
+"""
+Detect what changed between consecutive runs of a pipeline.
+
+ChangeDetector sits on a run's row stream: observe() passes rows through
+untouched while hashing each one (an 8-byte blake2b per field, plus a row
+hash over those), so a run is compared in O(rows) without either snapshot
+being loaded as a table.  The previous run is kept only as those hashes
+(CHANGES_DIR/<pipeline>/hashes.json.gz).  Rows are matched on the parser's
+key_columns (plus the key's occurrence within the run, for homes listing
+a room type twice); field hashes are only compared for rows whose row hash
+moved.
+
+finish() writes the delta — one JSON line per added, removed or changed
+row, with the changed columns — and replaces the stored hashes with this
+run's.  A partial run (LIMIT, or NIDs that returned nothing) passes the
+NIDs it covered: only their rows are compared, and only their hashes are
+replaced, so the rest of the previous run is neither reported removed nor
+forgotten.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from collections import Counter
+from collections.abc import Iterable, Iterator
+
+from aged_care_pipeline.utils import codec
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "hashes.json.gz"
+_DIGEST = 8  # bytes per hash; 16 hex chars
+
+
+# row keys and field hashes use the stdlib encoder, so stored state stays
+# comparable whichever JSON_CODEC wrote it
+def _canonical(value) -> bytes:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, ensure_ascii=False).encode()
+    return repr(value).encode()
+
+
+def field_hash(value) -> str:
+    return hashlib.blake2b(_canonical(value), digest_size=_DIGEST).hexdigest()
+
+
+def _row_hash(fields: str) -> str:
+    return hashlib.blake2b(fields.encode(), digest_size=_DIGEST).hexdigest()
+
+
+def row_hashes(row: dict, columns: list[str]) -> tuple[str, str]:
+    """(row hash, field hashes concatenated in `columns` order)."""
+    fields = "".join(field_hash(row.get(c)) for c in columns)
+    return _row_hash(fields), fields
+
+
+def _split(fields: str) -> list[str]:
+    n = _DIGEST * 2
+    return [fields[i : i + n] for i in range(0, len(fields), n)]
+
+
+class ChangeDetector:
+    def __init__(
+        self,
+        state_dir: str,
+        key_columns: Iterable[str] = ("nid",),
+        columns: Iterable[str] | None = None,
+    ):
+        """
+        state_dir: where the previous hashes live and deltas are written.
+        key_columns: what identifies a row within one run.
+        columns: the columns hashed (default: the first row's keys).
+        """
+        self.state_dir = state_dir
+        self.key_columns = tuple(key_columns)
+        self.columns = list(columns) if columns is not None else None
+        self._rows: dict[str, list[str]] = {}
+        self._seen: Counter = Counter()
+        self.previous = self._load()
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.state_dir, STATE_FILE)
+
+    def _load(self) -> dict | None:
+        try:
+            with gzip.open(self.state_path, "rb") as f:
+                return codec.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"[Changes] Ignoring unreadable {self.state_path}: {e}")
+            return None
+
+    def _key(self, row: dict) -> str:
+        key = tuple(row.get(c) for c in self.key_columns)
+        self._seen[key] += 1
+        return json.dumps([*key, self._seen[key]], ensure_ascii=False, default=str)
+
+    def observe(self, rows: Iterable[dict]) -> Iterator[dict]:
+        """Hash rows as they stream past; yields them unchanged."""
+        for row in rows:
+            if self.columns is None:
+                self.columns = list(row.keys())
+            self._rows[self._key(row)] = list(row_hashes(row, self.columns))
+            yield row
+
+    def _changed_columns(self, old_fields: str, new_fields: str) -> list[str]:
+        old = dict(zip(self.previous["columns"], _split(old_fields)))
+        none = field_hash(None)
+        return [
+            col
+            for col, h in zip(self.columns, _split(new_fields))
+            if old.get(col, none) != h
+        ]
+
+    def _nid(self, key: str):
+        values = json.loads(key)[:-1]
+        return dict(zip(self.key_columns, values)).get("nid")
+
+    def _covered(self, key: str, covered: set[str] | None) -> bool:
+        return covered is None or str(self._nid(key)) in covered
+
+    def _reorder(self, entry: list[str]) -> list[str]:
+        """A previous run's [row hash, fields] in this run's column order."""
+        if self.previous["columns"] == self.columns:
+            return entry
+        old = dict(zip(self.previous["columns"], _split(entry[1])))
+        none = field_hash(None)
+        fields = "".join(old.get(c, none) for c in self.columns)
+        return [_row_hash(fields), fields]
+
+    def _entry(self, key: str, change: str, columns: list[str] | None = None):
+        *values, rank = json.loads(key)
+        entry = {"change": change, **dict(zip(self.key_columns, values))}
+        if rank > 1:
+            entry["key_rank"] = rank
+        if columns is not None:
+            entry["columns"] = columns
+        return entry
+
+    def diff(self, covered: set[str] | None = None) -> list[dict]:
+        """
+        Added, changed and removed rows against the previous run; with
+        `covered` (NIDs as strings), rows of other NIDs aren't removed.
+        """
+        if self.previous is None:
+            return []
+        before = self.previous["rows"]
+        delta = []
+        for key, (row_hash, fields) in self._rows.items():
+            old = before.get(key)
+            if old is None:
+                delta.append(self._entry(key, "added"))
+            elif old[0] != row_hash:
+                changed = self._changed_columns(old[1], fields)
+                if changed:  # else only the column set moved (all-null new column)
+                    delta.append(self._entry(key, "changed", changed))
+        for key in sorted(before.keys() - self._rows.keys()):
+            if self._covered(key, covered):
+                delta.append(self._entry(key, "removed"))
+        return delta
+
+    def finish(
+        self, snapshot: str, covered: Iterable[int] | None = None
+    ) -> dict[str, int]:
+        """
+        Write delta_<snapshot>.jsonl (if there is a previous run), store this
+        run's hashes and return counts per kind of change.  `covered`: the
+        NIDs a partial run wrote; None for a run over every NID.
+        """
+        if not self._rows:
+            # nothing parsed is a failed run, not every row removed
+            logger.warning("[Changes] No rows this run; keeping the previous hashes")
+            return {}
+        rows = self._rows
+        if covered is not None:
+            if self.previous is None:
+                logger.info("[Changes] Partial run: not saved as a baseline")
+                return {}
+            if "nid" not in self.key_columns:
+                logger.info("[Changes] Partial run: previous hashes kept")
+                return {}
+            covered = {str(n) for n in covered}
+            # keep what this run didn't cover, in this run's column order
+            rows = {
+                key: self._reorder(entry)
+                for key, entry in self.previous["rows"].items()
+                if not self._covered(key, covered)
+            }
+            rows.update(self._rows)
+        os.makedirs(self.state_dir, exist_ok=True)
+        delta = self.diff(covered)
+        counts = dict(Counter(d["change"] for d in delta))
+
+        if self.previous is None:
+            logger.info(
+                f"[Changes] No previous run in {self.state_dir}; "
+                f"saved a baseline of {len(rows)} rows"
+            )
+        else:
+            path = os.path.join(self.state_dir, f"delta_{snapshot}.jsonl")
+            with open(path, "wb") as f:
+                f.writelines(codec.dumps(d) + b"\n" for d in delta)
+            top = Counter(c for d in delta for c in d.get("columns", ()))
+            common = ", ".join(f"{c} ({n})" for c, n in top.most_common(5))
+            logger.info(
+                f"[Changes] vs {self.previous['snapshot']}: "
+                f"{counts.get('added', 0)} added, {counts.get('removed', 0)} "
+                f"removed, {counts.get('changed', 0)} changed"
+                + (f"; most changed: {common}" if common else "")
+                + f" → {path}"
+            )
+
+        state = {"snapshot": snapshot, "columns": self.columns, "rows": rows}
+        tmp = self.state_path + ".tmp"
+        with gzip.open(tmp, "wb") as f:
+            f.write(codec.dumps(state))
+        os.replace(tmp, self.state_path)
+        return counts
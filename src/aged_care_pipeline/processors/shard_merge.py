@@ -0,0 +1,143 @@
+# processors/shard_merge.py
+"""
+Combine the partial outputs of a sharded run into the dated output.
+
+A `run --shard I/N` writes <prefix>_<dd_mm_yyyy>.shard<I>of<N>.<ext> next
+to where the unsharded run would write <prefix>_<dd_mm_yyyy>.<ext>.  Each
+part holds its shard's rows in NID-list order, so ShardMerge streams them
+through a k-way merge on each row's position in the NID list: the merged
+file has the rows in the same order an unsharded run would have written
+them, whichever host finished first, and no part is held in memory.
+
+While rows stream past it notes which NIDs each part covered; coverage()
+then reports, per shard, how many of the NIDs hashed to it were written,
+which are missing, which turned up in the wrong part (a different NID list
+or shard count) and which parts are missing altogether.
+"""
+
+import csv
+import gzip
+import heapq
+import logging
+import os
+import re
+from collections.abc import Iterator
+
+from aged_care_pipeline.utils.nids import shard_of, shard_tag
+
+logger = logging.getLogger(__name__)
+
+
+def part_name(prefix: str, stamp: str, ext: str, index: int, count: int) -> str:
+    """
+    'operations', '01_02_2025', 'csv', 2, 4
+    → 'operations_01_02_2025.shard2of4.csv'.
+    """
+    return f"{prefix}_{stamp}.{shard_tag(index, count)}.{ext}"
+
+
+def find_parts(
+    output_dir, prefix: str, stamp: str, ext: str
+) -> dict[int, dict[int, str]]:
+    """{shard count: {shard index: path}} for the parts of one day's run."""
+    pattern = re.compile(
+        rf"^{re.escape(prefix)}_{re.escape(stamp)}\.shard(\d+)of(\d+)\.{re.escape(ext)}$"
+    )
+    found: dict[int, dict[int, str]] = {}
+    if not os.path.isdir(output_dir):
+        return found
+    for name in sorted(os.listdir(output_dir)):
+        m = pattern.match(name)
+        if m:
+            index, count = int(m[1]), int(m[2])
+            found.setdefault(count, {})[index] = os.path.join(output_dir, name)
+    return found
+
+
+def read_part(path: str) -> Iterator[dict]:
+    """Rows of a CSV (.csv, .csv.gz) or Parquet part, as written."""
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError(
+                "Reading Parquet parts needs the 'pyarrow' package "
+                "(pip install aged_care_pipeline[parquet])"
+            ) from None
+        for batch in pq.ParquetFile(path).iter_batches():
+            yield from batch.to_pylist()
+        return
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def _nid(row: dict) -> int | None:
+    try:
+        return int(row.get("nid"))
+    except (TypeError, ValueError):
+        return None
+
+
+class ShardMerge:
+    """
+    Merge `parts` ({shard index: path}) of a run split `count` ways, in
+    the order of `nids` (the pipeline's full NID list).
+    """
+
+    def __init__(self, parts: dict[int, str], count: int, nids: list[int]):
+        self.parts = dict(sorted(parts.items()))
+        self.count = count
+        self.nids = nids
+        self._position: dict[int, int] = {}
+        for i, nid in enumerate(nids):
+            self._position.setdefault(nid, i)  # first listing wins
+        self._seen: dict[int, set[int]] = {index: set() for index in self.parts}
+        self.rows_written = 0
+
+    def _order(self, row: dict) -> tuple[int, int]:
+        nid = _nid(row)
+        if nid is None:
+            return len(self.nids), -1
+        return self._position.get(nid, len(self.nids)), nid
+
+    def _tracked(self, index: int, path: str) -> Iterator[dict]:
+        seen = self._seen[index]
+        for row in read_part(path):
+            nid = _nid(row)
+            if nid is not None:
+                seen.add(nid)
+            yield row
+
+    def rows(self) -> Iterator[dict]:
+        """Every part's rows, merged into NID-list order."""
+        streams = [self._tracked(i, path) for i, path in self.parts.items()]
+        for row in heapq.merge(*streams, key=self._order):
+            self.rows_written += 1
+            yield row
+
+    def coverage(self) -> list[dict]:
+        """
+        Per shard (call after rows() is consumed): its part (None if there
+        is none), expected/written NID counts, missing NIDs and NIDs found
+        in a part they don't hash to.
+        """
+        expected: dict[int, list[int]] = {i: [] for i in range(1, self.count + 1)}
+        for nid in dict.fromkeys(self.nids):
+            expected[shard_of(nid, self.count)].append(nid)
+        report = []
+        for index, want in expected.items():
+            seen = self._seen.get(index, set())
+            report.append(
+                {
+                    "shard": index,
+                    "path": self.parts.get(index),
+                    "expected": len(want),
+                    "written": len(seen & set(want)),
+                    "missing": sorted(set(want) - seen),
+                    "stray": sorted(
+                        n for n in seen if shard_of(n, self.count) != index
+                    ),
+                }
+            )
+        return report
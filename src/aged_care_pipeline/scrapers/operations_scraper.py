@@ -1,6 +1,5 @@
 # scrapers/operations_scraper.py
 
-import json
 import logging
 import os
 from datetime import datetime
@@ -9,11 +8,16 @@ from pathlib import Path
 import structlog
 
 from aged_care_pipeline.config.global_settings import (
+    ARCHIVE_CACHE,
     OPERATIONS_BASE_URL,
     OPERATIONS_HEADERS,
     RAW_DIR,
 )
 from aged_care_pipeline.interfaces.base_scraper import BaseScraper
+from aged_care_pipeline.storage.archive import ArchiveCache
+from aged_care_pipeline.storage.raw_index import RawIndex
+from aged_care_pipeline.storage.raw_store import read_raw_bytes, write_raw
+from aged_care_pipeline.utils import codec
 
 try:
     safe_get  # type: ignore[name-defined]
@@ -26,10 +30,12 @@ logger = logging.getLogger(__name__)
 
 
 class OperationsScraper(BaseScraper):
-    def __init__(self, raw_dir: str = None):
+    def __init__(self, raw_dir: str | None = None, archive_dir: str | None = None):
         """
         raw_dir: directory where raw JSON files will be stored.
         If not provided, falls back to BASE RAW_DIR from settings.
+        archive_dir: cleanup archives to read NIDs from when no raw file is
+        cached (default RAW_DIR/archive/operations if ARCHIVE_CACHE is on).
         """
         super().__init__()
         if raw_dir is not None:
@@ -38,33 +44,77 @@ class OperationsScraper(BaseScraper):
             # Allow runtime override via environment variable
             self.raw_dir = os.getenv("RAW_DIR", str(RAW_DIR))
 
-    def scrape(self, nid: int) -> dict | None:
+        # Raw files already on disk (this run's raw_dir first, then the
+        # data/raw folder next to the NID list) double as an offline cache.
+        # They're indexed once by exact NID instead of globbed per NID.
+        alt_dir = Path(os.getenv("NIDS_CSV", "")).parent / "data" / "raw"
+        self.raw_index = RawIndex(self.raw_dir, alt_dir, prefix="operations")
+
+        # Past runs' cleanup archives, read through their NID index
+        if (
+            archive_dir is None
+            and os.getenv("ARCHIVE_CACHE", "1" if ARCHIVE_CACHE else "0") == "1"
+        ):
+            root = os.getenv("RAW_DIR", str(RAW_DIR))
+            archive_dir = os.path.join(root, "archive", "operations")
+        self.archives = ArchiveCache(archive_dir) if archive_dir else None
+
+    def _cached(self, nid: int) -> bytes | None:
         # If we already have a raw JSON for this NID, load it instead of
         # hitting the network.  This allows offline testing.
-        existing = next(Path(self.raw_dir).glob(f"*{nid}*.json"), None)
-        if not existing:
-            alt_dir = Path(os.getenv("NIDS_CSV", "")).parent / "data" / "raw"
-            if alt_dir.is_dir():
-                existing = next(alt_dir.glob(f"*{nid}*.json"), None)
+        existing = self.raw_index.lookup(nid)
         if existing:
             logger.info(f"[Scraper] Using cached raw JSON for NID {nid} → {existing}")
-            with open(existing, encoding="utf-8") as f:
-                return json.load(f)
+            return read_raw_bytes(existing)
+        if self.archives is not None:
+            found = self.archives.lookup_raw(nid)
+            if found:
+                logger.info(
+                    f"[Scraper] Using archived raw JSON for NID {nid} → {found[0]}"
+                )
+                return found[1]
+        return None
+
+    def scrape(self, nid: int) -> dict | None:
+        body = self._cached(nid)
+        if body is not None:
+            return codec.loads(body)
+        # decode once (so a broken body is never saved), store the bytes as is
+        body = self.fetch_raw(nid)
+        data = codec.loads(body)
+        self.save_raw(nid, body)
+        return data
 
+    def scrape_raw(self, nid: int) -> bytes:
+        body = self._cached(nid)
+        if body is not None:
+            return body
+        body = self.fetch_raw(nid)
+        if not codec.looks_like_json(body):
+            raise ValueError(f"NID {nid}: response body is not JSON")
+        self.save_raw(nid, body)
+        return body
+
+    def fetch_raw(self, nid: int) -> bytes:
+        """GET the provider details for `nid` (no caching, no saving)."""
         url = OPERATIONS_BASE_URL.format(nid)
         logger.debug(f"Starting scrape for NID {nid}: GET {url}")
         resp = safe_get(url, OPERATIONS_HEADERS)
-        data = resp.json()
+        return resp.content
 
+    def save_raw(self, nid: int, data: dict | bytes) -> str:
+        """
+        Write `data` (a payload, or its body bytes as received) to raw_dir
+        as this pipeline's raw JSON for `nid`.
+        """
         # ensure directory exists
         os.makedirs(self.raw_dir, exist_ok=True)
 
         # save raw JSON with pipeline prefix
-        timestamp = datetime.now().strftime("%d_%m_%Y")
-        filename = f"operations_{nid}_{timestamp}.json"
-        filepath = os.path.join(self.raw_dir, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        now = datetime.now()
+        timestamp = now.strftime("%d_%m_%Y")
+        stem = os.path.join(self.raw_dir, f"operations_{nid}_{timestamp}")
+        filepath = write_raw(stem, data)
+        self.raw_index.add(nid, filepath, now.date())
         logger.info(f"[Scraper] Saved raw JSON for NID {nid} → {filepath}")
-
-        return data
+        return filepath
@@ -1,11 +1,9 @@
 # scrapers/rads_scraper.py
 
-import json
 import logging
 import os
 from datetime import datetime
 
-import requests
 import structlog
 
 from aged_care_pipeline.config.global_settings import (
@@ -14,6 +12,9 @@ from aged_care_pipeline.config.global_settings import (
     RADS_RAW_DIR,
 )
 from aged_care_pipeline.interfaces.base_scraper import BaseScraper
+from aged_care_pipeline.storage.raw_store import write_raw
+from aged_care_pipeline.utils import codec
+from aged_care_pipeline.utils.request_handler import safe_get
 
 log = structlog.get_logger(__name__).bind(component="scraper", scraper="rads")
 
@@ -32,25 +33,42 @@ class RadsScraper(BaseScraper):
     def scrape(self, nid: str) -> dict | None:
         """
         Fetch provider details for the given NID and write raw JSON to disk.
+        The body is decoded once and saved exactly as received.
         """
+        body = self.fetch_raw(nid)
+        data = codec.loads(body)
+        self.save_raw(nid, body)
+        return data
+
+    def scrape_raw(self, nid: str) -> bytes:
+        body = self.fetch_raw(nid)
+        if not codec.looks_like_json(body):
+            raise ValueError(f"NID {nid}: response body is not JSON")
+        self.save_raw(nid, body)
+        return body
+
+    def fetch_raw(self, nid: str) -> bytes:
+        """GET the provider details for `nid` without saving them."""
         url = RADS_BASE_URL.format(nid)
         logger.debug(f"Fetching RADS NID {nid}: GET {url}")
-        resp = requests.get(url, headers=RADS_HEADERS)
-        resp.raise_for_status()
-        data = resp.json()
+        resp = safe_get(url, RADS_HEADERS)
+        return resp.content
 
+    def save_raw(self, nid: str, data: dict | bytes) -> str:
+        """
+        Write `data` (a payload, or its body bytes as received) to raw_dir
+        as this pipeline's raw JSON for `nid`.
+        """
         # ensure directory exists
         os.makedirs(self.raw_dir, exist_ok=True)
 
         # save raw JSON with pipeline prefix and date
         timestamp = datetime.now().strftime("%d_%m_%Y")
-        filename = f"rads_{nid}_{timestamp}.json"
-        filepath = os.path.join(self.raw_dir, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        stem = os.path.join(self.raw_dir, f"rads_{nid}_{timestamp}")
+        filepath = write_raw(stem, data)
 
         logger.info(f"[RadsScraper] Saved raw JSON for NID {nid} → {filepath}")
-        return data
+        return filepath
 
 
 def run_scraper(nid: str):
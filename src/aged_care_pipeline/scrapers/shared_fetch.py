@@ -0,0 +1,167 @@
+# scrapers/shared_fetch.py
+"""
+Fetch several pipelines' NIDs in one run.
+
+The operations and rads pipelines call the same details/{nid} endpoint with
+different query strings.  SharedFetcher is the fetch source of a combined
+run.  Whether the two query strings give the same answer is established, not
+assumed: the first `probe` NIDs that several pipelines want are fetched
+through each of them and their bodies compared by sha256.  Once that many
+have matched (and none differed), each shared NID is fetched once and its
+body saved, byte for byte, as every wanting pipeline's raw file.  Every
+`recheck`-th shared NID after that is still fetched through each pipeline and
+compared, and a single mismatch switches sharing off for the rest of the run.
+
+fetch(nid) does one NID's work for every pipeline that wants it (`all
+scrape`); source(name) is one pipeline's view for a streaming run, where the
+pipelines stream side by side: whichever asks for a shared NID first fetches
+it for all of them and hands the others their bodies.
+"""
+
+import contextlib
+import logging
+import threading
+
+from aged_care_pipeline.config.global_settings import (
+    SHARED_FETCH_PROBE,
+    SHARED_FETCH_RECHECK,
+)
+from aged_care_pipeline.storage.journal import body_hash
+
+logger = logging.getLogger(__name__)
+
+
+class SharedFetcher:
+    def __init__(
+        self,
+        jobs: dict[str, tuple[object, list]],
+        concurrency: int | None = None,
+        probe: int | None = None,
+        recheck: int | None = None,
+    ):
+        """
+        jobs: pipeline name → (source, NIDs that pipeline wants), where
+        source.body(nid) fetches the NID's body as received (saving it as
+        that pipeline's raw file) or returns None if it failed,
+        and source.adopt(nid, body) saves another pipeline's body as its
+        own.  With
+        `concurrency`, at most that many NIDs are fetched at once across
+        every source(), however many pipelines are streaming.
+        """
+        self.sources = {name: source for name, (source, _) in jobs.items()}
+        self.nids = {name: list(nids) for name, (_, nids) in jobs.items()}
+        self._wanted = {name: set(nids) for name, nids in self.nids.items()}
+        self.probe = SHARED_FETCH_PROBE if probe is None else probe
+        self.recheck = SHARED_FETCH_RECHECK if recheck is None else recheck
+        # None until the probe decides; False for good after a mismatch
+        self.sharing: bool | None = None if self.probe > 0 else False
+        self.identical = 0
+        self.differing = 0
+        self.shared = 0
+        self._since_check = 0
+        # shared NIDs one pipeline's stream is fetching (or has fetched) for
+        # the others: nid → {"done": Event, "bodies": {name: body}}
+        self._claims: dict[int, dict] = {}
+        self._slots = (
+            threading.BoundedSemaphore(concurrency)
+            if concurrency
+            else contextlib.nullcontext()
+        )
+        self._lock = threading.Lock()
+
+    def union(self) -> list[int]:
+        """Every NID any pipeline wants, in first-seen order."""
+        return list(dict.fromkeys(n for nids in self.nids.values() for n in nids))
+
+    def wanted_by(self, nid: int) -> list[str]:
+        return [name for name, wanted in self._wanted.items() if nid in wanted]
+
+    def _share(self) -> bool:
+        """Fetch the next shared NID once (True) or through each pipeline."""
+        with self._lock:
+            if not self.sharing:
+                return False
+            self._since_check += 1
+            if self.recheck and self._since_check >= self.recheck:
+                self._since_check = 0
+                return False
+            return True
+
+    def _compare(self, nid: int, bodies: dict[str, bytes | None]) -> None:
+        if None in bodies.values():
+            return  # a failed fetch isn't evidence either way
+        digests = {body_hash(body) for body in bodies.values()}
+        with self._lock:
+            if len(digests) > 1:
+                self.differing += 1
+                if self.sharing is not False:
+                    logger.warning(
+                        f"[SharedFetch] NID {nid}: {', '.join(bodies)} got "
+                        "different bodies; every pipeline fetches its own"
+                    )
+                self.sharing = False
+                return
+            self.identical += 1
+            if self.sharing is None and self.identical >= self.probe:
+                self.sharing = True
+                logger.info(
+                    f"[SharedFetch] {self.identical} NIDs gave identical bodies "
+                    f"for {', '.join(bodies)}; fetching shared NIDs once"
+                )
+
+    def fetch(self, nid: int) -> dict[str, bytes | None]:
+        """pipeline → `nid`'s body, for every pipeline that wants `nid`."""
+        wanted = self.wanted_by(nid)
+        with self._slots:
+            if len(wanted) > 1 and self._share():
+                first, *others = wanted
+                body = self.sources[first].body(nid)
+                if body is not None:
+                    for name in others:
+                        self.sources[name].adopt(nid, body)
+                with self._lock:
+                    self.shared += 1
+                return dict.fromkeys(wanted, body)
+            bodies = {name: self.sources[name].body(nid) for name in wanted}
+        if len(wanted) > 1:
+            self._compare(nid, bodies)
+        return bodies
+
+    def source(self, name: str):
+        """`name`'s fetch(nid) → body, sharing NIDs with the other pipelines."""
+        own = self.sources[name]
+
+        def fetch_body(nid: int) -> bytes | None:
+            wanted = self.wanted_by(nid)
+            if len(wanted) < 2:
+                with self._slots:
+                    return own.body(nid)
+            with self._lock:
+                claim = self._claims.get(nid)
+                first = claim is None
+                if first:
+                    claim = {"done": threading.Event(), "bodies": {}}
+                    self._claims[nid] = claim
+            if first:
+                try:
+                    bodies = self.fetch(nid)
+                    claim["bodies"] = {n: b for n, b in bodies.items() if n != name}
+                finally:
+                    claim["done"].set()
+                return bodies[name]
+            claim["done"].wait()
+            with self._lock:
+                body = claim["bodies"].pop(name, None)
+                if not claim["bodies"]:
+                    self._claims.pop(nid, None)
+            return body
+
+        return fetch_body
+
+    def log_stats(self) -> None:
+        if self.identical or self.differing or self.shared:
+            logger.info(
+                f"[SharedFetch] NIDs wanted by several pipelines: {self.shared} "
+                f"fetched once, {self.identical} compared identical, "
+                f"{self.differing} differing"
+            )
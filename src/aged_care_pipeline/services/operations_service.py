@@ -3,13 +3,16 @@
 import os
 from datetime import datetime
 
-import pandas as pd
 import structlog
 
 from aged_care_pipeline.config.global_settings import NIDS_CSV
+from aged_care_pipeline.parsers.executor import ParseExecutor
 from aged_care_pipeline.parsers.operations.operations_parser import OperationsParser
 from aged_care_pipeline.scrapers.operations_scraper import OperationsScraper
+from aged_care_pipeline.services.streaming import StreamingPipeline
 from aged_care_pipeline.utils.limiter import apply_limit
+from aged_care_pipeline.utils.nids import load_nids
+from aged_care_pipeline.utils.request_handler import reset_http_state
 from aged_care_pipeline.writers.csv_writer import CSVWriter
 
 log = structlog.get_logger(__name__).bind(component="scraper", scraper="rads")
@@ -19,18 +22,22 @@ class OperationsService:
     def __init__(self):
         self.scraper = OperationsScraper()
         self.parser = OperationsParser()
-        self.writer = CSVWriter()
+        self.writer = CSVWriter(fieldnames=self.parser.columns)
 
     def run(self) -> None:
+        # scheduled runs share one process; give each a fresh retry budget
+        # and cache counters
+        reset_http_state()
         nids_csv = os.getenv("NIDS_CSV", str(NIDS_CSV))
-        df = pd.read_csv(nids_csv)
-        nids = apply_limit(df.nid.dropna().astype(int).tolist())
-        all_rows = []
-        for i, nid in enumerate(nids, 1):
-            raw = self.scraper.scrape(nid)
-            parsed = self.parser.parse(raw)
-            all_rows.extend(parsed)
-            print(f"[{i}/{len(nids)}] NID {nid} → {len(parsed)} rows")
+        nids = apply_limit(load_nids(nids_csv))
         date = datetime.now().strftime("%Y%m%d")
         out_file = f"operations_{date}.csv"
-        self.writer.write(all_rows, out_file)
+        self.writer.write(self._rows(nids), out_file)
+
+    def _rows(self, nids: list[int]):
+        """Stream parsed rows in NID order while later NIDs are still fetching."""
+        with ParseExecutor(self.parser) as executor:
+            stream = StreamingPipeline(fetch=self.scraper.scrape, executor=executor)
+            for i, (nid, parsed) in enumerate(stream.run(nids), 1):
+                print(f"[{i}/{len(nids)}] NID {nid} → {len(parsed)} rows")
+                yield from parsed
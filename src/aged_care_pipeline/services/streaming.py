@@ -0,0 +1,164 @@
+# services/streaming.py
+"""
+Fetch → parse → write in three stages joined by bounded queues: the fetch
+stage runs on the async engine, the parse stage feeds a ParseExecutor, and
+the caller's thread writes.  Order follows the input NIDs.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import aclosing
+from operator import itemgetter
+
+from aged_care_pipeline.config.global_settings import (
+    SCRAPE_CONCURRENCY,
+    STREAM_QUEUE_SIZE,
+)
+from aged_care_pipeline.parsers.executor import ParseExecutor
+from aged_care_pipeline.utils.async_engine import iter_ordered
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class _Failed:
+    """Carries a stage's exception downstream so the consumer re-raises it."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class StreamingPipeline:
+    def __init__(
+        self,
+        fetch: Callable[[int], dict | None],
+        executor: ParseExecutor,
+        finish: Callable[[int, dict | None, list[dict]], list[dict]] | None = None,
+        concurrency: int | None = None,
+        queue_size: int | None = None,
+    ):
+        """
+        fetch(nid) → payload (runs `concurrency` at a time); payloads are
+        parsed by `executor`; finish(nid, payload, rows) → rows, if given,
+        runs here in NID order on every result (interim files, journaling).
+        """
+        self.fetch = fetch
+        self.executor = executor
+        self.finish = finish
+        self.concurrency = concurrency or SCRAPE_CONCURRENCY
+        self.queue_size = queue_size or STREAM_QUEUE_SIZE
+        self.peak = {"fetched": 0, "parsed": 0}
+
+    def _put(self, q: queue.Queue, item, stop: threading.Event, name: str) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            self.peak[name] = max(self.peak[name], q.qsize())
+            return True
+        return False
+
+    @staticmethod
+    def _get(q: queue.Queue, stop: threading.Event):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def run(self, nids: Iterable[int]) -> Iterator[tuple[int, list[dict]]]:
+        """Yield (nid, rows) in input order as each NID clears the parser."""
+        stop = threading.Event()
+        fetched: queue.Queue = queue.Queue(self.queue_size)
+        parsed: queue.Queue = queue.Queue(self.queue_size)
+        # a stage hit by SystemExit & co. stops every queue and re-raises;
+        # the consumer then raises it too instead of waiting for more
+        interrupted: list[BaseException] = []
+
+        def interrupt(e: BaseException) -> None:
+            interrupted.append(e)
+            stop.set()
+
+        def fetch_stage() -> None:
+            async def pump() -> None:
+                stream = iter_ordered(self.fetch, nids, self.concurrency)
+                async with aclosing(stream) as results:
+                    async for item in results:
+                        if not self._put(fetched, item, stop, "fetched"):
+                            return
+
+            try:
+                asyncio.run(pump())
+            except Exception as e:  # noqa: BLE001 - re-raised by the consumer
+                self._put(fetched, _Failed(e), stop, "fetched")
+                return
+            except BaseException as e:
+                interrupt(e)
+                raise
+            self._put(fetched, _DONE, stop, "fetched")
+
+        def payloads() -> Iterator[tuple[int, dict | None]]:
+            while True:
+                item = self._get(fetched, stop)
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failed):
+                    raise item.error
+                yield item
+
+        def parse_stage() -> None:
+            try:
+                results = self.executor.imap(payloads(), key=itemgetter(1))
+                for (nid, raw), rows in results:
+                    if self.finish is not None:
+                        rows = self.finish(nid, raw, rows)
+                    if not self._put(parsed, (nid, rows), stop, "parsed"):
+                        return
+            except Exception as e:  # noqa: BLE001 - re-raised by the consumer
+                self._put(parsed, _Failed(e), stop, "parsed")
+                return
+            except BaseException as e:
+                interrupt(e)
+                raise
+            self._put(parsed, _DONE, stop, "parsed")
+
+        threads = [
+            threading.Thread(target=fetch_stage, name="stream-fetch", daemon=True),
+            threading.Thread(target=parse_stage, name="stream-parse", daemon=True),
+        ]
+        start = time.perf_counter()
+        count = 0
+        for t in threads:
+            t.start()
+        try:
+            while True:
+                item = self._get(parsed, stop)
+                if item is _DONE:
+                    if interrupted:
+                        raise interrupted[0]
+                    break
+                if isinstance(item, _Failed):
+                    raise item.error
+                count += 1
+                yield item
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+        logger.info(
+            f"[Stream] {count} NIDs in {time.perf_counter() - start:.1f}s "
+            f"(queue peaks: fetched {self.peak['fetched']}/{self.queue_size}, "
+            f"parsed {self.peak['parsed']}/{self.queue_size})"
+        )
+
+    def rows(self, nids: Iterable[int]) -> Iterator[dict]:
+        """Flatten run() into a plain row stream for a writer."""
+        for _, rows in self.run(nids):
+            yield from rows
@@ -0,0 +1,318 @@
+# storage/archive.py
+"""
+Per-run raw archives: <pipeline>_all_raw_<dd_mm_yyyy>[_N].jsonl.gz under
+RAW_DIR/archive/<pipeline>, one JSON line per payload, gzip-compressed in
+blocks of about ARCHIVE_BLOCK_SIZE bytes.  A sidecar <archive>.idx maps
+each NID to its block, so ArchiveReader / ArchiveCache decompress one
+block per NID.  Old list archives are still read by iter_archive().
+"""
+
+import gzip
+import logging
+import mmap
+import os
+import re
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+from aged_care_pipeline.config.global_settings import (
+    ARCHIVE_BLOCK_SIZE,
+    ARCHIVE_COMPRESSION_LEVEL,
+    ARCHIVE_READERS,
+)
+from aged_care_pipeline.storage.raw_index import parse_raw_name
+from aged_care_pipeline.storage.raw_store import read_raw, read_raw_bytes
+from aged_care_pipeline.utils import codec
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SUFFIX = ".jsonl.gz"
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+_ARCHIVE_NAME = re.compile(
+    r"^(?P<pipeline>.+)_all_raw_(?P<date>\d{2}_\d{2}_\d{4})(?:_(?P<seq>\d+))?"
+    + re.escape(ARCHIVE_SUFFIX)
+    + "$"
+)
+
+
+def archive_name(pipeline: str, stamp: str, seq: int = 1) -> str:
+    """'operations', '01_02_2025' → 'operations_all_raw_01_02_2025.jsonl.gz'."""
+    tail = f"_{seq}" if seq > 1 else ""
+    return f"{pipeline}_all_raw_{stamp}{tail}{ARCHIVE_SUFFIX}"
+
+
+def new_archive_path(archive_dir, pipeline: str, stamp: str) -> str:
+    """First unused archive name for the day (..._2, ..._3 for later runs)."""
+    seq = 1
+    while True:
+        path = os.path.join(archive_dir, archive_name(pipeline, stamp, seq))
+        if not os.path.exists(path):
+            return path
+        seq += 1
+
+
+def is_archive(path) -> bool:
+    return str(path).endswith(ARCHIVE_SUFFIX)
+
+
+def index_path(path) -> str:
+    return f"{path}{INDEX_SUFFIX}"
+
+
+def _encode_line(path: str) -> tuple[tuple[int, date] | None, bytes]:
+    """((nid, snapshot) from the file name, the payload as one JSON line)."""
+    blob = read_raw_bytes(path)
+    payload = codec.loads(blob)  # unreadable files are skipped, not archived
+    if b"\n" in blob:
+        blob = codec.dumps(payload)  # pretty-printed; lines must be compact
+    parsed = parse_raw_name(os.path.basename(path))
+    return (parsed[1:] if parsed else None), blob + b"\n"
+
+
+def _read_ahead(
+    fn: Callable[[str], tuple], items: Iterable[str], readers: int
+) -> Iterator[tuple[str, tuple | None, Exception | None]]:
+    """
+    Yield (item, fn(item), None) in input order, running fn on `readers`
+    threads with at most readers*4 results in flight; a file that can't be
+    read or decoded is yielded as (item, None, error) instead of raised.
+    """
+    with ThreadPoolExecutor(readers, thread_name_prefix="archive-read") as pool:
+        pending: deque = deque()
+        items = iter(items)
+        while True:
+            while len(pending) < readers * 4:
+                item = next(items, None)
+                if item is None:
+                    break
+                pending.append((item, pool.submit(fn, item)))
+            if not pending:
+                return
+            item, future = pending.popleft()
+            try:
+                yield item, future.result(), None
+            # gzip.BadGzipFile is an OSError, a cut-off member an EOFError
+            except (OSError, EOFError, ValueError) as e:
+                yield item, None, e
+
+
+def write_archive(
+    path: str,
+    raw_paths: Iterable[str],
+    level: int | None = None,
+    readers: int | None = None,
+    block_size: int | None = None,
+) -> tuple[list[str], list[str]]:
+    """
+    Stream every raw file in `raw_paths` into the archive at `path` and
+    write its index.  Returns (archived, skipped): the files written and
+    the unreadable ones.  A NID archived from several snapshots is indexed
+    at its latest.
+    """
+    level = ARCHIVE_COMPRESSION_LEVEL if level is None else level
+    readers = max(1, readers or ARCHIVE_READERS)
+    block_size = max(1, block_size or ARCHIVE_BLOCK_SIZE)
+    archived, skipped = [], []
+    # nid → [snapshot, block offset, block length, line start, line length]
+    index: dict[int, list] = {}
+    block = bytearray()
+    lines: list[tuple[tuple[int, date] | None, int, int]] = []
+    offset = 0
+    tmp, idx_tmp = path + ".tmp", index_path(path) + ".tmp"
+
+    def flush(out) -> None:
+        nonlocal offset
+        member = gzip.compress(bytes(block), compresslevel=level, mtime=0)
+        out.write(member)
+        for key, start, length in lines:
+            if key is None:
+                continue
+            nid, snapshot = key
+            known = index.get(nid)
+            if known is None or snapshot.isoformat() >= known[0]:
+                index[nid] = [snapshot.isoformat(), offset, len(member), start, length]
+        offset += len(member)
+        block.clear()
+        lines.clear()
+
+    try:
+        with open(tmp, "wb") as out:
+            for p, result, error in _read_ahead(_encode_line, raw_paths, readers):
+                if error is not None:
+                    logger.warning(f"[Archive] Skipping {p}: {error}")
+                    skipped.append(p)
+                    continue
+                key, line = result
+                lines.append((key, len(block), len(line)))
+                block += line
+                archived.append(p)
+                if len(block) >= block_size:
+                    flush(out)
+            if block:
+                flush(out)
+        with open(idx_tmp, "wb") as f:
+            f.write(
+                codec.dumps({"version": INDEX_VERSION, "size": offset, "nids": index})
+            )
+        os.replace(tmp, path)
+        os.replace(idx_tmp, index_path(path))
+    except BaseException:
+        for leftover in (tmp, idx_tmp):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+        raise
+    return archived, skipped
+
+
+def iter_archive(path) -> Iterator[dict]:
+    """Yield the payloads of an archive, new (.jsonl.gz) or old (JSON list)."""
+    if not is_archive(path):
+        data = read_raw(path)
+        yield from data if isinstance(data, list) else [data]
+        return
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield codec.loads(line)
+
+
+class ArchiveReader:
+    """
+    Random access to one archive through its sidecar index.  Raises
+    FileNotFoundError without an index and ValueError if the index doesn't
+    belong to the archive on disk.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(index_path(self.path), "rb") as f:
+            meta = codec.loads(f.read())
+        self._file = open(self.path, "rb")  # noqa: SIM115 - held until close()
+        size = os.fstat(self._file.fileno()).st_size
+        if meta.get("version") != INDEX_VERSION or meta.get("size") != size:
+            self._file.close()
+            raise ValueError(f"stale or unknown index for {self.path}")
+        self.index = {int(nid): entry for nid, entry in meta["nids"].items()}
+        self._map = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        )
+
+    def __contains__(self, nid) -> bool:
+        return int(nid) in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def nids(self) -> list[int]:
+        return sorted(self.index)
+
+    def _block(self, offset: int, length: int) -> bytes:
+        return gzip.decompress(self._map[offset : offset + length])
+
+    def get_raw(self, nid: int) -> bytes | None:
+        """`nid`'s payload as JSON bytes, or None if the archive doesn't hold it."""
+        entry = self.index.get(int(nid))
+        if entry is None:
+            return None
+        _, offset, length, start, size = entry
+        return self._block(offset, length)[start : start + size].rstrip(b"\n")
+
+    def get(self, nid: int) -> dict | None:
+        """`nid`'s payload, or None if the archive doesn't hold it."""
+        blob = self.get_raw(nid)
+        return None if blob is None else codec.loads(blob)
+
+    def get_many(self, nids: Iterable[int]) -> dict[int, dict]:
+        """Payloads for each of `nids` held here; each block is read once."""
+        by_block: dict[tuple[int, int], list[tuple[int, int, int]]] = {}
+        for nid in nids:
+            entry = self.index.get(int(nid))
+            if entry is not None:
+                _, offset, length, start, size = entry
+                by_block.setdefault((offset, length), []).append(
+                    (int(nid), start, size)
+                )
+        found = {}
+        for (offset, length), wanted in sorted(by_block.items()):
+            block = self._block(offset, length)
+            for nid, start, size in wanted:
+                found[nid] = codec.loads(block[start : start + size])
+        return found
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _archive_order(name: str) -> tuple[date, int] | None:
+    """(snapshot date, run of the day) for an archive name, or None."""
+    m = _ARCHIVE_NAME.match(name)
+    if not m:
+        return None
+    return datetime.strptime(m["date"], "%d_%m_%Y").date(), int(m["seq"] or 1)
+
+
+class ArchiveCache:
+    """
+    Payload lookup across every indexed archive in `archive_dir`, newest
+    archive first.  Archives are opened on first use; ones without a usable
+    index are skipped.
+    """
+
+    def __init__(self, archive_dir):
+        self.archive_dir = Path(archive_dir)
+        self._readers: list[ArchiveReader] | None = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> list[ArchiveReader]:
+        with self._lock:
+            if self._readers is not None:
+                return self._readers
+            dated = []
+            if self.archive_dir.is_dir():
+                for p in self.archive_dir.iterdir():
+                    order = _archive_order(p.name)
+                    if order is not None:
+                        dated.append((order, p))
+            readers = []
+            for _, p in sorted(dated, reverse=True):
+                try:
+                    readers.append(ArchiveReader(p))
+                except (OSError, ValueError) as e:
+                    logger.debug(f"[Archive] Not using {p}: {e}")
+            self._readers = readers
+            logger.debug(
+                f"[Archive] {len(readers)} indexed archive(s) in {self.archive_dir}"
+            )
+            return readers
+
+    def lookup_raw(self, nid: int) -> tuple[str, bytes] | None:
+        """(archive path, payload JSON bytes) from the newest archive holding `nid`."""
+        for reader in self._open():
+            if nid in reader:
+                return reader.path, reader.get_raw(nid)
+        return None
+
+    def lookup(self, nid: int) -> tuple[str, dict] | None:
+        """(archive path, payload) from the newest archive holding `nid`."""
+        found = self.lookup_raw(nid)
+        return None if found is None else (found[0], codec.loads(found[1]))
+
+    def close(self) -> None:
+        with self._lock:
+            for reader in self._readers or ():
+                reader.close()
+            self._readers = None
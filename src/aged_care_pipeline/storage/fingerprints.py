@@ -0,0 +1,141 @@
+# storage/fingerprints.py
+"""
+Per-NID fingerprints and rows from the last successful run.
+
+Incremental runs (`run --incremental`) compare each fetched payload's
+fingerprint (the sha256 the run journal already records) with the one
+stored here.  A match means the provider hasn't changed: it is neither
+parsed nor given an interim file, and its stored rows are carried forward
+into the output.  Everything else is parsed as usual and staged in a
+temporary table; commit() copies the staged NIDs over in one transaction
+once the run has succeeded, so an interrupted run never leaves
+fingerprints for rows that weren't written.
+
+One SQLite file per pipeline under STATE_DIR.  Fingerprints are loaded
+into memory up front (one short string per NID); rows are read per NID
+only when carried forward.  The store also remembers the parser's
+schema_id(); opening it with a different one (new columns or a bumped
+parser version) drops every fingerprint, so the next run re-parses all.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from aged_care_pipeline.utils import codec
+
+logger = logging.getLogger(__name__)
+
+
+class FingerprintStore:
+    def __init__(self, path, schema: str | None = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # the fetch and parse stages run on different threads
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS fingerprints ("
+                "nid INTEGER PRIMARY KEY, fingerprint TEXT NOT NULL, "
+                "rows TEXT NOT NULL, run_id TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            if schema is not None:
+                self._check_schema(schema)
+            self._fingerprints = dict(
+                self._conn.execute("SELECT nid, fingerprint FROM fingerprints")
+            )
+        # a connection-private table: rows wait on disk, not in memory, and
+        # vanish with the connection if the run never commits
+        with self._lock:
+            self._conn.execute(
+                "CREATE TEMP TABLE staged (nid INTEGER PRIMARY KEY, "
+                "fingerprint TEXT NOT NULL, rows TEXT NOT NULL)"
+            )
+        self.carried = 0
+
+    def _check_schema(self, schema: str) -> None:
+        found = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'schema'"
+        ).fetchone()
+        if found is not None and found[0] == schema:
+            return
+        if found is not None:
+            dropped = self._conn.execute("DELETE FROM fingerprints").rowcount
+            logger.warning(
+                f"[Incremental] Parser schema changed ({found[0]} → {schema}); "
+                f"dropped {dropped} fingerprints from {self.path}"
+            )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (schema,)
+        )
+
+    @classmethod
+    def open(
+        cls, state_dir, pipeline: str, schema: str | None = None
+    ) -> "FingerprintStore":
+        return cls(os.path.join(state_dir, f"{pipeline}.sqlite"), schema=schema)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def unchanged(self, nid: int, fingerprint: str | None) -> bool:
+        """True if `nid` had this fingerprint in the last successful run."""
+        return fingerprint is not None and self._fingerprints.get(nid) == fingerprint
+
+    def rows(self, nid: int) -> list[dict]:
+        """The rows stored for `nid` (counted as carried forward)."""
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT rows FROM fingerprints WHERE nid = ?", (nid,)
+            ).fetchone()
+        if found is None:
+            raise KeyError(nid)
+        self.carried += 1
+        return codec.loads(found[0])
+
+    def stage(self, nid: int, fingerprint: str, rows: list[dict]) -> None:
+        """Remember a freshly parsed NID; saved by commit()."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO staged (nid, fingerprint, rows) "
+                "VALUES (?, ?, ?)",
+                (nid, fingerprint, codec.dumps(rows).decode("utf-8")),
+            )
+
+    def commit(self, run_id: str | None = None) -> int:
+        """Save every staged NID in one transaction; returns how many."""
+        with self._lock, self._conn:
+            staged = dict(self._conn.execute("SELECT nid, fingerprint FROM staged"))
+            # "WHERE true" keeps SQLite from reading ON CONFLICT as a join
+            self._conn.execute(
+                "INSERT INTO fingerprints (nid, fingerprint, rows, run_id) "
+                "SELECT nid, fingerprint, rows, ? FROM staged WHERE true "
+                "ON CONFLICT (nid) DO UPDATE SET "
+                "fingerprint = excluded.fingerprint, rows = excluded.rows, "
+                "run_id = excluded.run_id",
+                (run_id,),
+            )
+            self._conn.execute("DELETE FROM staged")
+        self._fingerprints.update(staged)
+        saved = len(staged)
+        logger.info(
+            f"[Incremental] {self.carried} unchanged NIDs carried forward, "
+            f"{saved} parsed and saved to {self.path}"
+        )
+        return saved
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,177 @@
+# storage/journal.py
+"""
+Append-only run journal for crash-safe, resumable runs.
+
+Each run gets data/journal/<pipeline>/<run_id>.jsonl.  The first line
+describes the run; after that every line records one NID reaching a state:
+
+    {"nid": 123, "state": "fetched", "body_sha256": "…", "bytes": 2048}
+    {"nid": 123, "state": "parsed", "path": "…/<run_id>_parsed.jsonl",
+     "offset": 0, "length": 512, "rows": 1}
+    {"nid": 123, "state": "written"}
+
+body_sha256 is the hash of the response body as stored.  Lines are flushed
+as they're written and fsynced every `fsync_every` records, so after a
+crash the journal is at most a few records behind.  A half-written last
+line is ignored on load.
+"""
+
+import hashlib
+import logging
+import os
+import secrets
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from aged_care_pipeline.utils import codec
+
+logger = logging.getLogger(__name__)
+
+STATES = ("fetched", "parsed", "written")
+
+
+def new_run_id() -> str:
+    """Timestamp plus a random suffix: runs started in one second differ."""
+    return f"{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(3)}"
+
+
+def body_hash(blob: bytes) -> str:
+    """sha256 of a payload's JSON bytes exactly as stored."""
+    return hashlib.sha256(blob).hexdigest()
+
+
+class RunJournal:
+    def __init__(self, path, fsync_every: int = 50):
+        self.path = Path(path)
+        self.fsync_every = fsync_every
+        self.run_id = self.path.stem
+        self.header: dict = {}
+        self.entries: dict[int, dict] = {}
+        self.complete = False
+        self._lock = threading.Lock()
+        self._pending = 0
+        if self.path.exists():
+            self._load()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # held open for the run and closed by close()
+        self._fh = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+        if self._torn_tail():
+            # start the next record on its own line
+            self._fh.write("\n")
+
+    @classmethod
+    def start(cls, journal_dir, pipeline: str, run_id: str | None = None, **info):
+        """
+        Open a fresh journal for a new run and write its header line.
+        Raises FileExistsError if `run_id` already has a journal: a new run
+        never takes over another run's state (that's what resume() is for).
+        """
+        run_id = run_id or new_run_id()
+        path = Path(journal_dir) / pipeline / f"{run_id}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "x", encoding="utf-8"):
+            pass
+        journal = cls(path)
+        journal.header = {
+            "event": "start",
+            "run_id": run_id,
+            "pipeline": pipeline,
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            **info,
+        }
+        journal._append(journal.header)
+        return journal
+
+    @classmethod
+    def resume(cls, journal_dir, pipeline: str, run_id: str):
+        """Re-open an existing run's journal; raises if it doesn't exist."""
+        path = Path(journal_dir) / pipeline / f"{run_id}.jsonl"
+        if not path.exists():
+            raise FileNotFoundError(f"No journal for run {run_id!r} at {path}")
+        journal = cls(path)
+        journal._append(
+            {"event": "resume", "ts": datetime.now().isoformat(timespec="seconds")}
+        )
+        logger.info(
+            f"[Journal] Resuming run {run_id}: "
+            + ", ".join(f"{len(journal.nids_in(s))} {s}" for s in STATES)
+        )
+        return journal
+
+    def _load(self) -> None:
+        with open(self.path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, start=1):
+                try:
+                    rec = codec.loads(line)
+                except ValueError:
+                    logger.warning(
+                        f"[Journal] Ignoring torn record at {self.path}:{lineno}"
+                    )
+                    continue
+                if "nid" in rec:
+                    self.entries.setdefault(rec["nid"], {}).update(rec)
+                elif rec.get("event") == "start":
+                    self.header = rec
+                elif rec.get("event") == "complete":
+                    self.complete = True
+
+    def _torn_tail(self) -> bool:
+        if self.path.stat().st_size == 0:
+            return False
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+
+    def _append(self, rec: dict) -> None:
+        line = codec.dumps(rec).decode("utf-8")
+        with self._lock:
+            self._fh.write(line + "\n")
+            self._fh.flush()
+            self._pending += 1
+            if self._pending >= self.fsync_every:
+                os.fsync(self._fh.fileno())
+                self._pending = 0
+
+    def record(self, nid: int, state: str, **info) -> None:
+        """Append `nid` reaching `state` (one of STATES)."""
+        if state not in STATES:
+            raise ValueError(f"unknown journal state {state!r}")
+        rec = {"nid": nid, "state": state, **info}
+        self._append(rec)
+        with self._lock:
+            self.entries.setdefault(nid, {}).update(rec)
+
+    def record_many(self, nids, state: str) -> None:
+        for nid in nids:
+            self.record(nid, state)
+
+    def state_of(self, nid: int) -> dict:
+        """Everything recorded for `nid` (latest state under "state")."""
+        with self._lock:
+            return dict(self.entries.get(nid, {}))
+
+    def nids_in(self, state: str) -> set[int]:
+        """NIDs whose latest state is `state`."""
+        with self._lock:
+            return {n for n, e in self.entries.items() if e.get("state") == state}
+
+    def mark_complete(self) -> None:
+        self._append(
+            {"event": "complete", "ts": datetime.now().isoformat(timespec="seconds")}
+        )
+        self.complete = True
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
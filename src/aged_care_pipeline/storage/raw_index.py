@@ -0,0 +1,106 @@
+# storage/raw_index.py
+"""
+In-memory index over raw payload directories.
+
+Raw payloads are saved as <prefix>_<nid>_<dd_mm_yyyy>.json[.gz|.zst] (older
+fixtures use <nid>_<yyyymmdd>.json).  Rather than globbing a directory for
+every NID, RawIndex scans each directory once, keys files by exact NID and
+snapshot date, and is kept current as the scraper writes new files, so a
+cache lookup is a dict hit instead of an O(files) substring match.
+"""
+
+import logging
+import os
+import re
+import threading
+from datetime import date, datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_RAW_NAME = re.compile(
+    r"^(?:(?P<prefix>[A-Za-z]+)_)?(?P<nid>\d+)_(?P<date>\d{2}_\d{2}_\d{4}|\d{8})"
+    r"\.json(?:\.gz|\.zst)?$"
+)
+
+
+def parse_raw_name(name: str) -> tuple[str | None, int, date] | None:
+    """Split a raw file name into (prefix, nid, snapshot date), or None."""
+    m = _RAW_NAME.match(name)
+    if not m:
+        return None
+    stamp = m.group("date")
+    fmt = "%d_%m_%Y" if "_" in stamp else "%Y%m%d"
+    try:
+        snapshot = datetime.strptime(stamp, fmt).date()
+    except ValueError:
+        return None
+    return m.group("prefix"), int(m.group("nid")), snapshot
+
+
+class RawIndex:
+    """
+    Exact-NID index over one or more raw directories.
+
+    Directories are searched in the order given (the first one holding a
+    NID wins, like the old raw_dir → alt_dir fallback).  Within a directory
+    the most recent snapshot is returned unless a date is asked for.  Files
+    whose prefix belongs to another pipeline are ignored.
+    """
+
+    def __init__(self, *dirs, prefix: str | None = None):
+        self.dirs = [Path(d) for d in dirs if d]
+        self.prefix = prefix
+        self._entries: list[dict[int, dict[date, Path]]] = []
+        self._built = False
+        self._lock = threading.Lock()
+
+    def _accepts(self, prefix: str | None) -> bool:
+        return prefix is None or self.prefix is None or prefix == self.prefix
+
+    def build(self) -> None:
+        """Scan every directory once (idempotent)."""
+        with self._lock:
+            if self._built:
+                return
+            for d in self.dirs:
+                entries: dict[int, dict[date, Path]] = {}
+                if d.is_dir():
+                    with os.scandir(d) as it:
+                        for e in it:
+                            parsed = parse_raw_name(e.name)
+                            if parsed and self._accepts(parsed[0]) and e.is_file():
+                                _, nid, snapshot = parsed
+                                entries.setdefault(nid, {})[snapshot] = Path(e.path)
+                self._entries.append(entries)
+            self._built = True
+            logger.debug(
+                f"[RawIndex] Indexed {len(self)} NIDs across {len(self.dirs)} dir(s)"
+            )
+
+    def lookup(self, nid: int, snapshot: date | None = None) -> Path | None:
+        """Path of the cached payload for exactly `nid`, or None."""
+        self.build()
+        nid = int(nid)
+        with self._lock:
+            for entries in self._entries:
+                by_date = entries.get(nid)
+                if not by_date:
+                    continue
+                if snapshot is None:
+                    return by_date[max(by_date)]
+                if snapshot in by_date:
+                    return by_date[snapshot]
+        return None
+
+    def add(self, nid: int, path, snapshot: date | None = None) -> None:
+        """Record a freshly written payload in the primary directory's slot."""
+        self.build()
+        with self._lock:
+            if not self._entries:
+                self._entries.append({})
+            by_date = self._entries[0].setdefault(int(nid), {})
+            by_date[snapshot or date.today()] = Path(path)
+
+    def __len__(self) -> int:
+        return len(set().union(*self._entries)) if self._entries else 0
@@ -0,0 +1,172 @@
+# storage/raw_store.py
+"""
+Read and write raw payload files.
+
+Payloads are written as compact JSON, optionally gzip- or zstd-compressed
+(RAW_FORMAT / RAW_COMPRESSION_LEVEL).  A response body passed in as bytes
+is stored exactly as received (compressed if asked), never decoded and
+re-encoded; a decoded payload is serialised.  The format is carried in the file
+suffix (.json, .json.gz, .json.zst), so readers decompress transparently no
+matter which format a file was written in.  Bytes and time spent writing
+are tallied per run and reported by log_raw_stats().
+"""
+
+import gzip
+import logging
+import os
+import threading
+import time
+
+from aged_care_pipeline.config.global_settings import (
+    RAW_COMPRESSION_LEVEL,
+    RAW_FORMAT,
+)
+from aged_care_pipeline.utils import codec
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install aged_care_pipeline[zstd]
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+RAW_SUFFIXES = {"json": ".json", "gzip": ".json.gz", "zstd": ".json.zst"}
+
+_stats_lock = threading.Lock()
+_stats = {"files": 0, "json_bytes": 0, "disk_bytes": 0, "seconds": 0.0}
+
+
+def _require_zstd():
+    if zstandard is None:
+        raise RuntimeError(
+            "zstd raw files need the 'zstandard' package "
+            "(pip install aged_care_pipeline[zstd])"
+        )
+    return zstandard
+
+
+def raw_suffix(fmt: str | None = None) -> str:
+    """File suffix for `fmt` (default RAW_FORMAT)."""
+    fmt = fmt or RAW_FORMAT
+    try:
+        return RAW_SUFFIXES[fmt]
+    except KeyError:
+        raise ValueError(
+            f"unknown raw format {fmt!r}; expected one of {sorted(RAW_SUFFIXES)}"
+        ) from None
+
+
+def is_raw_file(name) -> bool:
+    return str(name).endswith(tuple(RAW_SUFFIXES.values()))
+
+
+def strip_raw_suffix(name: str) -> str:
+    """'operations_1_01_02_2025.json.gz' → 'operations_1_01_02_2025'."""
+    for suffix in sorted(RAW_SUFFIXES.values(), key=len, reverse=True):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+def encode_raw(
+    data, fmt: str | None = None, level: int | None = None
+) -> tuple[bytes, int]:
+    """
+    Serialise `data` as compact JSON (bytes are taken as JSON already) and
+    compress it for `fmt`.  Returns the bytes to write and the size of the
+    uncompressed JSON.
+    """
+    fmt = fmt or RAW_FORMAT
+    level = RAW_COMPRESSION_LEVEL if level is None else level
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        blob = bytes(data)
+    else:
+        blob = codec.dumps(data)
+    if fmt == "gzip":
+        return gzip.compress(blob, compresslevel=level, mtime=0), len(blob)
+    if fmt == "zstd":
+        return _require_zstd().ZstdCompressor(level=level).compress(blob), len(blob)
+    raw_suffix(fmt)  # validate
+    return blob, len(blob)
+
+
+def decompress_raw(blob: bytes, name: str = ".json") -> bytes:
+    """The JSON bytes in a raw file's contents; the format is taken from `name`."""
+    name = str(name)
+    if name.endswith(".gz"):
+        return gzip.decompress(blob)
+    if name.endswith(".zst"):
+        zstd = _require_zstd()
+        try:
+            return zstd.ZstdDecompressor().decompress(blob)
+        except zstd.ZstdError as e:
+            raise ValueError(f"corrupt zstd data: {e}") from e
+    return blob
+
+
+def decode_raw(blob: bytes, name: str = ".json"):
+    """Inverse of encode_raw; the format is taken from `name`'s suffix."""
+    return codec.loads(decompress_raw(blob, name))
+
+
+def write_raw(path_stem, data, fmt: str | None = None) -> str:
+    """
+    Write `data` (a payload, or its JSON bytes as received) to `path_stem`
+    + the format's suffix and return the full path.  Bytes and time are
+    added to this run's raw stats.
+    """
+    start = time.perf_counter()
+    path = f"{path_stem}{raw_suffix(fmt)}"
+    blob, json_bytes = encode_raw(data, fmt)
+    with open(path, "wb") as f:
+        f.write(blob)
+    elapsed = time.perf_counter() - start
+    with _stats_lock:
+        _stats["files"] += 1
+        _stats["json_bytes"] += json_bytes
+        _stats["disk_bytes"] += len(blob)
+        _stats["seconds"] += elapsed
+    return path
+
+
+def read_raw(path):
+    """Load a raw payload written in any supported format."""
+    return codec.loads(read_raw_bytes(path))
+
+
+def read_raw_bytes(path) -> bytes:
+    """A raw file's JSON bytes, decompressed but not decoded."""
+    with open(path, "rb") as f:
+        return decompress_raw(f.read(), os.fspath(path))
+
+
+def list_raw_files(raw_dir) -> list[str]:
+    """Every raw payload file directly under `raw_dir`, whatever its format."""
+    if not os.path.isdir(raw_dir):
+        return []
+    with os.scandir(raw_dir) as it:
+        return sorted(e.path for e in it if e.is_file() and is_raw_file(e.name))
+
+
+def raw_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_raw_stats() -> None:
+    with _stats_lock:
+        _stats.update(files=0, json_bytes=0, disk_bytes=0, seconds=0.0)
+
+
+def log_raw_stats() -> None:
+    """One line summarising the raw files written this run."""
+    s = raw_stats()
+    if not s["files"]:
+        return
+    saved = 1 - s["disk_bytes"] / s["json_bytes"] if s["json_bytes"] else 0.0
+    logger.info(
+        f"[RawStore] {s['files']} files as {RAW_FORMAT}: "
+        f"{s['json_bytes'] / 1e6:.2f} MB JSON → {s['disk_bytes'] / 1e6:.2f} MB "
+        f"on disk ({saved:.0%} saved), {s['seconds']:.2f}s writing "
+        f"({s['seconds'] / s['files'] * 1000:.2f} ms/file)"
+    )
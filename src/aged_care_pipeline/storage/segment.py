@@ -0,0 +1,179 @@
+# storage/segment.py
+"""
+Append-only interim segment: one file per run instead of one per NID.
+
+`run` keeps each NID's parsed rows until the output is written, so an
+interrupted run can be resumed without re-parsing.  Rather than a
+<prefix>_<nid>_<date>_parsed.json per NID, they go into a single
+<prefix>_<run_id>_parsed.jsonl in the pipeline's interim dir, one compact
+JSON line per NID:
+
+    {"nid": 123, "rows": [{...}, ...]}
+
+SegmentWriter buffers lines and writes them INTERIM_BATCH_SIZE records at
+a time (or once INTERIM_FSYNC_SECONDS pass), fsyncing after each batch.
+append() returns the record's (offset, length), which the run journal
+keeps, so a resumed run reads one NID back with a single seek.  Records a
+crash left unwritten are simply parsed again, and a half-written last line
+is cut off before the segment is appended to.  Cleanup removes the whole
+segment with one unlink.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from aged_care_pipeline.config.global_settings import (
+    INTERIM_BATCH_SIZE,
+    INTERIM_FSYNC_SECONDS,
+)
+from aged_care_pipeline.utils import codec
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = "_parsed.jsonl"
+
+
+def segment_name(prefix: str, run_id: str) -> str:
+    """'operations', '20250201_120000' → 'operations_20250201_120000_parsed.jsonl'."""
+    return f"{prefix}_{run_id}{SEGMENT_SUFFIX}"
+
+
+def _complete_size(path: Path) -> int:
+    """Size of `path` up to and including its last newline."""
+    size = path.stat().st_size
+    with open(path, "rb") as f:
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            chunk = f.read(end - start)
+            cut = chunk.rfind(b"\n")
+            if cut >= 0:
+                return start + cut + 1
+            end = start
+    return 0
+
+
+class SegmentWriter:
+    def __init__(
+        self,
+        path,
+        batch_size: int | None = None,
+        fsync_seconds: float | None = None,
+    ):
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size or INTERIM_BATCH_SIZE)
+        self.fsync_seconds = (
+            INTERIM_FSYNC_SECONDS if fsync_seconds is None else fsync_seconds
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            complete = _complete_size(self.path)
+            if complete != self.path.stat().st_size:
+                logger.warning(f"[Segment] Cutting a torn record off {self.path}")
+                os.truncate(self.path, complete)
+        # held open for the run and closed by close()
+        self._fh = open(self.path, "ab")  # noqa: SIM115
+        self._end = self._fh.tell()
+        self._buffer = bytearray()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def append(self, nid: int, rows: list[dict]) -> tuple[int, int]:
+        """Queue `nid`'s rows; returns the record's (offset, length)."""
+        line = codec.dumps({"nid": nid, "rows": rows}) + b"\n"
+        with self._lock:
+            offset = self._end + len(self._buffer)
+            self._buffer += line
+            self._pending += 1
+            self.count += 1
+            if (
+                self._pending >= self.batch_size
+                or time.monotonic() - self._last_sync >= self.fsync_seconds
+            ):
+                self._sync()
+        return offset, len(line)
+
+    def _sync(self) -> None:
+        if self._buffer:
+            self._fh.write(self._buffer)
+            self._end += len(self._buffer)
+            self._buffer.clear()
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def flush(self) -> None:
+        """Write and fsync everything appended so far."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh.closed:
+                return
+            self._sync()
+            self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SegmentReader:
+    """Read records back from a segment (for resuming runs and debugging)."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def __iter__(self) -> Iterator[tuple[int, list[dict]]]:
+        """(nid, rows) for every complete record, in the order written."""
+        with open(self.path, "rb") as f:
+            for lineno, line in enumerate(f, start=1):
+                try:
+                    rec = codec.loads(line)
+                except ValueError:
+                    logger.warning(
+                        f"[Segment] Ignoring torn record at {self.path}:{lineno}"
+                    )
+                    continue
+                yield rec["nid"], rec["rows"]
+
+    def read_at(self, offset: int, length: int) -> tuple[int, list[dict]]:
+        """The record at `offset`; ValueError if it isn't (fully) on disk."""
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            line = f.read(length)
+        if len(line) != length or not line.endswith(b"\n"):
+            raise ValueError(f"no complete record at {self.path}:{offset}")
+        rec = codec.loads(line)
+        return rec["nid"], rec["rows"]
+
+    def rows(self, nid: int) -> list[dict] | None:
+        """`nid`'s rows (its last record), or None if it isn't in the segment."""
+        found = None
+        for n, rows in self:
+            if n == nid:
+                found = rows
+        return found
+
+    def summary(self) -> dict:
+        nids, rows = set(), 0
+        for nid, batch in self:
+            nids.add(nid)
+            rows += len(batch)
+        return {
+            "path": str(self.path),
+            "bytes": self.path.stat().st_size,
+            "nids": len(nids),
+            "rows": rows,
+        }
@@ -0,0 +1,86 @@
+# utils/async_engine.py
+"""
+Bounded-concurrency asyncio engine used by the scrapers.
+
+Scrapes are blocking (requests under the hood), so each call is pushed onto a
+dedicated thread pool from an asyncio event loop.  A semaphore caps how many
+calls are in flight and results are always handed back in input order, no
+matter which request finishes first.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def iter_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int,
+    window: int | None = None,
+) -> AsyncIterator[tuple[T, R]]:
+    """
+    Run fn(item) for every item with at most `concurrency` calls in flight
+    and yield (item, result) pairs in input order.
+
+    `window` bounds how far ahead of the oldest unfinished item we schedule
+    work (default 2 × concurrency), so a single slow request can't make the
+    reorder buffer grow without limit.  Exceptions from fn propagate and
+    cancel whatever is still pending.
+    """
+    concurrency = max(1, int(concurrency))
+    window = max(concurrency, window or concurrency * 2)
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(concurrency)
+    source = iter(items)
+    pending: deque[tuple[T, asyncio.Future]] = deque()
+
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="scrape"
+    ) as pool:
+
+        async def _run(item: T) -> R:
+            async with sem:
+                return await loop.run_in_executor(pool, fn, item)
+
+        def _fill() -> None:
+            while len(pending) < window:
+                try:
+                    item = next(source)
+                except StopIteration:
+                    return
+                pending.append((item, asyncio.ensure_future(_run(item))))
+
+        try:
+            _fill()
+            while pending:
+                item, task = pending.popleft()
+                result = await task
+                _fill()
+                yield item, result
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+
+async def map_ordered(
+    fn: Callable[[T], R], items: Iterable[T], concurrency: int
+) -> list[R]:
+    """Collect iter_ordered() into a list of results (input order)."""
+    return [result async for _, result in iter_ordered(fn, items, concurrency)]
+
+
+def run_ordered(fn: Callable[[T], R], items: Iterable[T], concurrency: int) -> list[R]:
+    """
+    Synchronous entry-point: spin up an event loop, run everything with
+    bounded concurrency and return the results in input order.
+    """
+    return asyncio.run(map_ordered(fn, items, concurrency))
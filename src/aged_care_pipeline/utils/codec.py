@@ -0,0 +1,170 @@
+# utils/codec.py
+"""
+One JSON codec for every stage: response bodies, raw payloads, interim
+segments, archives, journals and the CLI's parse/write files.
+
+dumps() returns UTF-8 bytes, compact unless pretty=True (2-space indent),
+with non-ASCII kept as is and non-string keys written as strings; loads()
+takes bytes, bytearray, memoryview or str.  Both go through the fastest
+backend installed — orjson, then msgspec, then the stdlib json module —
+or the one named by JSON_CODEC.  Every backend's decode errors are raised
+as ValueError.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from aged_care_pipeline.config.global_settings import JSON_CODEC
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+class StdlibCodec:
+    name = "json"
+
+    def dumps(
+        self,
+        obj,
+        pretty: bool = False,
+        sort_keys: bool = False,
+        default: Callable | None = None,
+    ) -> bytes:
+        text = json.dumps(
+            obj,
+            ensure_ascii=False,
+            indent=2 if pretty else None,
+            separators=None if pretty else (",", ":"),
+            sort_keys=sort_keys,
+            default=default,
+        )
+        return text.encode("utf-8")
+
+    def loads(self, data) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(
+        self,
+        obj,
+        pretty: bool = False,
+        sort_keys: bool = False,
+        default: Callable | None = None,
+    ) -> bytes:
+        orjson = self._orjson
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+
+    def loads(self, data) -> Any:
+        return self._orjson.loads(data)  # JSONDecodeError is a ValueError
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder()
+        self._sorted = msgspec.json.Encoder(order="sorted")
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(
+        self,
+        obj,
+        pretty: bool = False,
+        sort_keys: bool = False,
+        default: Callable | None = None,
+    ) -> bytes:
+        msgspec = self._msgspec
+        if default is not None:
+            encoder = msgspec.json.Encoder(
+                enc_hook=default, order="sorted" if sort_keys else None
+            )
+        else:
+            encoder = self._sorted if sort_keys else self._encoder
+        blob = encoder.encode(obj)
+        return msgspec.json.format(blob, indent=2) if pretty else blob
+
+    def loads(self, data) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {"orjson": OrjsonCodec, "msgspec": MsgspecCodec, "json": StdlibCodec}
+
+
+def get_codec(name: str = "auto"):
+    """
+    The codec for `name` ("auto": the first of BACKENDS that's installed).
+    Naming a backend that isn't installed raises RuntimeError.
+    """
+    if name == "auto":
+        for backend in BACKENDS:
+            try:
+                return _CODECS[backend]()
+            except ImportError:
+                continue
+    if name not in _CODECS:
+        raise ValueError(
+            f"unknown JSON codec {name!r}; expected 'auto' or one of {BACKENDS}"
+        )
+    try:
+        return _CODECS[name]()
+    except ImportError:
+        raise RuntimeError(
+            f"JSON_CODEC={name!r} needs the {name!r} package (pip install {name})"
+        ) from None
+
+
+def available() -> list[str]:
+    """Backends that can be used here."""
+    found = []
+    for name in BACKENDS:
+        try:
+            _CODECS[name]()
+        except ImportError:
+            continue
+        found.append(name)
+    return found
+
+
+CODEC = get_codec(JSON_CODEC)
+
+
+def dumps(
+    obj, pretty: bool = False, sort_keys: bool = False, default: Callable | None = None
+) -> bytes:
+    """`obj` as UTF-8 JSON (compact unless `pretty`)."""
+    return CODEC.dumps(obj, pretty=pretty, sort_keys=sort_keys, default=default)
+
+
+def loads(data) -> Any:
+    """Decode JSON from bytes or str; ValueError if it isn't valid."""
+    return CODEC.loads(data)
+
+
+def looks_like_json(blob: bytes) -> bool:
+    """
+    Cheap check that `blob` is a JSON object or array (not an HTML error
+    page or a cut-off body), for bytes stored without being decoded.
+    """
+    blob = blob.strip()
+    return (blob[:1], blob[-1:]) in ((b"{", b"}"), (b"[", b"]"))
@@ -0,0 +1,222 @@
+# utils/http_cache.py
+"""
+Persistent on-disk HTTP cache for provider detail responses.
+
+Bodies live as one file per URL under <cache_dir>/bodies/, metadata (ETag,
+Last-Modified, when it was stored and last used, size) in a small SQLite
+index.  A lookup is served straight from disk while the entry is younger
+than the TTL; once stale we send a conditional request (If-None-Match /
+If-Modified-Since) when the server gave us validators, and a 304 refreshes
+the entry without downloading the body again.  The cache is bounded by
+total body size and evicts least-recently-used entries.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key           TEXT PRIMARY KEY,
+    url           TEXT NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    content_type  TEXT,
+    stored_at     REAL NOT NULL,
+    accessed_at   REAL NOT NULL,
+    size          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+"""
+
+
+class HTTPCache:
+    def __init__(
+        self,
+        cache_dir,
+        ttl: float,
+        max_bytes: int,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.bodies = self.cache_dir / "bodies"
+        self.bodies.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.cache_dir / "index.sqlite", check_same_thread=False
+        )
+        self._db.executescript(_SCHEMA)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evicted = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "evicted": self.evicted,
+        }
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.bodies / f"{key}.bin"
+
+    def get(
+        self,
+        url: str,
+        headers: dict,
+        fetch: Callable[[str, dict], requests.Response],
+    ) -> requests.Response:
+        """
+        Return the response for `url`, from cache when possible.  `fetch`
+        does the real request (it must not raise on 304).
+        """
+        key = self._key(url)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, content_type, stored_at "
+                "FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        body = self._read_body(key) if row else None
+        if body is None:
+            row = None
+
+        now = self._clock()
+        if row and now - row[3] < self.ttl:
+            self._touch(key, now)
+            return self._response(url, body, *row[:3])
+
+        request_headers = dict(headers)
+        if row:
+            etag, last_modified = row[0], row[1]
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        resp = fetch(url, request_headers)
+
+        if resp.status_code == 304 and row:
+            etag = resp.headers.get("ETag", row[0])
+            last_modified = resp.headers.get("Last-Modified", row[1])
+            with self._lock, self._db:
+                self.revalidated += 1
+                self._db.execute(
+                    "UPDATE entries SET etag = ?, last_modified = ?, "
+                    "stored_at = ?, accessed_at = ? WHERE key = ?",
+                    (etag, last_modified, now, now, key),
+                )
+            return self._response(url, body, etag, last_modified, row[2])
+
+        with self._lock:
+            self.misses += 1
+        if resp.status_code == 200 and "no-store" not in resp.headers.get(
+            "Cache-Control", ""
+        ):
+            self._store(key, url, resp, now)
+        return resp
+
+    def _read_body(self, key: str) -> bytes | None:
+        try:
+            return self._body_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _touch(self, key: str, now: float) -> None:
+        with self._lock, self._db:
+            self.hits += 1
+            self._db.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+
+    def _store(self, key: str, url: str, resp: requests.Response, now: float):
+        body = resp.content
+        path = self._body_path(key)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    resp.headers.get("ETag"),
+                    resp.headers.get("Last-Modified"),
+                    resp.headers.get("Content-Type"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        # caller holds the lock and the transaction
+        total = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append(key)
+            total -= size
+        self._db.executemany(
+            "DELETE FROM entries WHERE key = ?", [(k,) for k in victims]
+        )
+        for key in victims:
+            self._body_path(key).unlink(missing_ok=True)
+        self.evicted += len(victims)
+
+    @staticmethod
+    def _response(url, body, etag, last_modified, content_type):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = "OK"
+        resp.url = url
+        resp._content = body
+        resp.encoding = "utf-8"
+        resp.headers = CaseInsensitiveDict(
+            {
+                k: v
+                for k, v in (
+                    ("ETag", etag),
+                    ("Last-Modified", last_modified),
+                    ("Content-Type", content_type),
+                )
+                if v
+            }
+        )
+        resp.from_cache = True
+        return resp
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
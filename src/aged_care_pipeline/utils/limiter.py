@@ -2,9 +2,23 @@
 
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urlsplit
+
+from aged_care_pipeline.config.global_settings import (
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_RPS,
+    RATE_LIMIT_MIN_RPS,
+    RATE_LIMIT_RPS,
+)
 
 logger = logging.getLogger(__name__)
 
+# statuses that mean "slow down" rather than "this request is broken"
+THROTTLE_STATUSES = frozenset({429, 503})
+
 
 def apply_limit(iterable: list[int]) -> list[int]:
     """
@@ -20,3 +34,152 @@ def apply_limit(iterable: list[int]) -> list[int]:
     else:
         logger.debug("[Limiter] No LIMIT set, processing all items")
         return iterable
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """
+    Turn a Retry-After header (delta-seconds or HTTP-date) into seconds to
+    wait.  Returns None when the header is missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    from email.utils import parsedate_to_datetime  # rare; keeps CLI start-up lean
+
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+class AdaptiveTokenBucket:
+    """
+    Thread-safe token bucket whose refill rate adapts to server feedback.
+
+    acquire() blocks until a token is available.  observe() feeds back each
+    response: 429/503 halve the rate (multiplicative decrease, at most once
+    per `decrease_cooldown` seconds so a burst of concurrent 429s counts as
+    one signal) and honour Retry-After by pausing every caller; healthy
+    responses nudge the rate back up by `increase` req/s (additive increase)
+    until `max_rate`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float,
+        max_rate: float,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        decrease_cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.decrease_cooldown = decrease_cooldown
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self.acquired = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping as needed.  Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    self.waited += waited
+                    return waited
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+            waited += wait
+
+    def observe(self, status: int, retry_after: float | None = None) -> None:
+        """Adapt the rate to one response's status (and Retry-After)."""
+        with self._lock:
+            now = self._clock()
+            if status in THROTTLE_STATUSES:
+                self.throttled += 1
+                if now - self._last_decrease >= self.decrease_cooldown:
+                    old = self.rate
+                    self.rate = max(self.min_rate, self.rate * self.decrease)
+                    self._last_decrease = now
+                    logger.warning(
+                        f"[RateLimit] HTTP {status}: {old:.2f} → {self.rate:.2f} req/s"
+                    )
+                # throw away saved-up burst so we don't stampede on resume
+                self._refill(now)
+                self._tokens = min(self._tokens, 0.0)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, now + retry_after)
+                    logger.warning(f"[RateLimit] Pausing {retry_after:.1f}s")
+            elif status < 500:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 2),
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "waited": round(self.waited, 2),
+            }
+
+
+_host_limiters: dict[str, AdaptiveTokenBucket] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(url: str) -> AdaptiveTokenBucket | None:
+    """
+    Return the process-wide bucket for the host in `url`, so every pipeline
+    talking to the same host shares one request budget.  Returns None when
+    rate limiting is disabled (RATE_LIMIT_RPS=0).
+    """
+    if RATE_LIMIT_RPS <= 0:
+        return None
+    host = urlsplit(url).netloc or url
+    with _host_limiters_lock:
+        bucket = _host_limiters.get(host)
+        if bucket is None:
+            bucket = _host_limiters[host] = AdaptiveTokenBucket(
+                rate=RATE_LIMIT_RPS,
+                burst=RATE_LIMIT_BURST,
+                min_rate=RATE_LIMIT_MIN_RPS,
+                max_rate=max(RATE_LIMIT_MAX_RPS, RATE_LIMIT_RPS),
+            )
+        return bucket
+
+
+def limiter_stats() -> dict[str, dict]:
+    """Per-host AdaptiveTokenBucket.stats() for every host seen so far."""
+    with _host_limiters_lock:
+        buckets = dict(_host_limiters)
+    return {host: b.stats() for host, b in buckets.items()}
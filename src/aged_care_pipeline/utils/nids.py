@@ -0,0 +1,134 @@
+# utils/nids.py
+"""
+NID lists from the reference CSVs.
+
+Each pipeline's NIDs are the `nid` column of a CSV (NIDS_CSV,
+RADS_NIDS_CSV).  read_nids() reads that column with the csv module; blank
+cells are skipped and "123.0"-style floats accepted.  load_nids() adds a
+cache: the list is kept in NIDS_CACHE_DIR as a native int64 array headed
+by the CSV's size and mtime, so later runs load it with one read instead
+of parsing the CSV, and a changed CSV is simply read again.
+
+Sharded runs (`--shard I/N`) take the NIDs whose hash falls in shard I of
+N.  The hash is of the NID alone, so a NID stays in its shard whatever
+else is added to or removed from the list, and every host agrees on it.
+"""
+
+import csv
+import hashlib
+import logging
+import os
+import re
+from array import array
+from pathlib import Path
+
+from aged_care_pipeline.config.global_settings import (
+    NIDS_CACHE_DIR,
+    NIDS_CACHE_ENABLED,
+)
+
+logger = logging.getLogger(__name__)
+
+_HEADER = 2  # int64s before the NIDs: CSV size, CSV mtime (ns)
+_SHARD = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+
+
+def read_nids(csv_path) -> list[int]:
+    """The `nid` column of `csv_path`, in file order."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader, [])]
+        if "nid" not in header:
+            raise ValueError(f"{csv_path} has no 'nid' column")
+        col = header.index("nid")
+        nids = []
+        for row in reader:
+            value = row[col].strip() if col < len(row) else ""
+            if not value:
+                continue
+            try:
+                nids.append(int(value))
+            except ValueError:
+                try:
+                    nids.append(int(float(value)))
+                except ValueError:
+                    raise ValueError(
+                        f"{csv_path}:{reader.line_num}: bad nid {value!r}"
+                    ) from None
+    return nids
+
+
+def cache_path(csv_path, cache_dir=None) -> Path:
+    """Where `csv_path`'s NIDs are cached (one file per CSV path)."""
+    resolved = os.path.abspath(csv_path)
+    digest = hashlib.sha1(resolved.encode("utf-8")).hexdigest()[:12]
+    return Path(cache_dir or NIDS_CACHE_DIR) / f"{Path(csv_path).stem}_{digest}.bin"
+
+
+def _read_cache(path: Path, stamp: tuple[int, int]) -> list[int] | None:
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+    values = array("q")
+    try:
+        values.frombytes(blob)
+    except ValueError:
+        return None  # torn
+    if len(values) < _HEADER or tuple(values[:_HEADER]) != stamp:
+        return None
+    return values[_HEADER:].tolist()
+
+
+def _write_cache(path: Path, stamp: tuple[int, int], nids: list[int]) -> None:
+    tmp = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            array("q", [*stamp, *nids]).tofile(f)
+        os.replace(tmp, path)
+    except (OSError, OverflowError) as e:
+        logger.debug(f"[NIDs] Not caching {path}: {e}")
+        if tmp.exists():
+            tmp.unlink()
+
+
+def load_nids(csv_path, cache_dir=None, use_cache: bool | None = None) -> list[int]:
+    """`csv_path`'s NIDs, from the cache when the CSV hasn't changed."""
+    use_cache = NIDS_CACHE_ENABLED if use_cache is None else use_cache
+    if not use_cache:
+        return read_nids(csv_path)
+    st = os.stat(csv_path)
+    stamp = (st.st_size, st.st_mtime_ns)
+    path = cache_path(csv_path, cache_dir)
+    nids = _read_cache(path, stamp)
+    if nids is None:
+        nids = read_nids(csv_path)
+        _write_cache(path, stamp, nids)
+        logger.debug(f"[NIDs] {len(nids)} NIDs read from {csv_path}")
+    return nids
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """'2/4' → (2, 4); ValueError unless it's I/N with 1 <= I <= N."""
+    m = _SHARD.match(spec)
+    if m is None or not 1 <= int(m[1]) <= int(m[2]):
+        raise ValueError(f"shard must be I/N with 1 <= I <= N, not {spec!r}")
+    return int(m[1]), int(m[2])
+
+
+def shard_tag(index: int, count: int) -> str:
+    """(2, 4) → 'shard2of4', for file and run names."""
+    return f"shard{index}of{count}"
+
+
+def shard_of(nid: int, count: int) -> int:
+    """The shard (1..count) `nid` belongs to."""
+    digest = hashlib.blake2b(str(nid).encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % count + 1
+
+
+def select_shard(nids: list[int], index: int, count: int) -> list[int]:
+    """The NIDs of shard `index` of `count`, in list order."""
+    return [nid for nid in nids if shard_of(nid, count) == index]
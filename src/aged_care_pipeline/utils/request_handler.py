@@ -1,12 +1,214 @@
 # utils/request_handler.py
+"""
+Process-wide HTTP client.
+
+Every scraper goes through safe_get(), which shares one pooled
+requests.Session.  Connections to myagedcare.gov.au are kept alive and reused
+across NIDs (and across pipelines running in the same process) instead of
+paying a fresh TCP+TLS handshake per request.  Each request first takes a
+token from the host's adaptive rate limiter and reports its status back.
+Responses are kept in an on-disk HTTP cache (utils/http_cache.py) so
+unchanged provider records are revalidated rather than re-downloaded.
+"""
+
+import logging
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from aged_care_pipeline.config.global_settings import (
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_MAX_TRIPS,
+    CIRCUIT_THRESHOLD,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_ENABLED,
+    HTTP_CACHE_MAX_MB,
+    HTTP_CACHE_TTL,
+    HTTP_POOL_HOSTS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_TIMEOUT,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_BUDGET,
+    RETRY_MAX_DELAY,
+)
+from aged_care_pipeline.utils.http_cache import HTTPCache
+from aged_care_pipeline.utils.limiter import (
+    get_host_limiter,
+    limiter_stats,
+    parse_retry_after,
+)
+from aged_care_pipeline.utils.retry import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    retry,
+)
+
+logger = logging.getLogger(__name__)
+
+# one policy for every request this process makes, so the retry budget and
+# the circuit breaker see the whole run rather than a single NID
+HTTP_RETRY_POLICY = RetryPolicy(
+    max_attempts=RETRY_ATTEMPTS,
+    base_delay=RETRY_BASE_DELAY,
+    max_delay=RETRY_MAX_DELAY,
+    budget=RetryBudget(RETRY_BUDGET),
+    breaker=CircuitBreaker(
+        threshold=CIRCUIT_THRESHOLD,
+        cooldown=CIRCUIT_COOLDOWN,
+        max_trips=CIRCUIT_MAX_TRIPS,
+    ),
+)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_http_cache: HTTPCache | None = None
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session (its pools and sockets) and forget it."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _build_session() -> requests.Session:
+    # pool_connections = how many hosts get their own pool,
+    # pool_maxsize     = how many keep-alive sockets each host pool holds
+    # (sized to the scrape concurrency so no worker ever opens a throwaway
+    # connection)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_MAXSIZE
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    logger.debug(
+        f"[HTTP] New pooled session (hosts={HTTP_POOL_HOSTS}, "
+        f"per-host={HTTP_POOL_MAXSIZE}, timeout={HTTP_TIMEOUT}s)"
+    )
+    return session
+
 
-from aged_care_pipeline.utils.retry import retry
+def get_http_cache() -> HTTPCache | None:
+    """Return the shared HTTP cache, or None when HTTP_CACHE=0."""
+    global _http_cache
+    if not HTTP_CACHE_ENABLED:
+        return None
+    with _session_lock:
+        if _http_cache is None:
+            _http_cache = HTTPCache(
+                HTTP_CACHE_DIR,
+                ttl=HTTP_CACHE_TTL,
+                max_bytes=int(HTTP_CACHE_MAX_MB * 1024 * 1024),
+            )
+        return _http_cache
+
+
+def reset_http_state() -> None:
+    """
+    Start a new run: refill the retry budget, close the breaker and zero
+    the cache counters.
+    """
+    HTTP_RETRY_POLICY.reset()
+    if _http_cache is not None:
+        _http_cache.reset_stats()
 
 
-@retry(times=3, delay=1)
 def safe_get(url: str, headers: dict) -> requests.Response:
-    resp = requests.get(url, headers=headers, timeout=10)
+    cache = get_http_cache()
+    if cache is None:
+        return _get(url, headers)
+    return cache.get(url, headers, _get)
+
+
+@retry(policy=HTTP_RETRY_POLICY)
+def _get(url: str, headers: dict) -> requests.Response:
+    limiter = get_host_limiter(url)
+    if limiter is not None:
+        limiter.acquire()
+    resp = get_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    if limiter is not None:
+        limiter.observe(
+            resp.status_code, parse_retry_after(resp.headers.get("Retry-After"))
+        )
     resp.raise_for_status()
     return resp
+
+
+def pool_stats() -> dict[str, dict]:
+    """
+    Per-host connection pool statistics for the shared session.
+
+    `requests` is how many requests the pool served, `handshakes` how many
+    new connections it had to open and `reuse_ratio` the share of requests
+    that rode an existing keep-alive connection.
+    """
+    with _session_lock:
+        session = _session
+    if session is None:
+        return {}
+
+    stats: dict[str, dict] = {}
+    adapters = {id(a): a for a in session.adapters.values()}.values()
+    for adapter in adapters:
+        pools = adapter.poolmanager.pools
+        # urllib3's pool container refuses iteration; keys() is a locked copy
+        keys = pools.keys()
+        for key in keys:
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}"
+            requests_ = pool.num_requests
+            handshakes = pool.num_connections
+            reuse = (requests_ - handshakes) / requests_ if requests_ else 0.0
+            stats[host] = {
+                "requests": requests_,
+                "handshakes": handshakes,
+                "reuse_ratio": round(max(reuse, 0.0), 3),
+            }
+    return stats
+
+
+def log_pool_stats() -> None:
+    """Log pool_stats() for every host contacted this run."""
+    for host, s in pool_stats().items():
+        logger.info(
+            f"[HTTP] {host}: {s['requests']} requests over "
+            f"{s['handshakes']} connections (reuse {s['reuse_ratio']:.1%})"
+        )
+
+
+def log_http_stats() -> None:
+    """End-of-run summary: cache, connection pools, rate limiter, retries."""
+    if _http_cache is not None:
+        c = _http_cache.stats()
+        logger.info(
+            f"[HTTPCache] {c['hits']} hits, {c['revalidated']} revalidated (304), "
+            f"{c['misses']} misses, {c['evicted']} evicted"
+        )
+    log_pool_stats()
+    budget, breaker = HTTP_RETRY_POLICY.budget, HTTP_RETRY_POLICY.breaker
+    logger.info(
+        f"[Retry] {budget.spent}/{budget.total} retries used, "
+        f"circuit tripped {breaker.total_trips} time(s)"
+    )
+    for host, s in limiter_stats().items():
+        logger.info(
+            f"[RateLimit] {host}: settled at {s['rate']} req/s, "
+            f"{s['throttled']} throttled responses, {s['waited']}s spent waiting"
+        )
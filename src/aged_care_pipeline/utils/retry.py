@@ -1,22 +1,241 @@
 # utils/retry.py
+"""
+Retry policy for outbound requests.
+
+A RetryPolicy decides *whether* a failure is worth retrying (timeouts,
+dropped connections, 429/5xx — not 404s or programming errors), *how long*
+to wait (exponential backoff with jitter, or the server's Retry-After) and
+*whether we can afford it* (a retry budget shared by the whole run).  An
+optional CircuitBreaker pauses every caller once the upstream is clearly
+down, instead of letting each remaining NID burn its own retries.
+"""
 
 import functools
+import logging
+import random
+import threading
 import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import requests
+
+from aged_care_pipeline.utils.limiter import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+RETRYABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised once the circuit breaker has given up on the upstream."""
+
+
+class RetryBudget:
+    """Thread-safe cap on the number of retries spent across one run."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self.spent >= self.total:
+                return False
+            self.spent += 1
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spent = 0
+
+
+class CircuitBreaker:
+    """
+    Closed → open after `threshold` consecutive retryable failures.
+
+    While open, before_call() blocks every caller until the cooldown
+    expires; then one probe request is let through (half-open).  A good
+    probe closes the circuit, a bad one re-opens it with the cooldown
+    doubled (up to `max_cooldown`).  After `max_trips` trips in a row the
+    breaker gives up and before_call() raises CircuitOpenError.
+    """
 
+    def __init__(
+        self,
+        threshold: int = 5,
+        cooldown: float = 30.0,
+        max_cooldown: float = 300.0,
+        max_trips: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = "closed"
+        self.failures = 0
+        self.trips = 0
+        self.total_trips = 0
+        self._open_until = 0.0
+        self._probing = False
+
+    def before_call(self) -> None:
+        while True:
+            with self._lock:
+                if self.state == "closed":
+                    return
+                if self.state == "failed":
+                    raise CircuitOpenError(
+                        f"upstream still failing after {self.trips} circuit trips"
+                    )
+                now = self._clock()
+                if self.state == "open" and now >= self._open_until:
+                    self.state = "half_open"
+                if self.state == "half_open" and not self._probing:
+                    self._probing = True
+                    logger.info("[Retry] Circuit half-open: sending probe request")
+                    return
+                wait = max(self._open_until - now, min(1.0, self.cooldown))
+            self._sleep(wait)
+
+    def record_success(self) -> None:
+        """The upstream answered (even with a non-retryable error)."""
+        with self._lock:
+            if self.state != "closed":
+                logger.info("[Retry] Upstream recovered: circuit closed")
+            self.state = "closed"
+            self.failures = 0
+            self.trips = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or (
+                self.state == "closed" and self.failures >= self.threshold
+            ):
+                self.trips += 1
+                self.total_trips += 1
+                self._probing = False
+                if self.trips > self.max_trips:
+                    self.state = "failed"
+                    logger.error("[Retry] Upstream down for good: circuit failed")
+                    return
+                pause = min(self.max_cooldown, self.cooldown * 2 ** (self.trips - 1))
+                self.state = "open"
+                self._open_until = self._clock() + pause
+                logger.warning(
+                    f"[Retry] {self.failures} failures in a row: "
+                    f"pausing all requests for {pause:.0f}s"
+                )
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    # 1.0 = "full jitter" (uniform 0..backoff), 0.0 = plain exponential
+    jitter: float = 1.0
+    # never wait longer than this even if Retry-After asks us to
+    max_retry_after: float = 300.0
+    retry_statuses: frozenset = RETRYABLE_STATUSES
+    budget: RetryBudget | None = None
+    breaker: CircuitBreaker | None = None
+    sleep: Callable[[float], None] = field(default=time.sleep, repr=False)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        if isinstance(exc, requests.HTTPError):
+            resp = exc.response
+            return resp is not None and resp.status_code in self.retry_statuses
+        return isinstance(exc, RETRYABLE_ERRORS)
+
+    def delay_for(self, attempt: int, exc: BaseException) -> float:
+        """Seconds to wait before retry number `attempt` (1-based)."""
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay = backoff * (1 - self.jitter) + random.uniform(0, backoff * self.jitter)
+        resp = getattr(exc, "response", None)
+        if resp is not None:
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+    def reset(self) -> None:
+        """Start a fresh run: refill the budget and close the breaker."""
+        if self.budget is not None:
+            self.budget.reset()
+        if self.breaker is not None:
+            self.breaker.reset()
+
+    def call(self, fn: Callable, *args, **kwargs):
+        attempt = 1
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                retryable = self.is_retryable(exc)
+                if self.breaker is not None:
+                    if retryable:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                if not retryable or attempt >= self.max_attempts:
+                    raise
+                if self.budget is not None and not self.budget.try_spend():
+                    logger.warning(f"[Retry] Retry budget exhausted; giving up: {exc}")
+                    raise
+                wait = self.delay_for(attempt, exc)
+                logger.debug(
+                    f"[Retry] Attempt {attempt} failed ({exc}); in {wait:.1f}s"
+                )
+                self.sleep(wait)
+                attempt += 1
+            else:
+                if self.breaker is not None:
+                    self.breaker.record_success()
+                return result
+
+
+def retry(
+    times: int | None = None,
+    delay: float | None = None,
+    policy: RetryPolicy | None = None,
+):
+    """
+    Decorate `fn` so calls go through a RetryPolicy.
+
+    retry(times, delay) keeps the old call signature and builds a policy
+    with `times` attempts and `delay` as the base backoff.
+    """
+    if policy is None:
+        policy = RetryPolicy(
+            max_attempts=times if times is not None else 3,
+            base_delay=delay if delay is not None else 1.0,
+        )
 
-def retry(times: int, delay: float):
     def decorator(fn):
         @functools.wraps(fn)
         def wrapper(*args, **kwargs):
-            for i in range(times):
-                try:
-                    return fn(*args, **kwargs)
-                except Exception:
-                    if i < times - 1:
-                        time.sleep(delay)
-                    else:
-                        raise
+            return policy.call(fn, *args, **kwargs)
 
+        wrapper.policy = policy
         return wrapper
 
     return decorator
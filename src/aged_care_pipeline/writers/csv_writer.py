@@ -1,19 +1,137 @@
 # writers/csv_writer.py
+"""
+Write parsed records to CSV, all at once or incrementally.
+
+CSVWriter.open() starts a CSVSession: rows are added with write_rows() as
+they arrive and buffered into blocks of CSV_BLOCK_SIZE bytes.  Each block
+is written and flushed whole (also once CSV_FLUSH_SECONDS pass without a
+flush), so if the run dies the file holds every row up to the last flush
+and ends on a complete row.  A filename ending in .gz is gzip-compressed;
+each flush is a gzip sync point, so a cut-short .csv.gz still decompresses
+up to its last block.
+
+The header is the declared schema (`fieldnames`, usually the parser's
+`columns`) or, failing that, the first row's keys.  Missing keys are
+written empty and keys outside the header are dropped with a warning,
+rather than shifting later rows out of their columns.
+"""
 
 import csv
+import gzip
+import io
 import logging
 import os
+import time
+from collections.abc import Iterable
 
-from aged_care_pipeline.config.global_settings import OUTPUT_DIR
+from aged_care_pipeline.config.global_settings import (
+    CSV_BLOCK_SIZE,
+    CSV_FLUSH_SECONDS,
+    OUTPUT_DIR,
+)
 from aged_care_pipeline.interfaces.base_writer import BaseWriter
 
 logger = logging.getLogger(__name__)
 
 
+class CSVSession:
+    """One CSV file being written; use CSVWriter.open() to get one."""
+
+    def __init__(
+        self,
+        path: str,
+        fieldnames: Iterable[str] | None = None,
+        block_size: int | None = None,
+        flush_seconds: float | None = None,
+    ):
+        self.path = path
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+        self.block_size = block_size or CSV_BLOCK_SIZE
+        self.flush_seconds = (
+            CSV_FLUSH_SECONDS if flush_seconds is None else flush_seconds
+        )
+        self.count = 0
+        self._block = io.StringIO(newline="")
+        self._writer: csv.DictWriter | None = None
+        self._header: frozenset[str] = frozenset()
+        self._dropped: set[str] = set()
+        self._last_flush = time.monotonic()
+        # held open across write() calls and closed by close()
+        if path.endswith(".gz"):
+            self._file = gzip.open(  # noqa: SIM115
+                path, "wt", newline="", encoding="utf-8"
+            )
+        else:
+            self._file = open(path, "w", newline="", encoding="utf-8")  # noqa: SIM115
+
+    def _start(self, first: dict) -> None:
+        if self.fieldnames is None:
+            self.fieldnames = list(first.keys())
+        self._writer = csv.DictWriter(
+            self._block, fieldnames=self.fieldnames, extrasaction="ignore"
+        )
+        self._header = frozenset(self.fieldnames)
+        self._writer.writeheader()
+
+    def _check_keys(self, row: dict) -> None:
+        extra = row.keys() - self._header - self._dropped
+        if extra:
+            self._dropped |= extra
+            logger.warning(
+                f"[Writer] Columns not in the header of {self.path} are "
+                f"dropped: {sorted(extra)}"
+            )
+
+    def write_rows(self, rows: Iterable[dict]) -> None:
+        """Buffer rows; full blocks go to disk as they fill."""
+        for row in rows:
+            if self._writer is None:
+                self._start(row)
+            if row.keys() != self._header:
+                self._check_keys(row)
+            self._writer.writerow(row)
+            self.count += 1
+            if (
+                self._block.tell() >= self.block_size
+                or time.monotonic() - self._last_flush >= self.flush_seconds
+            ):
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered block and push it to disk."""
+        block = self._block.getvalue()
+        if block:
+            self._file.write(block)
+            self._block.seek(0)
+            self._block.truncate()
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if self._writer is None and self.fieldnames is not None:
+            self._start({})  # header only
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 class CSVWriter(BaseWriter):
-    def __init__(self, output_dir: str = None):
+    def __init__(
+        self,
+        output_dir: str | None = None,
+        fieldnames: Iterable[str] | None = None,
+    ):
         """
-        Initialize writer with an output_dir. If not provided, defaults to the global OUTPUT_DIR.
+        Initialize writer with an output_dir. If not provided, defaults to the
+        global OUTPUT_DIR.
+        `fieldnames` declares the header (default: the first record's keys).
         """
         super().__init__()
         if output_dir is not None:
@@ -21,22 +139,31 @@ class CSVWriter(BaseWriter):
         else:
             # Allow runtime override via environment variable
             self.output_dir = os.getenv("OUTPUT_DIR", str(OUTPUT_DIR))
+        self.fieldnames = fieldnames
 
-    def write(self, records: list[dict], filename: str) -> None:
-        """
-        Write a list of dict records to a CSV file at output_dir/filename.
-        """
-        # Ensure the directory exists
+    def open(self, filename: str) -> CSVSession:
+        """Start writing output_dir/filename (gzip if it ends in .gz)."""
         os.makedirs(self.output_dir, exist_ok=True)
         path = os.path.join(self.output_dir, filename)
+        logger.debug(f"[Writer] Streaming records to {path}")
+        return CSVSession(path, self.fieldnames)
+
+    def write(self, records: Iterable[dict], filename: str) -> None:
+        """
+        Write dict records to a CSV file at output_dir/filename.
 
-        if not records:
+        `records` may be a list or any iterator (e.g. a streaming run); rows
+        are written as they arrive, so they never need to be held in memory
+        together.
+        """
+        path = os.path.join(self.output_dir, filename)
+        rows = iter(records)
+        first = next(rows, None)
+        if first is None:
             logger.warning(f"[Writer] No records to write for file {path}; skipping")
             return
 
-        logger.info(f"[Writer] Writing {len(records)} records to {path}")
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=records[0].keys())
-            writer.writeheader()
-            writer.writerows(records)
-        logger.debug(f"[Writer] Finished writing file {path}")
+        with self.open(filename) as session:
+            session.write_rows([first])
+            session.write_rows(rows)
+        logger.info(f"[Writer] Wrote {session.count} records to {path}")
@@ -0,0 +1,169 @@
+# writers/parquet_writer.py
+"""
+Write parsed records to a Parquet file.
+
+Records are buffered into row groups of PARQUET_ROW_GROUP_SIZE rows and
+written one group at a time, so a streaming run never holds more than one
+group.  The schema is declared before the first row is seen: the columns
+are `fieldnames` (usually the parser's `columns`, else the first record's
+keys) and each column's type comes from `column_types` (the parser's
+declared int/float/bool columns); everything else is a string.  A value
+that doesn't fit its column's type is written as null and counted in a
+warning, so one odd payload never fails a run after the fetching is done.
+Repetitive text columns (PARQUET_DICTIONARY_COLUMNS) are
+dictionary-encoded and every column is compressed with PARQUET_COMPRESSION.
+"""
+
+import logging
+import os
+from collections import Counter
+from collections.abc import Iterable
+from itertools import islice
+
+from aged_care_pipeline.config.global_settings import (
+    OUTPUT_DIR,
+    PARQUET_COMPRESSION,
+    PARQUET_DICTIONARY_COLUMNS,
+    PARQUET_ROW_GROUP_SIZE,
+)
+from aged_care_pipeline.interfaces.base_writer import BaseWriter
+from aged_care_pipeline.parsers.columnar import as_text
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: pip install aged_care_pipeline[parquet]
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+
+def require_pyarrow():
+    if pa is None:
+        raise RuntimeError(
+            "Parquet output needs the 'pyarrow' package "
+            "(pip install aged_care_pipeline[parquet])"
+        )
+
+
+def declared_schema(
+    names: Iterable[str], column_types: dict[str, type] | None = None
+) -> "pa.Schema":
+    """Arrow schema for `names`, typed from `column_types` (default string)."""
+    arrow = {int: pa.int64(), float: pa.float64(), bool: pa.bool_(), str: pa.string()}
+    types = column_types or {}
+    return pa.schema(pa.field(n, arrow[types.get(n, str)]) for n in names)
+
+
+def fit(value, kind: type):
+    """`value` as a `kind` (int, float, bool or str); ValueError if it isn't one."""
+    if value is None or kind is str:
+        return as_text(value)
+    if isinstance(value, bool) or kind is bool:
+        if isinstance(value, bool) and kind is bool:
+            return value
+        raise ValueError(f"{value!r} is not a {kind.__name__}")
+    if isinstance(value, str):
+        value = value.strip().replace(",", "")
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{value!r} is not a {kind.__name__}") from None
+    if kind is float:
+        return number
+    if not number.is_integer():
+        raise ValueError(f"{value!r} is not an int")
+    return int(number)
+
+
+class ParquetWriter(BaseWriter):
+    def __init__(
+        self,
+        output_dir: str | None = None,
+        fieldnames: Iterable[str] | None = None,
+        column_types: dict[str, type] | None = None,
+        row_group_size: int | None = None,
+        compression: str | None = None,
+        dictionary_columns: Iterable[str] | None = None,
+    ):
+        """
+        output_dir defaults to OUTPUT_DIR (overridable at runtime through
+        the environment, like CSVWriter); `fieldnames` fixes the columns
+        (default: the first record's keys) and `column_types` their types
+        (default: string); the rest default to the PARQUET_* settings.
+        """
+        super().__init__()
+        require_pyarrow()
+        if output_dir is not None:
+            self.output_dir = output_dir
+        else:
+            self.output_dir = os.getenv("OUTPUT_DIR", str(OUTPUT_DIR))
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+        self.column_types = dict(column_types or {})
+        self.unfit: Counter = Counter()
+        self.row_group_size = max(1, row_group_size or PARQUET_ROW_GROUP_SIZE)
+        self.compression = compression or PARQUET_COMPRESSION
+        self.dictionary_columns = tuple(
+            PARQUET_DICTIONARY_COLUMNS
+            if dictionary_columns is None
+            else dictionary_columns
+        )
+
+    def _group(self, rows: list[dict], schema: "pa.Schema") -> "pa.Table":
+        columns = {}
+        for name in schema.names:
+            kind = self.column_types.get(name, str)
+            values = []
+            for row in rows:
+                try:
+                    values.append(fit(row.get(name), kind))
+                except ValueError:
+                    self.unfit[name] += 1
+                    values.append(None)
+            columns[name] = values
+        return pa.Table.from_pydict(columns, schema=schema)
+
+    def write(self, records: Iterable[dict], filename: str) -> None:
+        """
+        Write dict records to a Parquet file at output_dir/filename, one
+        row group at a time as records arrive.
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, filename)
+
+        rows = iter(records)
+        writer = None
+        count = 0
+        self.unfit = Counter()
+        try:
+            while batch := list(islice(rows, self.row_group_size)):
+                if writer is None:
+                    names = self.fieldnames or list(batch[0].keys())
+                    schema = declared_schema(names, self.column_types)
+                    writer = pq.ParquetWriter(
+                        path,
+                        schema,
+                        compression=self.compression,
+                        use_dictionary=[
+                            c for c in self.dictionary_columns if c in schema.names
+                        ],
+                    )
+                table = self._group(batch, schema)
+                writer.write_table(table, row_group_size=self.row_group_size)
+                count += len(batch)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            logger.warning(f"[Writer] No records to write for file {path}; skipping")
+            return
+        for name, n in self.unfit.items():
+            logger.warning(
+                f"[Writer] {n} value(s) in {name} didn't fit its declared "
+                f"{schema.field(name).type} type and were written as null"
+            )
+        logger.info(
+            f"[Writer] Wrote {count} records to {path} "
+            f"({os.path.getsize(path) / 1e6:.2f} MB, {self.compression})"
+        )
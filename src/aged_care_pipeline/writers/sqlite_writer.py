@@ -0,0 +1,227 @@
+# writers/sqlite_writer.py
+"""
+Keep every run's records as snapshots in one SQLite database.
+
+Each pipeline gets a table in output_dir/SQLITE_DB_NAME, with one row per
+record per snapshot date: write(records, "operations_18_10_2026.sqlite")
+upserts into table "operations" under snapshot 2026-10-18 (the date is read
+from the filename the CLI builds; today's date if there is none).  Rows
+are keyed by the parser's `key_columns`, the key's occurrence within the
+run (key_rank: a home can list the same room type twice) and snapshot_date,
+so re-running a day replaces that day's rows instead of duplicating them.
+
+Rows go in with executemany, SQLITE_BATCH_SIZE per transaction, on a WAL
+database with synchronous=NORMAL, so a full run writes about as fast as the
+CSV.  nid, state and postcode are indexed (SQLITE_INDEX_COLUMNS), which
+makes history() — one NID across its last N snapshots — an index lookup
+rather than a scan of N dated CSVs.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+from collections.abc import Iterable
+from datetime import date, datetime
+from itertools import islice
+
+from aged_care_pipeline.config.global_settings import (
+    OUTPUT_DIR,
+    SQLITE_BATCH_SIZE,
+    SQLITE_DB_NAME,
+    SQLITE_INDEX_COLUMNS,
+)
+from aged_care_pipeline.interfaces.base_writer import BaseWriter
+from aged_care_pipeline.utils import codec
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COLUMN = "snapshot_date"
+RANK_COLUMN = "key_rank"
+
+# prefix_<dd_mm_yyyy>.ext (CLI) or prefix_<yyyymmdd>.ext (services)
+_DATED_NAME = re.compile(r"^(?P<table>.+?)_(?P<date>\d{2}_\d{2}_\d{4}|\d{8})(\..*)?$")
+
+
+def parse_target(filename: str) -> tuple[str, str]:
+    """(table, ISO snapshot date) for a dated output filename."""
+    m = _DATED_NAME.match(os.path.basename(filename))
+    if m is None:
+        table = os.path.basename(filename).split(".", 1)[0]
+        return table, date.today().isoformat()
+    raw = m["date"]
+    fmt = "%d_%m_%Y" if "_" in raw else "%Y%m%d"
+    return m["table"], datetime.strptime(raw, fmt).date().isoformat()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _affinity(values: list) -> str:
+    """Declared column type from the first non-null value ("" if none)."""
+    for v in values:
+        if v is None:
+            continue
+        if isinstance(v, int):  # bool included
+            return "INTEGER"
+        if isinstance(v, float):
+            return "REAL"
+        return "TEXT"
+    return ""
+
+
+def _cell(value):
+    if isinstance(value, (dict, list)):
+        return codec.dumps(value).decode()
+    return value
+
+
+class SQLiteWriter(BaseWriter):
+    def __init__(
+        self,
+        output_dir: str | None = None,
+        fieldnames: Iterable[str] | None = None,
+        key_columns: Iterable[str] = ("nid",),
+        batch_size: int | None = None,
+    ):
+        """
+        output_dir holds the database (default OUTPUT_DIR, overridable at
+        runtime like CSVWriter); `fieldnames` fixes the columns (default:
+        the first record's keys); `key_columns` identify a record within
+        one snapshot.
+        """
+        super().__init__()
+        if output_dir is not None:
+            self.output_dir = output_dir
+        else:
+            self.output_dir = os.getenv("OUTPUT_DIR", str(OUTPUT_DIR))
+        self.fieldnames = list(fieldnames) if fieldnames is not None else None
+        self.key_columns = tuple(key_columns)
+        self.batch_size = max(1, batch_size or SQLITE_BATCH_SIZE)
+
+    @property
+    def db_path(self) -> str:
+        return os.path.join(self.output_dir, SQLITE_DB_NAME)
+
+    def location(self, filename: str) -> str:
+        table, snapshot = parse_target(filename)
+        return f"{self.db_path} (table {table}, snapshot {snapshot})"
+
+    def connect(self) -> sqlite3.Connection:
+        os.makedirs(self.output_dir, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _ensure_table(
+        self, conn: sqlite3.Connection, table: str, columns: list[str], sample: list
+    ) -> None:
+        """Create the table, its key and indexes; add any new columns."""
+        existing = {
+            row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")
+        }
+        typed = {col: _affinity([row.get(col) for row in sample]) for col in columns}
+        if not existing:
+            defs = ", ".join(f"{_quote(c)} {typed[c]}".rstrip() for c in columns)
+            conn.execute(
+                f"CREATE TABLE {_quote(table)} ({defs}, "
+                f"{RANK_COLUMN} INTEGER NOT NULL DEFAULT 1, "
+                f"{SNAPSHOT_COLUMN} TEXT NOT NULL)"
+            )
+        else:
+            for col in columns:
+                if col not in existing:
+                    logger.info(f"[Writer] Adding column {col} to {table}")
+                    conn.execute(
+                        f"ALTER TABLE {_quote(table)} ADD COLUMN "
+                        f"{_quote(col)} {typed[col]}".rstrip()
+                    )
+
+        # NULL never equals NULL, so key columns are compared as ifnull(col, '')
+        key = ", ".join(f"ifnull({_quote(c)}, '')" for c in self.key_columns)
+        conn.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(f'uq_{table}_snapshot')} "
+            f"ON {_quote(table)} ({key}, {RANK_COLUMN}, {SNAPSHOT_COLUMN})"
+        )
+        for col in SQLITE_INDEX_COLUMNS:
+            if col in columns:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'ix_{table}_{col}')} "
+                    f"ON {_quote(table)} ({_quote(col)})"
+                )
+
+    def _upsert_sql(self, table: str, columns: list[str]) -> str:
+        names = [*columns, RANK_COLUMN, SNAPSHOT_COLUMN]
+        key = ", ".join(f"ifnull({_quote(c)}, '')" for c in self.key_columns)
+        updates = ", ".join(
+            f"{_quote(c)} = excluded.{_quote(c)}"
+            for c in columns
+            if c not in self.key_columns
+        )
+        action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        return (
+            f"INSERT INTO {_quote(table)} ({', '.join(map(_quote, names))}) "
+            f"VALUES ({', '.join('?' * len(names))}) "
+            f"ON CONFLICT ({key}, {RANK_COLUMN}, {SNAPSHOT_COLUMN}) {action}"
+        )
+
+    def write(self, records: Iterable[dict], filename: str) -> None:
+        """
+        Upsert dict records as one snapshot; `filename` names the table and
+        the snapshot date (see parse_target).
+        """
+        table, snapshot = parse_target(filename)
+        rows = iter(records)
+        batch = list(islice(rows, self.batch_size))
+        if not batch:
+            logger.warning(f"[Writer] No records to write for {table}; skipping")
+            return
+
+        columns = self.fieldnames or list(batch[0].keys())
+        missing = [c for c in self.key_columns if c not in columns]
+        if missing:
+            raise ValueError(f"key columns {missing} are not among the columns")
+
+        seen: dict[tuple, int] = {}
+
+        def values(row: dict) -> list:
+            key = tuple(row.get(c) for c in self.key_columns)
+            seen[key] = rank = seen.get(key, 0) + 1
+            return [*(_cell(row.get(c)) for c in columns), rank, snapshot]
+
+        count = 0
+        conn = self.connect()
+        try:
+            with conn:
+                self._ensure_table(conn, table, columns, batch)
+            sql = self._upsert_sql(table, columns)
+            while batch:
+                with conn:  # one transaction per batch
+                    conn.executemany(sql, map(values, batch))
+                count += len(batch)
+                batch = list(islice(rows, self.batch_size))
+        finally:
+            conn.close()
+        logger.info(
+            f"[Writer] Upserted {count} records into {table} of {self.db_path} "
+            f"(snapshot {snapshot})"
+        )
+
+    def history(self, table: str, nid: int, last: int = 12) -> list[dict]:
+        """One NID's rows from its `last` most recent snapshots, newest first."""
+        conn = self.connect()
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM {_quote(table)} WHERE nid = ? "
+                f"AND {SNAPSHOT_COLUMN} IN ("
+                f"SELECT DISTINCT {SNAPSHOT_COLUMN} FROM {_quote(table)} "
+                f"WHERE nid = ? ORDER BY {SNAPSHOT_COLUMN} DESC LIMIT ?) "
+                f"ORDER BY {SNAPSHOT_COLUMN} DESC",
+                (nid, nid, last),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
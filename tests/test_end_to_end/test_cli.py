@@ -0,0 +1,184 @@
+import csv
+import os
+from datetime import date
+
+import pytest
+
+from aged_care_pipeline import cli
+from aged_care_pipeline.interfaces.base_scraper import BaseScraper
+from aged_care_pipeline.storage.journal import RunJournal
+from aged_care_pipeline.storage.raw_store import write_raw
+from aged_care_pipeline.utils import codec, nids
+
+TODAY = f"{date.today():%d_%m_%Y}"
+
+
+def payload(nid, name=None):
+    return {
+        "nid": nid,
+        "name": name or f"Home {nid}",
+        "serviceProvider": {"state": "NSW", "postcode": "2000"},
+        "ratings": {"compliance": [{"rating": 3}], "overall": [{"rating": 4}]},
+        "ach_room_costs": {"subtypes": [{"productName": "Single", "maximumRAD": 5}]},
+    }
+
+
+class Upstream:
+    """The details endpoint: one payload per NID and a log of every request."""
+
+    def __init__(self, nids):
+        self.payloads = {nid: payload(nid) for nid in nids}
+        self.requests = []
+
+    def scraper(self, prefix):
+        upstream = self
+
+        class StubScraper(BaseScraper):
+            def __init__(self, raw_dir=None):
+                self.raw_dir = raw_dir
+
+            def fetch_raw(self, nid):
+                upstream.requests.append((prefix, nid))
+                return codec.dumps(upstream.payloads[nid])
+
+            def save_raw(self, nid, data):
+                stem = os.path.join(self.raw_dir, f"{prefix}_{nid}_{TODAY}")
+                return write_raw(stem, data)
+
+            def scrape_raw(self, nid):
+                body = self.fetch_raw(nid)
+                self.save_raw(nid, body)
+                return body
+
+            def scrape(self, nid):
+                return codec.loads(self.scrape_raw(nid))
+
+        return StubScraper
+
+    def fetched(self, prefix="operations"):
+        return [nid for p, nid in self.requests if p == prefix]
+
+
+@pytest.fixture
+def upstream(tmp_path, monkeypatch):
+    """Both pipelines on NIDs 1-6 (rads on 4-8), with every dir in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("LIMIT", raising=False)
+    for name in ("RAW", "INTERIM", "OUTPUT", "JOURNAL", "STATE", "CHANGES"):
+        monkeypatch.setattr(cli.gs, f"{name}_DIR", tmp_path / name.lower())
+    monkeypatch.setattr(nids, "NIDS_CACHE_ENABLED", False)
+    lists = {"operations": [1, 2, 3, 4, 5, 6], "rads": [4, 5, 6, 7, 8]}
+    for pipeline, conf in list(cli.PIPELINES.items()):
+        csv_path = tmp_path / f"{pipeline}.csv"
+        csv_path.write_text("nid\n" + "".join(f"{n}\n" for n in lists[pipeline]))
+        monkeypatch.setitem(cli.PIPELINES, pipeline, {**conf, "nids_csv": csv_path})
+
+    stub = Upstream(range(1, 9))
+    load_class = cli._load_class
+
+    def load(conf, role):
+        if role == "scraper":
+            return stub.scraper(conf["prefix"])
+        return load_class(conf, role)
+
+    monkeypatch.setattr(cli, "_load_class", load)
+    return stub
+
+
+def main(monkeypatch, *argv):
+    monkeypatch.setattr("sys.argv", ["aged-care-pipeline", *argv])
+    cli.main()
+
+
+def output(tmp_path, pipeline="operations"):
+    path = tmp_path / "output" / pipeline / f"{pipeline}_{TODAY}.csv"
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def journals(tmp_path, pipeline="operations"):
+    return sorted((tmp_path / "journal" / pipeline).glob("*.jsonl"))
+
+
+def test_resume_finishes_an_interrupted_run_without_refetching(
+    tmp_path, monkeypatch, capsys, upstream
+):
+    write_rows = cli._write_rows
+
+    def dies_after_three(pipeline, conf, nids, parsed, *args, **kwargs):
+        def first_three():
+            for i, item in enumerate(parsed):
+                if i == 3:
+                    raise RuntimeError("killed")
+                yield item
+
+        write_rows(pipeline, conf, nids, first_three(), *args, **kwargs)
+
+    monkeypatch.setattr(cli, "_write_rows", dies_after_three)
+    with pytest.raises(RuntimeError, match="killed"):
+        main(monkeypatch, "operations", "run", "--no-diff")
+    [path] = journals(tmp_path)
+    assert not RunJournal(path).complete
+
+    # the interrupted run's interim segment can be looked into
+    [segment] = (tmp_path / "interim" / "operations").glob("*_parsed.jsonl")
+    main(monkeypatch, "operations", "inspect", str(segment), "--nid", "1")
+    assert codec.loads(capsys.readouterr().out)[0]["nid"] == 1
+
+    monkeypatch.setattr(cli, "_write_rows", write_rows)
+    main(monkeypatch, "operations", "run", "--no-diff", "--resume", path.stem)
+
+    assert [int(row["nid"]) for row in output(tmp_path)] == [1, 2, 3, 4, 5, 6]
+    assert sorted(upstream.fetched()) == [1, 2, 3, 4, 5, 6]  # each NID once
+    assert RunJournal(path).complete
+    assert journals(tmp_path) == [path]
+
+
+def test_incremental_run_carries_unchanged_rows_forward(
+    tmp_path, monkeypatch, upstream
+):
+    main(monkeypatch, "operations", "run", "--incremental")
+    upstream.payloads[2] = payload(2, name="Renamed")
+    decoded = []
+    decode = cli._JournaledFetch.decode
+
+    def counting(self, nid, body):
+        decoded.append(nid)
+        return decode(self, nid, body)
+
+    monkeypatch.setattr(cli._JournaledFetch, "decode", counting)
+    main(monkeypatch, "operations", "run", "--incremental")
+
+    rows = output(tmp_path)
+    assert [int(row["nid"]) for row in rows] == [1, 2, 3, 4, 5, 6]
+    assert [row["name"] for row in rows][:3] == ["Home 1", "Renamed", "Home 3"]
+    assert decoded == [2]  # unchanged bodies were compared, not decoded
+    assert upstream.fetched() == [1, 2, 3, 4, 5, 6] * 2
+    [delta] = (tmp_path / "changes" / "operations").glob("delta_*.jsonl")
+    changes = [codec.loads(line) for line in delta.read_text().splitlines()]
+    assert [(c["nid"], c["change"]) for c in changes] == [(2, "changed")]
+
+
+def test_shard_parts_merge_into_the_unsharded_output(tmp_path, monkeypatch, upstream):
+    for shard in ("1/2", "2/2"):
+        main(monkeypatch, "operations", "run", "--shard", shard)
+
+    parts = sorted((tmp_path / "output" / "operations").glob("*.shard*"))
+    assert len(parts) == 2
+    main(monkeypatch, "operations", "merge")
+
+    assert [int(row["nid"]) for row in output(tmp_path)] == [1, 2, 3, 4, 5, 6]
+    assert sorted(upstream.fetched()) == [1, 2, 3, 4, 5, 6]
+
+
+def test_all_run_fetches_shared_nids_once(tmp_path, monkeypatch, upstream):
+    from aged_care_pipeline.scrapers import shared_fetch
+
+    monkeypatch.setattr(shared_fetch, "SHARED_FETCH_PROBE", 1)
+    main(monkeypatch, "all", "run", "--concurrency", "1")
+
+    assert [int(row["nid"]) for row in output(tmp_path)] == [1, 2, 3, 4, 5, 6]
+    assert {int(row["nid"]) for row in output(tmp_path, "rads")} == {4, 5, 6, 7, 8}
+    # 4 is the probe; 5 and 6 are fetched by operations for both pipelines
+    assert upstream.fetched("rads") == [4, 7, 8]
+    assert sorted(upstream.fetched("operations")) == [1, 2, 3, 4, 5, 6]
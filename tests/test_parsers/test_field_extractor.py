@@ -0,0 +1,88 @@
+import copy
+import random
+from itertools import pairwise
+
+import pytest
+
+from aged_care_pipeline.parsers.field_extractor import compile_field_paths
+from aged_care_pipeline.parsers.operations.operations_field_paths import (
+    FIELD_PATHS,
+    get_path,
+)
+
+extract = compile_field_paths(FIELD_PATHS)
+
+
+def reference(raw, field_paths=FIELD_PATHS):
+    return {col: get_path(raw, path) for col, path in field_paths.items()}
+
+
+def full_payload():
+    """A value at every path, lists wherever a path indexes."""
+    root = {}
+    for i, path in enumerate(FIELD_PATHS.values()):
+        node = root
+        for key, nxt in pairwise(path):
+            empty = [{}] if isinstance(nxt, int) else {}
+            node = node.setdefault(key, empty) if isinstance(node, dict) else node[key]
+        node[path[-1]] = f"v{i}"
+    return root
+
+
+def mutations(payload, rng, n):
+    """Knock random subtrees out, empty them or swap their type."""
+    for _ in range(n):
+        raw = copy.deepcopy(payload)
+        for _ in range(rng.randint(1, 6)):
+            path = rng.choice(list(FIELD_PATHS.values()))
+            cut = rng.randint(1, len(path))
+            parent = get_path(raw, path[: cut - 1]) if cut > 1 else raw
+            key = path[cut - 1]
+            if isinstance(parent, dict):
+                parent[key] = rng.choice([None, [], {}, "x", 0, [{}], {"a": 1}])
+            elif isinstance(parent, list) and parent:
+                parent.clear()
+        yield raw
+
+
+def test_full_payload_matches_get_path():
+    raw = full_payload()
+    assert extract(raw) == reference(raw)
+    assert list(extract(raw)) == list(FIELD_PATHS)  # column order kept
+    assert None not in extract(raw).values()
+
+
+@pytest.mark.parametrize("raw", [{}, None, [], "x", 3, {"nid": 1}, [{"nid": 1}]])
+def test_degenerate_payloads_match_get_path(raw):
+    assert extract(raw) == reference(raw)
+
+
+def test_randomly_damaged_payloads_match_get_path():
+    rng = random.Random(1234)
+    for raw in mutations(full_payload(), rng, 300):
+        assert extract(raw) == reference(raw)
+
+
+def test_list_indices_prefixes_and_int_keys_on_dicts():
+    paths = {
+        "whole": ["a"],
+        "first": ["a", 0, "b"],
+        "last": ["a", -1, "b"],
+        "second": ["a", 1],
+        "deep": ["a", 0, "b", "c"],
+    }
+    fn = compile_field_paths(paths)
+    for raw in (
+        {"a": [{"b": {"c": 1}}, {"b": 2}]},
+        {"a": [{"b": 3}]},
+        {"a": {0: {"b": 4}, 1: "y", -1: {"b": 5}}},
+        {"a": "str"},
+    ):
+        assert fn(raw) == reference(raw, paths)
+
+    # get_path's `key < len` guard lets a negative index through on an
+    # empty list; the compiled version fails the same way
+    with pytest.raises(IndexError):
+        reference({"a": []}, paths)
+    with pytest.raises(IndexError):
+        fn({"a": []})
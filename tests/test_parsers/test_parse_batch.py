@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+from aged_care_pipeline.interfaces.base_parser import BaseParser
+from aged_care_pipeline.parsers.operations.operations_field_paths import FIELD_PATHS
+from aged_care_pipeline.parsers.operations.operations_parser import OperationsParser
+from aged_care_pipeline.parsers.rads.rads_parser import RadsParser
+
+
+def ops_raw(nid, occupancy="91-100%", income=324.98):
+    return {
+        "nid": nid,
+        "name": f"Home {nid}",
+        "ratings": {"overall": [{"rating": 4}]},
+        "operationsData": {
+            "agedCareHomes": {"occupancy": {"value": {"value": occupancy}}},
+            "financialReport": {
+                "annual": {
+                    "income": {
+                        "items": {"governmentFunding": {"total": {"value": income}}}
+                    }
+                }
+            },
+        },
+    }
+
+
+def rads_raw(nid, rooms):
+    return {
+        "nid": nid,
+        "name": f"Home {nid}",
+        "serviceProvider": {"city": "Perth", "postcode": "6000", "state": "WA"},
+        "ach_room_costs": {
+            "subtypes": [{"productName": p, "maximumRAD": r} for p, r in rooms]
+        },
+    }
+
+
+def as_records(df):
+    return [
+        {k: (None if pd.isna(v) else v) for k, v in row.items()}
+        for row in df.astype(object).to_dict("records")
+    ]
+
+
+def test_operations_batch_matches_parse_row_for_row():
+    raws = [ops_raw(1), None, {"nid": None}, ops_raw(2, None, 10), ops_raw(3)]
+    parser = OperationsParser()
+
+    df = parser.parse_batch(raws, backend="pandas")
+
+    expected = [row for raw in raws for row in parser.parse(raw)]
+    assert list(df.columns) == list(FIELD_PATHS)
+    assert as_records(df) == expected
+    assert df["nid"].dtype == "Int64"
+    assert df["governmentFunding_total_value"].dtype == "Float64"
+    assert df["agedCareHomes_occupancy_value"].dtype == "string"
+
+
+def test_rads_batch_has_one_row_per_room():
+    raws = [
+        rads_raw(1, [("Single", 550000), ("Double", None)]),
+        rads_raw(2, []),
+        {},
+        rads_raw(3, [("Suite", 800000)]),
+    ]
+    parser = RadsParser()
+
+    df = parser.parse_batch(raws, backend="pandas")
+
+    assert as_records(df) == [row for raw in raws for row in parser.parse(raw)]
+    assert df["maximumRAD"].dtype == "Int64"
+
+
+def test_default_batch_goes_through_parse():
+    class PairParser(BaseParser):
+        def parse(self, raw):
+            return [{"a": raw["a"]}, {"a": raw["a"] * 2, "b": "x"}]
+
+    df = PairParser().parse_batch([{"a": 1}, {"a": 2}], backend="pandas")
+
+    assert as_records(df) == [
+        {"a": 1, "b": None},
+        {"a": 2, "b": "x"},
+        {"a": 2, "b": None},
+        {"a": 4, "b": "x"},
+    ]
+
+
+def test_arrow_backend():
+    pytest.importorskip("pyarrow")
+    table = OperationsParser().parse_batch([ops_raw(1), ops_raw(2)], backend="arrow")
+    assert table.num_rows == 2
+    assert table.column("nid").to_pylist() == [1, 2]
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        RadsParser().parse_batch([], backend="polars")
@@ -0,0 +1,91 @@
+import logging
+
+import pytest
+
+from aged_care_pipeline.interfaces.base_parser import BaseParser
+from aged_care_pipeline.parsers.executor import ParseExecutor
+from aged_care_pipeline.parsers.operations.operations_parser import OperationsParser
+
+
+class CountingParser(BaseParser):
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, raw):
+        self.calls += 1
+        return [{"nid": raw["nid"]}]
+
+
+def payloads(n):
+    return [{"nid": nid, "name": f"Home {nid}"} for nid in range(1, n + 1)]
+
+
+def test_in_process_parses_each_payload_once_in_order():
+    parser = CountingParser()
+    items = payloads(5)
+
+    with ParseExecutor(parser, workers=1) as executor:
+        results = executor.map(items)
+
+    assert results == [[{"nid": n}] for n in range(1, 6)]
+    assert parser.calls == 5
+    assert executor.stats() == {
+        "main": {"payloads": 5, "seconds": pytest.approx(0, abs=1)}
+    }
+
+
+def test_failed_fetches_parse_to_nothing():
+    parser = CountingParser()
+    with ParseExecutor(parser, workers=1) as executor:
+        results = executor.map([{"nid": 1}, None, {"nid": 3}])
+
+    assert results == [[{"nid": 1}], [], [{"nid": 3}]]
+    assert parser.calls == 2
+
+
+def test_imap_keeps_items_and_reads_payload_by_key():
+    items = [(nid, {"nid": nid}) for nid in (7, 3, 9)]
+    with ParseExecutor(CountingParser(), workers=1) as executor:
+        out = list(executor.imap(iter(items), key=lambda item: item[1]))
+
+    assert [item for item, _ in out] == items
+    assert [rows for _, rows in out] == [[{"nid": 7}], [{"nid": 3}], [{"nid": 9}]]
+
+
+def test_pool_matches_in_process_and_reports_per_worker():
+    items = payloads(50) + [None]
+    parser = OperationsParser()
+
+    expected = ParseExecutor(parser, workers=1).map(items)
+    with ParseExecutor(parser, workers=2, chunk_size=4) as executor:
+        results = executor.map(items)
+        stats = executor.stats()
+
+    assert results == expected
+    assert all(worker.startswith("pid ") for worker in stats)
+    assert sum(s["payloads"] for s in stats.values()) == len(items) - 1  # not None
+
+
+def test_pool_keeps_a_bounded_number_of_chunks_in_flight():
+    pulled = []
+
+    def source():
+        for nid in range(1, 101):
+            pulled.append(nid)
+            yield {"nid": nid}
+
+    with ParseExecutor(OperationsParser(), workers=2, chunk_size=5) as executor:
+        results = executor.imap(source())
+        next(results)
+        # first chunk back, at most workers * 2 chunks submitted so far
+        assert len(pulled) <= 2 * 2 * 5 + 5
+        results.close()
+
+
+def test_log_stats_one_line_per_worker(caplog):
+    with ParseExecutor(CountingParser(), workers=1) as executor:
+        executor.map(payloads(3))
+        with caplog.at_level(logging.INFO):
+            executor.log_stats()
+
+    assert "[ParseExec] main: 3 payloads" in caplog.text
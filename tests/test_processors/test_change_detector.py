@@ -0,0 +1,128 @@
+import json
+
+from aged_care_pipeline.processors.change_detector import ChangeDetector
+
+
+def run(state_dir, rows, snapshot, **kwargs):
+    detector = ChangeDetector(str(state_dir), **kwargs)
+    passed = list(detector.observe(iter(rows)))
+    assert passed == rows  # rows go through untouched
+    counts = detector.finish(snapshot)
+    return detector, counts
+
+
+def read_delta(state_dir, snapshot):
+    with open(state_dir / f"delta_{snapshot}.jsonl", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_first_run_is_a_baseline(tmp_path):
+    _, counts = run(tmp_path, [{"nid": 1, "a": 1}], "01_01_2026")
+
+    assert counts == {}
+    assert not list(tmp_path.glob("delta_*"))
+    assert (tmp_path / "hashes.json.gz").exists()
+
+
+def test_added_removed_and_changed_rows_with_their_columns(tmp_path):
+    run(
+        tmp_path,
+        [
+            {"nid": 1, "a": 1, "b": "x", "c": {"k": [1]}},
+            {"nid": 2, "a": 2, "b": "y", "c": None},
+            {"nid": 3, "a": 3, "b": "z", "c": None},
+        ],
+        "01_01_2026",
+    )
+    _, counts = run(
+        tmp_path,
+        [
+            {"nid": 1, "a": 1, "b": "x", "c": {"k": [2]}},
+            {"nid": 2, "a": 2, "b": "y", "c": None},
+            {"nid": 4, "a": 4, "b": "w", "c": None},
+        ],
+        "01_02_2026",
+    )
+
+    assert counts == {"changed": 1, "added": 1, "removed": 1}
+    assert read_delta(tmp_path, "01_02_2026") == [
+        {"change": "changed", "nid": 1, "columns": ["c"]},
+        {"change": "added", "nid": 4},
+        {"change": "removed", "nid": 3},
+    ]
+
+
+def test_repeated_keys_are_matched_by_occurrence(tmp_path):
+    key = ("nid", "room_type")
+    rooms = [
+        {"nid": 1, "room_type": "Single", "rad": 500},
+        {"nid": 1, "room_type": "Single", "rad": 600},
+    ]
+    run(tmp_path, rooms, "01_01_2026", key_columns=key)
+    rooms[1] = {**rooms[1], "rad": 650}
+    _, counts = run(tmp_path, rooms, "01_02_2026", key_columns=key)
+
+    assert counts == {"changed": 1}
+    assert read_delta(tmp_path, "01_02_2026") == [
+        {
+            "change": "changed",
+            "nid": 1,
+            "room_type": "Single",
+            "key_rank": 2,
+            "columns": ["rad"],
+        }
+    ]
+
+
+def test_new_columns_count_as_changed_only_when_filled(tmp_path):
+    run(tmp_path, [{"nid": 1, "a": 1}, {"nid": 2, "a": 2}], "01_01_2026")
+    run(
+        tmp_path,
+        [{"nid": 1, "a": 1, "new": None}, {"nid": 2, "a": 2, "new": "v"}],
+        "01_02_2026",
+    )
+
+    assert read_delta(tmp_path, "01_02_2026") == [
+        {"change": "changed", "nid": 2, "columns": ["new"]}
+    ]
+
+
+def test_a_run_without_rows_keeps_the_previous_hashes(tmp_path):
+    run(tmp_path, [{"nid": 1, "a": 1}], "01_01_2026")
+    run(tmp_path, [], "01_02_2026")
+    _, counts = run(tmp_path, [{"nid": 1, "a": 1}], "01_03_2026")
+
+    assert counts == {}
+    assert read_delta(tmp_path, "01_03_2026") == []
+
+
+def test_partial_run_compares_and_keeps_only_what_it_covered(tmp_path):
+    baseline = [{"nid": n, "a": n} for n in (1, 2, 3)]
+    run(tmp_path, baseline, "01_01_2026")
+
+    detector = ChangeDetector(str(tmp_path))
+    list(detector.observe(iter([{"nid": 1, "a": 10}])))  # --limit 1
+    counts = detector.finish("01_02_2026", covered={1})
+
+    assert counts == {"changed": 1}
+    assert read_delta(tmp_path, "01_02_2026") == [
+        {"change": "changed", "nid": 1, "columns": ["a"]}
+    ]
+
+    # the full run after it still knows NIDs 2 and 3, and sees 1's new value
+    run(
+        tmp_path,
+        [{"nid": 1, "a": 10}, {"nid": 2, "a": 2}, {"nid": 3, "a": 30}],
+        "01_03_2026",
+    )
+    assert read_delta(tmp_path, "01_03_2026") == [
+        {"change": "changed", "nid": 3, "columns": ["a"]}
+    ]
+
+
+def test_partial_run_without_a_previous_run_saves_no_baseline(tmp_path):
+    detector = ChangeDetector(str(tmp_path))
+    list(detector.observe(iter([{"nid": 1, "a": 1}])))
+
+    assert detector.finish("01_01_2026", covered={1}) == {}
+    assert not (tmp_path / "hashes.json.gz").exists()
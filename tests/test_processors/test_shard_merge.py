@@ -0,0 +1,59 @@
+from aged_care_pipeline.processors.shard_merge import (
+    ShardMerge,
+    find_parts,
+    part_name,
+    read_part,
+)
+from aged_care_pipeline.utils.nids import select_shard
+from aged_care_pipeline.writers.csv_writer import CSVWriter
+
+NIDS = [50, 7, 31, 12, 99, 3, 64, 18, 45, 2, 77, 10]
+
+
+def write_parts(out_dir, count, ext="csv", skip=()):
+    writer = CSVWriter(output_dir=str(out_dir), fieldnames=["nid", "room"])
+    for index in range(1, count + 1):
+        if index in skip:
+            continue
+        rows = [
+            {"nid": nid, "room": room}
+            for nid in select_shard(NIDS, index, count)
+            for room in ("a", "b")
+        ]
+        writer.write(rows, part_name("operations", "01_02_2025", ext, index, count))
+
+
+def test_parts_merge_back_into_nid_list_order(tmp_path):
+    write_parts(tmp_path, 3, "csv.gz")
+    ((count, parts),) = find_parts(
+        tmp_path, "operations", "01_02_2025", "csv.gz"
+    ).items()
+
+    merge = ShardMerge(parts, count, NIDS)
+    rows = list(merge.rows())
+
+    assert [(int(r["nid"]), r["room"]) for r in rows] == [
+        (nid, room) for nid in NIDS for room in ("a", "b")
+    ]
+    assert merge.rows_written == len(NIDS) * 2
+    assert all(
+        c["written"] == c["expected"] and not c["missing"] for c in merge.coverage()
+    )
+    assert next(iter(read_part(parts[1]))).keys() == {"nid", "room"}
+
+
+def test_coverage_reports_missing_parts_nids_and_strays(tmp_path):
+    write_parts(tmp_path, 3, skip={2})
+    parts = find_parts(tmp_path, "operations", "01_02_2025", "csv")[3]
+    with open(parts[1], "a", encoding="utf-8") as f:
+        f.write(f"{select_shard(NIDS, 3, 3)[0]},z\n")  # a NID of shard 3
+    listed = NIDS + [1000]  # listed since the shards ran
+
+    merge = ShardMerge(parts, 3, listed)
+    list(merge.rows())
+    report = {c["shard"]: c for c in merge.coverage()}
+
+    assert report[2]["path"] is None and report[2]["written"] == 0
+    assert report[1]["stray"] == [select_shard(NIDS, 3, 3)[0]]
+    missing = [n for n in (1, 2, 3) if 1000 in report[n]["missing"]]
+    assert len(missing) == 1
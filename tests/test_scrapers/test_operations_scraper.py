@@ -2,6 +2,7 @@ import importlib
 import json
 from pathlib import Path
 
+import pytest
 from requests.models import Response
 
 import aged_care_pipeline.scrapers.operations_scraper as op_scraper
@@ -43,3 +44,65 @@ def test_scrape_saves_raw(tmp_path, monkeypatch):
     assert len(saved_files) == 1
     saved = json.loads(saved_files[0].read_bytes())
     assert saved == sample
+
+
+def test_scrape_reads_indexed_archive_before_fetching(tmp_path, monkeypatch):
+    from aged_care_pipeline.storage.archive import archive_name, write_archive
+    from aged_care_pipeline.storage.raw_store import write_raw
+
+    old = tmp_path / "old"
+    old.mkdir()
+    paths = [
+        write_raw(old / f"operations_{nid}_01_02_2025", {"nid": nid}, "gzip")
+        for nid in (7, 8)
+    ]
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    write_archive(str(archive_dir / archive_name("operations", "01_02_2025")), paths)
+
+    def fake_get(url, headers):
+        raise AssertionError("archived NIDs must not be fetched")
+
+    monkeypatch.setattr(op_scraper, "safe_get", fake_get, raising=True)
+    monkeypatch.setenv("NIDS_CSV", str(tmp_path / "none.csv"))
+    scraper = op_scraper.OperationsScraper(
+        raw_dir=str(tmp_path / "raw"), archive_dir=str(archive_dir)
+    )
+
+    assert scraper.scrape(8) == {"nid": 8}
+    assert not (tmp_path / "raw").exists()  # served as-is, not re-saved
+
+
+def test_response_body_is_saved_as_received(tmp_path, monkeypatch):
+    from aged_care_pipeline.storage.raw_store import read_raw_bytes
+
+    body = b'{"nid": 5,   "name": "Caf\\u00e9"}'
+
+    def fake_get(url, headers):
+        resp = DummyResponse({})
+        resp._content = body
+        return resp
+
+    monkeypatch.setattr(op_scraper, "safe_get", fake_get, raising=True)
+    monkeypatch.setenv("ARCHIVE_CACHE", "0")
+    scraper = op_scraper.OperationsScraper(raw_dir=str(tmp_path))
+
+    assert scraper.scrape(5) == {"nid": 5, "name": "Café"}
+    (saved,) = Path(tmp_path).rglob("operations_5_*")
+    assert read_raw_bytes(saved) == body
+    assert scraper.scrape_raw(5) == body  # now served from disk
+
+
+def test_scrape_raw_rejects_non_json_bodies(tmp_path, monkeypatch):
+    def fake_get(url, headers):
+        resp = DummyResponse({})
+        resp._content = b"<html>maintenance</html>"
+        return resp
+
+    monkeypatch.setattr(op_scraper, "safe_get", fake_get, raising=True)
+    monkeypatch.setenv("ARCHIVE_CACHE", "0")
+    scraper = op_scraper.OperationsScraper(raw_dir=str(tmp_path))
+
+    with pytest.raises(ValueError):
+        scraper.scrape_raw(5)
+    assert not list(Path(tmp_path).rglob("operations_5_*"))
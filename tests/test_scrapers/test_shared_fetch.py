@@ -0,0 +1,101 @@
+from aged_care_pipeline.interfaces.base_scraper import BaseScraper
+from aged_care_pipeline.scrapers.shared_fetch import SharedFetcher
+from aged_care_pipeline.utils import codec
+
+
+class RecordingScraper(BaseScraper):
+    """Serve {"nid": n, **extra} and remember every fetch and raw save."""
+
+    def __init__(self, extra=None, differ=()):
+        self.extra = extra or {}
+        self.differ = set(differ)
+        self.fetched = []
+        self.saved = []
+
+    def fetch_raw(self, nid):
+        self.fetched.append(nid)
+        extra = {"rooms": []} if nid in self.differ else self.extra
+        return codec.dumps({"nid": nid, **extra})
+
+    def save_raw(self, nid, data):
+        self.saved.append((nid, data))
+        return f"raw_{nid}.json"
+
+    def scrape(self, nid):
+        body = self.fetch_raw(nid)
+        self.save_raw(nid, body)
+        return codec.loads(body)
+
+    # what SharedFetcher calls (the CLI passes a _JournaledFetch)
+    def body(self, nid):
+        return self._scrape_raw_or_none(nid)
+
+    def adopt(self, nid, body):
+        self.save_raw(nid, body)
+
+
+def test_shared_nids_are_fetched_once_after_the_probe_matches():
+    ops, rads = RecordingScraper(), RecordingScraper()
+    fetcher = SharedFetcher(
+        {"operations": (ops, [1, 2, 3, 4]), "rads": (rads, [4, 3, 2, 5])},
+        probe=2,
+        recheck=0,
+    )
+
+    assert fetcher.union() == [1, 2, 3, 4, 5]
+    bodies = {nid: fetcher.fetch(nid) for nid in fetcher.union()}
+
+    assert bodies[1] == {"operations": codec.dumps({"nid": 1})}
+    assert bodies[4] == dict.fromkeys(["operations", "rads"], codec.dumps({"nid": 4}))
+    # 2 and 3 were the probe; 4 was fetched by operations alone
+    assert ops.fetched == [1, 2, 3, 4]
+    assert rads.fetched == [2, 3, 5]
+    # each pipeline's raw file is still the body as received, byte for byte
+    assert sorted(rads.saved) == [(n, codec.dumps({"nid": n})) for n in (2, 3, 4, 5)]
+    assert (fetcher.identical, fetcher.differing, fetcher.shared) == (2, 0, 1)
+
+
+def test_a_differing_recheck_stops_sharing():
+    ops, rads = RecordingScraper(), RecordingScraper(differ={4})
+    nids = [1, 2, 3, 4, 5]
+    fetcher = SharedFetcher(
+        {"operations": (ops, nids), "rads": (rads, nids)}, probe=1, recheck=3
+    )
+
+    for nid in nids:
+        fetcher.fetch(nid)
+
+    # 1 probes, 2 and 3 are shared, 4 is rechecked and differs, 5 is compared
+    assert rads.fetched == [1, 4, 5]
+    assert fetcher.sharing is False
+    assert (fetcher.identical, fetcher.differing, fetcher.shared) == (2, 1, 2)
+    assert codec.loads(dict(rads.saved)[4]) == {"nid": 4, "rooms": []}
+
+
+def test_streams_take_shared_bodies_from_whichever_fetched_first():
+    ops, rads = RecordingScraper(), RecordingScraper()
+    fetcher = SharedFetcher(
+        {"operations": (ops, [1, 2]), "rads": (rads, [2])}, probe=1, recheck=0
+    )
+    ops_source, rads_source = fetcher.source("operations"), fetcher.source("rads")
+
+    # rads asks first and fetches for both; operations isn't served twice
+    assert rads_source(2) == codec.dumps({"nid": 2})
+    assert ops_source(2) == codec.dumps({"nid": 2})
+    assert ops_source(1) == codec.dumps({"nid": 1})
+    assert ops.fetched == [2, 1]
+    assert rads.fetched == [2]
+    assert fetcher._claims == {}
+
+
+def test_no_probe_never_shares():
+    ops, rads = RecordingScraper(), RecordingScraper()
+    fetcher = SharedFetcher(
+        {"operations": (ops, [1, 2]), "rads": (rads, [1, 2])}, probe=0
+    )
+
+    for nid in (1, 2):
+        fetcher.fetch(nid)
+
+    assert rads.fetched == [1, 2]
+    assert (fetcher.identical, fetcher.shared) == (2, 0)
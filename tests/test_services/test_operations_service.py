@@ -47,7 +47,8 @@ class DummyWriter:
         self.written = None
 
     def write(self, records, filename):
-        self.written = (records, filename)
+        # records may be a stream; drain it like a real writer would
+        self.written = (list(records), filename)
 
 
 def test_operations_service_runs(monkeypatch, tmp_path):
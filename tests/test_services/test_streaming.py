@@ -0,0 +1,147 @@
+import random
+import threading
+import time
+
+import pytest
+
+from aged_care_pipeline.interfaces.base_parser import BaseParser
+from aged_care_pipeline.parsers.executor import ParseExecutor
+from aged_care_pipeline.services.streaming import StreamingPipeline
+
+
+class EchoParser(BaseParser):
+    def parse(self, raw):
+        return [raw]
+
+
+class PairParser(BaseParser):
+    def parse(self, raw):
+        return [{"nid": raw["nid"], "n": i} for i in range(2)]
+
+
+def slow_fetch(nid):
+    time.sleep(random.uniform(0, 0.005))
+    return {"nid": nid}
+
+
+def test_rows_come_out_in_nid_order():
+    stream = StreamingPipeline(
+        fetch=slow_fetch,
+        executor=ParseExecutor(PairParser(), workers=1),
+        concurrency=4,
+        queue_size=2,
+    )
+
+    rows = list(stream.rows(range(30)))
+
+    assert [r["nid"] for r in rows] == [n for n in range(30) for _ in range(2)]
+
+
+def test_slow_writer_holds_back_fetching():
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch(nid):
+        with lock:
+            fetched.append(nid)
+        return {"nid": nid}
+
+    stream = StreamingPipeline(
+        fetch=fetch,
+        executor=ParseExecutor(EchoParser(), workers=1),
+        concurrency=2,
+        queue_size=2,
+    )
+    ahead = []
+    for consumed, _ in enumerate(stream.run(range(200)), 1):
+        time.sleep(0.002)
+        with lock:
+            ahead.append(len(fetched) - consumed)
+
+    assert len(fetched) == 200
+    # two queues, the engine's reorder window and one item in each stage's
+    # hands, never the whole run
+    assert max(ahead) <= 2 * 2 + 2 * 2 + 3
+
+
+def test_stage_errors_reach_the_consumer():
+    class PickyParser(BaseParser):
+        def parse(self, raw):
+            if raw["nid"] == 3:
+                raise ValueError("bad payload")
+            return [raw]
+
+    stream = StreamingPipeline(
+        fetch=slow_fetch, executor=ParseExecutor(PickyParser(), workers=1)
+    )
+
+    with pytest.raises(ValueError, match="bad payload"):
+        list(stream.run(range(10)))
+
+
+def test_closing_early_stops_the_stages():
+    stream = StreamingPipeline(
+        fetch=slow_fetch,
+        executor=ParseExecutor(EchoParser(), workers=1),
+        concurrency=2,
+        queue_size=1,
+    )
+    run = stream.run(range(1000))
+    next(run)
+    run.close()
+
+    assert not [t for t in threading.enumerate() if t.name.startswith("stream-")]
+
+
+def test_fetch_errors_reach_the_consumer():
+    def fetch(nid):
+        if nid == 5:
+            raise RuntimeError("network down")
+        return {"nid": nid}
+
+    stream = StreamingPipeline(
+        fetch=fetch, executor=ParseExecutor(EchoParser(), workers=1), concurrency=2
+    )
+
+    with pytest.raises(RuntimeError, match="network down"):
+        list(stream.run(range(10)))
+
+
+# the stage re-raises in its own thread too
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_stage_interrupts_stop_the_stream_and_propagate():
+    def finish(nid, raw, rows):
+        if nid == 3:
+            raise SystemExit(1)
+        return rows
+
+    stream = StreamingPipeline(
+        fetch=slow_fetch,
+        executor=ParseExecutor(EchoParser(), workers=1),
+        finish=finish,
+        concurrency=2,
+    )
+
+    with pytest.raises(SystemExit):
+        list(stream.run(range(10)))
+    assert not [t for t in threading.enumerate() if t.name.startswith("stream-")]
+
+
+def test_finish_sees_each_parse_result_once_in_order():
+    seen = []
+
+    def finish(nid, raw, rows):
+        seen.append(nid)
+        return rows + [{"nid": nid, "n": "extra"}]
+
+    stream = StreamingPipeline(
+        fetch=slow_fetch,
+        executor=ParseExecutor(PairParser(), workers=1),
+        finish=finish,
+        concurrency=4,
+    )
+
+    out = dict(stream.run(range(8)))
+
+    assert seen == list(range(8))
+    assert all(len(rows) == 3 for rows in out.values())
@@ -0,0 +1,189 @@
+import gzip
+import json
+
+import pytest
+
+from aged_care_pipeline.storage import archive, raw_store
+
+
+def _raw_files(tmp_path, n, fmt="json"):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    return [
+        raw_store.write_raw(raw_dir / f"operations_{nid}_01_02_2025", {"nid": nid}, fmt)
+        for nid in range(1, n + 1)
+    ]
+
+
+def test_archive_is_one_json_line_per_payload_in_order(tmp_path):
+    paths = _raw_files(tmp_path, 25, "gzip")
+    dest = str(tmp_path / archive.archive_name("operations", "01_02_2025"))
+
+    archived, skipped = archive.write_archive(dest, paths, readers=3)
+
+    assert archived == paths and skipped == []
+    with gzip.open(dest, "rt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert [json.loads(line)["nid"] for line in lines] == list(range(1, 26))
+    assert list(archive.iter_archive(dest)) == [{"nid": n} for n in range(1, 26)]
+    assert not (
+        tmp_path / (archive.archive_name("operations", "01_02_2025") + ".tmp")
+    ).exists()
+
+
+def test_unreadable_files_are_skipped(tmp_path):
+    paths = _raw_files(tmp_path, 3)
+    with open(paths[1], "w") as f:
+        f.write("{not json")
+    dest = str(tmp_path / "operations_all_raw_01_02_2025.jsonl.gz")
+
+    archived, skipped = archive.write_archive(dest, paths)
+
+    assert archived == [paths[0], paths[2]]
+    assert skipped == [paths[1]]
+    assert [p["nid"] for p in archive.iter_archive(dest)] == [1, 3]
+
+
+def test_corrupt_gzip_files_are_skipped_and_logged(tmp_path, caplog):
+    paths = _raw_files(tmp_path, 3, "gzip")
+    with open(paths[0], "rb") as f:
+        member = f.read()
+    with open(paths[0], "wb") as f:
+        f.write(member[: len(member) // 2])  # cut off
+    with open(paths[1], "wb") as f:
+        f.write(b"not gzip at all")
+    dest = str(tmp_path / "operations_all_raw_01_02_2025.jsonl.gz")
+
+    archived, skipped = archive.write_archive(dest, paths)
+
+    assert archived == [paths[2]] and skipped == paths[:2]
+    assert all(f"Skipping {p}" in caplog.text for p in skipped)
+
+
+def test_unexpected_read_errors_are_not_swallowed(tmp_path, monkeypatch):
+    paths = _raw_files(tmp_path, 2)
+
+    def broken(path):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(archive, "_encode_line", broken)
+    with pytest.raises(RuntimeError, match="bug"):
+        archive.write_archive(str(tmp_path / "a.jsonl.gz"), paths)
+    assert not list(tmp_path.glob("a.jsonl.gz*"))
+
+
+def test_old_list_archives_are_still_read(tmp_path):
+    old = raw_store.write_raw(
+        tmp_path / "operations_all_raw_01_02_2025", [{"nid": 1}, {"nid": 2}], "gzip"
+    )
+    assert list(archive.iter_archive(old)) == [{"nid": 1}, {"nid": 2}]
+
+
+def test_index_fetches_single_nids_by_block(tmp_path):
+    paths = _raw_files(tmp_path, 40, "gzip")
+    dest = str(tmp_path / "operations_all_raw_01_02_2025.jsonl.gz")
+    archive.write_archive(dest, paths, block_size=64)  # a few payloads per block
+
+    with archive.ArchiveReader(dest) as reader:
+        assert len(reader) == 40 and reader.nids() == list(range(1, 41))
+        assert len({entry[1] for entry in reader.index.values()}) > 1
+        assert reader.get(17) == {"nid": 17}
+        assert reader.get(99) is None
+        assert reader.get_many([40, 1, 99, 2]) == {n: {"nid": n} for n in (1, 2, 40)}
+    # the blocks still read back as one gzip stream
+    assert len(list(archive.iter_archive(dest))) == 40
+
+
+def test_latest_snapshot_of_a_nid_is_indexed(tmp_path):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    paths = [
+        raw_store.write_raw(raw_dir / "operations_5_02_02_2025", {"v": "new"}),
+        raw_store.write_raw(raw_dir / "operations_5_01_02_2025", {"v": "old"}),
+    ]
+    dest = str(tmp_path / "operations_all_raw_02_02_2025.jsonl.gz")
+    archive.write_archive(dest, paths, block_size=1)
+
+    with archive.ArchiveReader(dest) as reader:
+        assert reader.get(5) == {"v": "new"}
+
+
+def test_stale_index_is_rejected(tmp_path):
+    dest = str(tmp_path / "operations_all_raw_01_02_2025.jsonl.gz")
+    archive.write_archive(dest, _raw_files(tmp_path, 3))
+    with open(dest, "ab") as f:
+        f.write(b"\0")
+
+    with pytest.raises(ValueError):
+        archive.ArchiveReader(dest)
+
+
+def test_cache_prefers_the_newest_archive(tmp_path):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    archive_dir = tmp_path / "archive"
+    archive_dir.mkdir()
+    for stamp, nids in (("01_02_2025", (1, 2)), ("01_03_2025", (2,))):
+        paths = [
+            raw_store.write_raw(raw_dir / f"operations_{n}_{stamp}", {"at": stamp})
+            for n in nids
+        ]
+        archive.write_archive(
+            str(archive_dir / archive.archive_name("operations", stamp)), paths
+        )
+
+    cache = archive.ArchiveCache(archive_dir)
+    path, payload = cache.lookup(2)
+    assert payload == {"at": "01_03_2025"} and "01_03_2025" in path
+    assert cache.lookup(1)[1] == {"at": "01_02_2025"}
+    assert cache.lookup(3) is None
+    cache.close()
+
+
+def test_later_runs_the_same_day_get_their_own_archive(tmp_path):
+    first = archive.new_archive_path(tmp_path, "operations", "01_02_2025")
+    archive.write_archive(first, _raw_files(tmp_path, 2))
+    second = archive.new_archive_path(tmp_path, "operations", "01_02_2025")
+
+    assert first.endswith("operations_all_raw_01_02_2025.jsonl.gz")
+    assert second.endswith("operations_all_raw_01_02_2025_2.jsonl.gz")
+    (tmp_path / "raw2").mkdir()
+    path = raw_store.write_raw(tmp_path / "raw2" / "operations_1_01_02_2025", {"v": 2})
+    archive.write_archive(second, [path])
+    assert archive.ArchiveCache(tmp_path).lookup(1) == (second, {"v": 2})
+
+
+def test_payload_bytes_are_archived_as_stored(tmp_path):
+    (tmp_path / "raw").mkdir()
+    body = b'{"nid": 4,  "name": "Caf\\u00e9"}'
+    path = raw_store.write_raw(tmp_path / "raw" / "operations_4_01_02_2025", body)
+    dest = str(tmp_path / "operations_all_raw_01_02_2025.jsonl.gz")
+    archive.write_archive(dest, [path])
+
+    with archive.ArchiveReader(dest) as reader:
+        assert reader.get_raw(4) == body
+        assert reader.get(4) == {"nid": 4, "name": "Café"}
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_parse_nid_without_a_usable_index_is_a_usage_error(
+    tmp_path, monkeypatch, capsys, indexed
+):
+    from aged_care_pipeline import cli
+
+    path = tmp_path / "raw.json"
+    path.write_text('{"nid": 1}', encoding="utf-8")
+    if indexed:  # an index that belongs to some other file
+        with open(archive.index_path(str(path)), "w", encoding="utf-8") as f:
+            json.dump({"version": archive.INDEX_VERSION, "size": 0, "nids": {}}, f)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["aged-care-pipeline", "operations", "parse", str(path), "--nid", "1"],
+    )
+
+    with pytest.raises(SystemExit) as exited:
+        cli.main()
+
+    assert exited.value.code == 2
+    assert "--nid needs a cleanup archive" in capsys.readouterr().err
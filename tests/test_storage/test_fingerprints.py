@@ -0,0 +1,100 @@
+from typing import ClassVar
+
+from aged_care_pipeline import cli
+from aged_care_pipeline.storage.fingerprints import FingerprintStore
+from aged_care_pipeline.storage.journal import RunJournal
+from aged_care_pipeline.storage.segment import (
+    SegmentReader,
+    SegmentWriter,
+    segment_name,
+)
+
+
+def test_only_committed_fingerprints_survive(tmp_path):
+    with FingerprintStore.open(tmp_path, "operations") as store:
+        store.stage(1, "a", [{"nid": 1}])
+        store.commit("r1")
+        store.stage(2, "b", [{"nid": 2}])  # run died before commit
+
+    with FingerprintStore.open(tmp_path, "operations") as store:
+        assert len(store) == 1
+        assert store.unchanged(1, "a")
+        assert not store.unchanged(1, "other")
+        assert not store.unchanged(2, "b")
+        assert not store.unchanged(1, None)
+        assert store.rows(1) == [{"nid": 1}]
+        assert store.carried == 1
+
+
+def test_recommit_replaces_rows(tmp_path):
+    with FingerprintStore.open(tmp_path, "rads") as store:
+        store.stage(1, "a", [{"nid": 1, "rad": 1}])
+        store.commit()
+        store.stage(1, "b", [{"nid": 1, "rad": 2}, {"nid": 1, "rad": 3}])
+        store.commit()
+        assert store.unchanged(1, "b")
+        assert store.rows(1) == [{"nid": 1, "rad": 2}, {"nid": 1, "rad": 3}]
+
+
+def test_parser_schema_change_drops_fingerprints(tmp_path):
+    with FingerprintStore.open(tmp_path, "operations", schema="v1") as store:
+        store.stage(1, "a", [{"nid": 1}])
+        store.commit()
+
+    with FingerprintStore.open(tmp_path, "operations", schema="v1") as store:
+        assert store.unchanged(1, "a")
+
+    with FingerprintStore.open(tmp_path, "operations", schema="v2") as store:
+        assert len(store) == 0
+        assert not store.unchanged(1, "a")
+
+
+def test_parser_schema_id_tracks_version_and_columns():
+    from aged_care_pipeline.parsers.operations.operations_parser import (
+        OperationsParser,
+    )
+
+    class Bumped(OperationsParser):
+        version = OperationsParser.version + 1
+
+    class Narrower(OperationsParser):
+        columns = OperationsParser.columns[:-1]
+
+    class Moved(OperationsParser):
+        field_paths: ClassVar[dict] = {**OperationsParser.field_paths, "nid": ["id"]}
+
+    base = OperationsParser.schema_id()
+    assert base == OperationsParser.schema_id()
+    ids = {base, Bumped.schema_id(), Narrower.schema_id(), Moved.schema_id()}
+    assert len(ids) == 4
+
+
+def test_interim_saver_carries_unchanged_nids_forward(tmp_path):
+    interim = tmp_path / "interim"
+    interim.mkdir()
+    journal = RunJournal.start(tmp_path, "operations", run_id="r1")
+    journal.record(1, "fetched", body_sha256="same")
+    journal.record(2, "fetched", body_sha256="new")
+    store = FingerprintStore.open(tmp_path, "operations")
+    store.stage(1, "same", [{"nid": 1, "v": "old"}])
+    store.commit()
+
+    segment = SegmentWriter(interim / segment_name("operations", "r1"))
+    finish = cli._interim_saver(
+        "operations",
+        {"prefix": "operations"},
+        2,
+        segment,
+        journal=journal,
+        store=store,
+        unchanged={1},
+    )
+
+    assert finish(1, None, []) == [{"nid": 1, "v": "old"}]
+    assert finish(2, {"nid": 2}, [{"nid": 2, "v": "x"}]) == [{"nid": 2, "v": "x"}]
+    segment.close()
+    assert [nid for nid, _ in SegmentReader(segment.path)] == [2]  # no interim
+    store.commit("r1")
+    assert store.unchanged(2, "new")
+    store.close()
+    journal.close()
@@ -0,0 +1,137 @@
+import pytest
+
+from aged_care_pipeline import cli
+from aged_care_pipeline.interfaces.base_scraper import BaseScraper
+from aged_care_pipeline.storage.journal import RunJournal, body_hash
+from aged_care_pipeline.utils import codec
+
+
+class DiskScraper(BaseScraper):
+    """Serve {"nid": n}, save it like the real scrapers and count fetches."""
+
+    def __init__(self, raw_dir, fail=()):
+        self.raw_dir = raw_dir
+        self.fail = set(fail)
+        self.fetched = []
+
+    def fetch_raw(self, nid):
+        if nid in self.fail:
+            raise RuntimeError("boom")
+        self.fetched.append(nid)
+        return codec.dumps({"nid": nid})
+
+    def save_raw(self, nid, data):
+        path = self.raw_dir / f"operations_{nid}_01_02_2025.json"
+        path.write_bytes(data if isinstance(data, bytes) else codec.dumps(data))
+        return str(path)
+
+    def scrape(self, nid):
+        body = self.fetch_raw(nid)
+        self.save_raw(nid, body)
+        return codec.loads(body)
+
+
+def test_records_survive_reopen_and_torn_tail(tmp_path):
+    journal = RunJournal.start(tmp_path, "operations", run_id="r1")
+    journal.record(1, "fetched", sha256="a")
+    journal.record(1, "parsed", path="p1", rows=1)
+    journal.record(2, "fetched", sha256="b")
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"nid": 3, "sta')  # process died mid-write
+
+    resumed = RunJournal.resume(tmp_path, "operations", "r1")
+
+    assert resumed.header["pipeline"] == "operations"
+    assert resumed.state_of(1) == {
+        "nid": 1,
+        "state": "parsed",
+        "sha256": "a",
+        "path": "p1",
+        "rows": 1,
+    }
+    assert resumed.nids_in("fetched") == {2}
+    assert resumed.state_of(3) == {}
+    assert not resumed.complete
+    resumed.record(3, "fetched", sha256="c")
+    resumed.close()
+    with RunJournal(resumed.path) as reopened:
+        assert reopened.state_of(3)["sha256"] == "c"
+
+
+def test_runs_started_together_get_their_own_journal(tmp_path):
+    first = RunJournal.start(tmp_path, "operations")
+    second = RunJournal.start(tmp_path, "operations")
+    assert first.run_id != second.run_id
+    assert first.path != second.path
+    with pytest.raises(FileExistsError):
+        RunJournal.start(tmp_path, "operations", run_id=first.run_id)
+    first.close()
+    second.close()
+
+
+def test_resume_unknown_run_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        RunJournal.resume(tmp_path, "operations", "nope")
+
+
+def test_resumed_scrape_only_fetches_what_is_missing(tmp_path):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    journal = RunJournal.start(tmp_path, "operations", run_id="r1")
+    first = DiskScraper(raw_dir, fail={3})
+    cli._journaled_bulk(first, [1, 2, 3], journal, raw_dir, "operations")
+    journal.close()
+    assert journal.state_of(2)["body_sha256"] == body_hash(b'{"nid":2}')
+
+    journal = RunJournal.resume(tmp_path, "operations", "r1")
+    second = DiskScraper(raw_dir)
+    payloads = cli._journaled_bulk(second, [1, 2, 3], journal, raw_dir, "operations")
+    journal.close()
+
+    assert payloads == [{"nid": 1}, {"nid": 2}, {"nid": 3}]
+    assert second.fetched == [3]
+
+
+class BytesScraper(DiskScraper):
+    """Like DiskScraper, but stores and serves bodies as bytes."""
+
+    def scrape_raw(self, nid):
+        self.fetched.append(nid)
+        body = b'{"nid": %d}' % nid
+        (self.raw_dir / f"operations_{nid}_01_02_2025.json").write_bytes(body)
+        return body
+
+
+def test_lazy_scrape_journals_body_hashes_without_decoding(tmp_path):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    journal = RunJournal.start(tmp_path, "operations", run_id="r1")
+    cli._journaled_bulk(
+        BytesScraper(raw_dir), [1, 2], journal, raw_dir, "operations", lazy=True
+    )
+    journal.close()
+    assert journal.state_of(1)["body_sha256"] == body_hash(b'{"nid": 1}')
+    (raw_dir / "operations_2_01_02_2025.json").write_bytes(b'{"nid": 22}')
+
+    journal = RunJournal.resume(tmp_path, "operations", "r1")
+    second = BytesScraper(raw_dir)
+    bodies = cli._journaled_bulk(
+        second, [1, 2], journal, raw_dir, "operations", lazy=True
+    )
+    journal.close()
+
+    assert bodies == [b'{"nid": 1}', b'{"nid": 2}']
+    assert second.fetched == [2]  # its file no longer matched the journal
+
+
+def test_sharded_runs_get_their_own_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli.gs, "JOURNAL_DIR", tmp_path)
+    journal = cli._open_journal("operations", "run", None, shard=(2, 4))
+    journal.close()
+
+    assert journal.run_id.endswith("_shard2of4")
+    assert journal.header["shard"] == "2/4"
+    with pytest.raises(ValueError, match="--shard 2/4"):
+        cli._open_journal("operations", "run", journal.run_id)
+    cli._open_journal("operations", "run", journal.run_id, shard=(2, 4)).close()
@@ -0,0 +1,59 @@
+import json
+from datetime import date
+
+from aged_care_pipeline.scrapers.operations_scraper import OperationsScraper
+from aged_care_pipeline.storage.raw_index import RawIndex, parse_raw_name
+
+
+def touch(path, payload=None):
+    path.write_text(json.dumps(payload or {}))
+    return path
+
+
+def test_parse_raw_name_handles_both_date_styles():
+    assert parse_raw_name("operations_12_01_02_2025.json") == (
+        "operations",
+        12,
+        date(2025, 2, 1),
+    )
+    assert parse_raw_name("12345_20250101.json") == (None, 12345, date(2025, 1, 1))
+    assert parse_raw_name("operations_all_raw_01_02_2025.json") is None
+
+
+def test_lookup_is_exact_and_prefers_latest_snapshot(tmp_path):
+    touch(tmp_path / "operations_1212192_01_02_2025.json")
+    older = touch(tmp_path / "operations_12_01_01_2025.json")
+    newer = touch(tmp_path / "operations_12_01_03_2025.json")
+    touch(tmp_path / "rads_99_01_03_2025.json")
+
+    index = RawIndex(tmp_path, prefix="operations")
+
+    assert index.lookup(12) == newer
+    assert index.lookup(12, date(2025, 1, 1)) == older
+    assert index.lookup(1212) is None
+    assert index.lookup(99) is None  # belongs to the rads pipeline
+
+
+def test_primary_dir_wins_and_new_writes_are_indexed(tmp_path):
+    primary, fallback = tmp_path / "raw", tmp_path / "alt"
+    primary.mkdir()
+    fallback.mkdir()
+    touch(fallback / "7_20250101.json")
+
+    index = RawIndex(primary, fallback)
+    assert index.lookup(7) == fallback / "7_20250101.json"
+
+    written = touch(primary / "operations_7_05_05_2025.json")
+    index.add(7, written, date(2025, 5, 5))
+    assert index.lookup(7) == written
+
+
+def test_scraper_cache_hit_does_not_match_substrings(tmp_path, monkeypatch):
+    touch(tmp_path / "operations_1212192_01_02_2025.json", {"nid": 1212192})
+    touch(tmp_path / "operations_12_01_02_2025.json", {"nid": 12})
+    monkeypatch.setenv("NIDS_CSV", str(tmp_path / "nids.csv"))
+
+    scraper = OperationsScraper(raw_dir=str(tmp_path))
+
+    assert scraper.scrape(12) == {"nid": 12}
+    assert scraper.scrape(1212192) == {"nid": 1212192}
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+from aged_care_pipeline.scrapers.operations_scraper import OperationsScraper
+from aged_care_pipeline.storage import raw_store
+from aged_care_pipeline.storage.raw_index import parse_raw_name
+
+PAYLOAD = {"nid": 7, "name": "Sunny Haven – Ōtaki", "rooms": [{"beds": 2}] * 50}
+
+
+@pytest.mark.parametrize("fmt", ["json", "gzip", "zstd"])
+def test_round_trip_in_every_format(tmp_path, fmt):
+    if fmt == "zstd":
+        pytest.importorskip("zstandard")
+    raw_store.reset_raw_stats()
+
+    path = raw_store.write_raw(tmp_path / "operations_7_01_02_2025", PAYLOAD, fmt)
+
+    assert path.endswith(raw_store.RAW_SUFFIXES[fmt])
+    assert raw_store.read_raw(path) == PAYLOAD
+    assert parse_raw_name(os.path.basename(path))[1] == 7
+    stats = raw_store.raw_stats()
+    assert stats["files"] == 1
+    if fmt == "json":
+        with open(path, "rb") as f:
+            assert b"\n" not in f.read()  # compact, no indent
+    else:
+        assert stats["disk_bytes"] < stats["json_bytes"]
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        raw_store.write_raw(tmp_path / "x", PAYLOAD, "bzip2")
+
+
+def test_scraper_cache_reads_compressed_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(raw_store, "RAW_FORMAT", "gzip")
+    scraper = OperationsScraper(raw_dir=str(tmp_path))
+    path = scraper.save_raw(7, PAYLOAD)
+    assert path.endswith(".json.gz")
+    assert raw_store.list_raw_files(tmp_path) == [path]
+
+    # a fresh scraper (fresh index) serves it without touching the network
+    assert OperationsScraper(raw_dir=str(tmp_path)).scrape(7) == PAYLOAD
+
+
+def test_strip_raw_suffix():
+    assert raw_store.strip_raw_suffix("rads_1_01_02_2025.json.zst") == (
+        "rads_1_01_02_2025"
+    )
+    assert raw_store.strip_raw_suffix("rads_1_01_02_2025.json") == "rads_1_01_02_2025"
+
+
+@pytest.mark.parametrize("fmt", ["json", "gzip"])
+def test_bytes_are_stored_exactly_as_received(tmp_path, fmt):
+    body = b'{"nid": 7,  "name": "Sunny Haven \\u2013 \xc5\x8ctaki"}'
+
+    path = raw_store.write_raw(tmp_path / "operations_7_01_02_2025", body, fmt)
+
+    assert raw_store.read_raw_bytes(path) == body
+    assert raw_store.read_raw(path) == {"nid": 7, "name": "Sunny Haven – Ōtaki"}
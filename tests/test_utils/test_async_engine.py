@@ -0,0 +1,46 @@
+import random
+import threading
+import time
+
+from aged_care_pipeline.interfaces.base_scraper import BaseScraper
+from aged_care_pipeline.utils.async_engine import run_ordered
+
+
+def test_run_ordered_keeps_input_order_and_caps_concurrency():
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_square(n):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(random.uniform(0, 0.01))
+        with lock:
+            in_flight -= 1
+        return n * n
+
+    items = list(range(40))
+    results = run_ordered(slow_square, items, concurrency=4)
+
+    assert results == [n * n for n in items]
+    assert 1 < peak <= 4
+
+
+class FlakyScraper(BaseScraper):
+    def fetch_raw(self, nid):
+        if nid == 2:
+            raise ValueError("boom")
+        return b'{"nid": %d}' % nid
+
+    def save_raw(self, nid, data):
+        return f"raw_{nid}.json"
+
+    def scrape(self, nid):
+        return self.fetch(nid)
+
+
+def test_bulk_returns_none_for_failed_nids():
+    payloads = FlakyScraper().bulk([1, 2, 3], concurrency=2)
+    assert payloads == [{"nid": 1}, None, {"nid": 3}]
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from aged_care_pipeline.utils import codec
+
+DATA = {"nid": 7, "name": "Sunny Haven – Ōtaki", "rooms": [{"beds": 2, "rad": 1.5}]}
+
+
+@pytest.fixture(params=codec.BACKENDS)
+def backend(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return codec.get_codec(request.param)
+
+
+def test_compact_bytes_round_trip(backend):
+    blob = backend.dumps(DATA)
+
+    assert isinstance(blob, bytes)
+    assert json.loads(blob) == DATA
+    assert b" " not in blob.replace("Sunny Haven – Ōtaki".encode(), b"")
+    assert "Ōtaki".encode() in blob  # not \u-escaped
+    for form in (blob, bytearray(blob), memoryview(blob), blob.decode()):
+        assert backend.loads(form) == DATA
+
+
+def test_pretty_and_sorted(backend):
+    pretty = backend.dumps({"b": 1, "a": [1]}, pretty=True, sort_keys=True)
+    assert pretty.decode() == json.dumps({"a": [1], "b": 1}, indent=2)
+
+
+def test_int_keys_are_written_as_strings(backend):
+    assert backend.loads(backend.dumps({1: [2]})) == {"1": [2]}
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        backend.loads(b'{"nid": ')
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        codec.get_codec("yaml")
+    assert codec.CODEC.name in codec.available()
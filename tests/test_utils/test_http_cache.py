@@ -0,0 +1,96 @@
+import requests
+
+from aged_care_pipeline.utils.http_cache import HTTPCache
+
+
+def response(status, body=b"", headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers.update(headers or {})
+    return resp
+
+
+class FakeServer:
+    """Serve `body` with an ETag and answer matching If-None-Match with 304."""
+
+    def __init__(self, body=b'{"nid": 1}', etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    def __call__(self, url, headers):
+        self.requests.append((url, dict(headers)))
+        if headers.get("If-None-Match") == self.etag:
+            return response(304, headers={"ETag": self.etag})
+        return response(200, self.body, {"ETag": self.etag})
+
+
+def make_cache(tmp_path, clock, **kw):
+    opts = {"ttl": 60, "max_bytes": 1024}
+    opts.update(kw)
+    return HTTPCache(tmp_path / "cache", clock=lambda: clock[0], **opts)
+
+
+def test_fresh_entries_are_served_without_a_request(tmp_path):
+    clock = [0.0]
+    cache = make_cache(tmp_path, clock)
+    server = FakeServer()
+
+    first = cache.get("https://x/details/1", {}, server)
+    clock[0] = 30
+    second = cache.get("https://x/details/1", {}, server)
+
+    assert first.json() == second.json() == {"nid": 1}
+    assert len(server.requests) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidated": 0, "evicted": 0}
+
+
+def test_stale_entries_are_revalidated_with_etag(tmp_path):
+    clock = [0.0]
+    cache = make_cache(tmp_path, clock)
+    server = FakeServer()
+
+    cache.get("https://x/details/1", {"accept": "json"}, server)
+    clock[0] = 120
+    resp = cache.get("https://x/details/1", {"accept": "json"}, server)
+
+    assert resp.status_code == 200 and resp.json() == {"nid": 1}
+    assert server.requests[1][1] == {"accept": "json", "If-None-Match": '"v1"'}
+    assert cache.revalidated == 1
+
+    # the 304 refreshed the TTL, so the next call is a plain hit
+    clock[0] = 150
+    cache.get("https://x/details/1", {}, server)
+    assert len(server.requests) == 2
+
+
+def test_cache_survives_restarts(tmp_path):
+    clock = [0.0]
+    server = FakeServer()
+    make_cache(tmp_path, clock).get("https://x/details/1", {}, server)
+
+    reopened = make_cache(tmp_path, clock)
+    reopened.get("https://x/details/1", {}, server)
+    assert reopened.hits == 1 and len(server.requests) == 1
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    clock = [0.0]
+    cache = make_cache(tmp_path, clock, max_bytes=25)
+    server = FakeServer(body=b"0123456789")
+
+    for t, nid in enumerate((1, 2)):
+        clock[0] = t
+        cache.get(f"https://x/details/{nid}", {}, server)
+    clock[0] = 5
+    cache.get("https://x/details/1", {}, server)  # 1 is now more recent than 2
+    clock[0] = 6
+    cache.get("https://x/details/3", {}, server)
+
+    assert cache.evicted == 1
+    clock[0] = 7
+    server.requests.clear()
+    cache.get("https://x/details/1", {}, server)
+    cache.get("https://x/details/2", {}, server)
+    assert [url for url, _ in server.requests] == ["https://x/details/2"]
@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+from aged_care_pipeline.utils import limiter
+from aged_care_pipeline.utils.limiter import AdaptiveTokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_bucket(clock, **kw):
+    opts = {"rate": 2, "burst": 2, "min_rate": 0.5, "max_rate": 4, "increase": 0.5}
+    opts.update(kw)
+    return AdaptiveTokenBucket(clock=clock, sleep=clock.sleep, **opts)
+
+
+def test_bucket_paces_requests_after_burst():
+    clock = FakeClock()
+    bucket = make_bucket(clock)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    # two burst tokens go out immediately, then one every 1/rate seconds
+    assert waits == [0.0, 0.0, 0.5, 0.5]
+
+
+def test_throttle_halves_rate_and_honours_retry_after():
+    clock = FakeClock()
+    bucket = make_bucket(clock)
+
+    bucket.observe(429, retry_after=3)
+    assert bucket.rate == 1.0
+
+    # a second 429 inside the cooldown is treated as the same signal
+    bucket.observe(429)
+    assert bucket.rate == 1.0
+
+    assert bucket.acquire() >= 3.0
+    assert bucket.stats()["throttled"] == 2
+
+
+def test_healthy_responses_ramp_back_up_to_ceiling():
+    clock = FakeClock()
+    bucket = make_bucket(clock, rate=1)
+
+    for _ in range(20):
+        bucket.observe(200)
+
+    assert bucket.rate == 4
+
+
+def test_pipelines_share_one_bucket_per_host(monkeypatch):
+    monkeypatch.setattr(limiter, "_host_limiters", {})
+    a = limiter.get_host_limiter("https://www.myagedcare.gov.au/api/v1/x?a=1")
+    b = limiter.get_host_limiter("https://www.myagedcare.gov.au/api/v1/y?b=2")
+    assert a is b
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after("7") == 7.0
+    when = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert (
+        parse_retry_after(format_datetime(when, usegmt=True), now=when.timestamp() - 5)
+        == 5.0
+    )
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
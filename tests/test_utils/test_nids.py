@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from aged_care_pipeline.utils import nids
+
+
+def test_reads_the_nid_column(tmp_path):
+    csv_path = tmp_path / "providers.csv"
+    csv_path.write_text(
+        'name,nid,state\n"Sunny, Haven",101,NSW\nNo NID,,VIC\nFloaty,202.0,QLD\n',
+        encoding="utf-8",
+    )
+    assert nids.read_nids(csv_path) == [101, 202]
+
+
+def test_missing_column_or_bad_value_is_an_error(tmp_path):
+    no_column = tmp_path / "a.csv"
+    no_column.write_text("id\n1\n")
+    bad = tmp_path / "b.csv"
+    bad.write_text("nid\n1\nabc\n")
+
+    with pytest.raises(ValueError, match="no 'nid' column"):
+        nids.read_nids(no_column)
+    with pytest.raises(ValueError, match="b.csv:3"):
+        nids.read_nids(bad)
+
+
+def test_cache_is_used_until_the_csv_changes(tmp_path, monkeypatch):
+    csv_path = tmp_path / "nids.csv"
+    csv_path.write_text("nid\n1\n2\n")
+    cache = tmp_path / "cache"
+    assert nids.load_nids(csv_path, cache_dir=cache) == [1, 2]
+    assert nids.cache_path(csv_path, cache).exists()
+
+    def no_csv(path):
+        raise AssertionError("should have come from the cache")
+
+    monkeypatch.setattr(nids, "read_nids", no_csv)
+    assert nids.load_nids(csv_path, cache_dir=cache) == [1, 2]
+
+    monkeypatch.undo()
+    csv_path.write_text("nid\n1\n2\n3\n")
+    os.utime(csv_path, ns=(0, 10**9))
+    assert nids.load_nids(csv_path, cache_dir=cache) == [1, 2, 3]
+
+
+def test_cli_import_leaves_heavy_modules_alone():
+    code = (
+        "import sys, aged_care_pipeline.cli; "
+        "print(' '.join(m for m in ('pandas', 'requests', 'asyncio') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == []
+
+
+def test_shard_spec_is_validated():
+    assert nids.parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "2", "a/b", "1/0"):
+        with pytest.raises(ValueError):
+            nids.parse_shard(bad)
+
+
+def test_shards_partition_the_list_and_survive_list_changes():
+    listed = list(range(1000, 1400))
+    shards = [nids.select_shard(listed, i, 4) for i in range(1, 5)]
+
+    assert sorted(n for shard in shards for n in shard) == listed
+    assert all(60 < len(shard) < 140 for shard in shards)  # roughly even
+    grown = listed[::2] + list(range(5000, 5100))
+    for i, shard in enumerate(shards, start=1):
+        kept = [n for n in nids.select_shard(grown, i, 4) if n < 5000]
+        assert kept == [n for n in shard if n in set(listed[::2])]
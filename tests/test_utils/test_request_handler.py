@@ -0,0 +1,51 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from aged_care_pipeline.utils import request_handler
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep the socket open between requests
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server(monkeypatch):
+    # talk to the socket every time so the pool counters are exact
+    monkeypatch.setattr(request_handler, "get_http_cache", lambda: None)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    request_handler.close_session()
+    yield f"http://127.0.0.1:{server.server_port}"
+    request_handler.close_session()
+    server.shutdown()
+    server.server_close()
+
+
+def test_safe_get_reuses_one_keep_alive_connection(local_server):
+    for nid in range(5):
+        resp = request_handler.safe_get(f"{local_server}/details/{nid}", {})
+        assert resp.json() == {"path": f"/details/{nid}"}
+
+    stats = request_handler.pool_stats()
+    assert stats == {
+        "http://127.0.0.1": {"requests": 5, "handshakes": 1, "reuse_ratio": 0.8}
+    }
+
+
+def test_session_is_shared_process_wide(local_server):
+    assert request_handler.get_session() is request_handler.get_session()
@@ -0,0 +1,111 @@
+import pytest
+import requests
+
+from aged_care_pipeline.utils.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    RetryPolicy,
+    retry,
+)
+
+
+def http_error(status, headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    return requests.HTTPError(f"HTTP {status}", response=resp)
+
+
+class Failing:
+    """Raise the queued exceptions in turn, then return "ok"."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def test_fatal_errors_are_not_retried():
+    sleeps = []
+    policy = RetryPolicy(max_attempts=5, sleep=sleeps.append)
+
+    for exc in (http_error(404), ValueError("bad json")):
+        fn = Failing(exc)
+        with pytest.raises(type(exc)):
+            policy.call(fn)
+        assert fn.calls == 1
+    assert sleeps == []
+
+
+def test_exponential_backoff_and_retry_after():
+    sleeps = []
+    policy = RetryPolicy(max_attempts=4, base_delay=1, jitter=0, sleep=sleeps.append)
+    fn = Failing(
+        http_error(503),
+        requests.ConnectionError("reset"),
+        http_error(429, {"Retry-After": "10"}),
+    )
+
+    assert policy.call(fn) == "ok"
+    assert sleeps == [1, 2, 10]
+
+
+def test_budget_is_shared_across_calls():
+    policy = RetryPolicy(
+        max_attempts=3, budget=RetryBudget(1), jitter=0, sleep=lambda s: None
+    )
+
+    @retry(policy=policy)
+    def flaky(fn):
+        return fn()
+
+    assert flaky(Failing(http_error(502))) == "ok"
+    with pytest.raises(requests.HTTPError):
+        flaky(Failing(http_error(502)))
+
+
+def test_breaker_pauses_then_gives_up():
+    now = [0.0]
+    pauses = []
+
+    def sleep(s):
+        pauses.append(s)
+        now[0] += s
+
+    breaker = CircuitBreaker(
+        threshold=2, cooldown=10, max_trips=1, clock=lambda: now[0], sleep=sleep
+    )
+    policy = RetryPolicy(max_attempts=1, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(requests.ConnectionError):
+            policy.call(Failing(requests.ConnectionError("down")))
+    assert breaker.state == "open"
+
+    # the next caller waits out the cooldown, probes, and the probe fails
+    with pytest.raises(requests.ConnectionError):
+        policy.call(Failing(requests.ConnectionError("still down")))
+    assert pauses == [10]
+
+    with pytest.raises(CircuitOpenError):
+        policy.call(lambda: "never called")
+
+
+def test_breaker_closes_after_successful_probe():
+    now = [0.0]
+    breaker = CircuitBreaker(
+        threshold=1, cooldown=5, clock=lambda: now[0], sleep=lambda s: None
+    )
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now[0] = 6
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
@@ -22,3 +22,74 @@ def test_csv_write(tmp_path, monkeypatch):
     with out_file.open() as f:
         rows = list(csv.DictReader(f))
     assert rows == [{"a": "1", "b": "2"}, {"a": "3", "b": "4"}]
+
+
+def test_csv_write_streams_from_an_iterator(tmp_path):
+    """Records can be a generator; rows are written without a list."""
+    consumed = []
+
+    def records():
+        for i in range(3):
+            consumed.append(i)
+            yield {"a": i}
+
+    csv_writer.CSVWriter(output_dir=str(tmp_path)).write(records(), "s.csv")
+
+    with (tmp_path / "s.csv").open() as f:
+        assert [r["a"] for r in csv.DictReader(f)] == ["0", "1", "2"]
+    assert consumed == [0, 1, 2]
+
+
+def test_declared_header_keeps_rows_in_their_columns(tmp_path, caplog):
+    """Missing keys are blank and unknown keys dropped, not mis-columned."""
+    writer = csv_writer.CSVWriter(output_dir=str(tmp_path), fieldnames=["a", "b"])
+    writer.write([{"b": 1}, {"a": 2, "b": 3, "x": 9}, {"a": 4}], "h.csv")
+
+    with (tmp_path / "h.csv").open() as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{"a": "", "b": "1"}, {"a": "2", "b": "3"}, {"a": "4", "b": ""}]
+    assert "['x']" in caplog.text
+
+
+def test_session_rows_are_on_disk_after_each_block(tmp_path):
+    """A session flushes whole blocks, so a reader sees complete rows."""
+    writer = csv_writer.CSVWriter(output_dir=str(tmp_path), fieldnames=["nid", "v"])
+    session = writer.open("live.csv")
+    session.block_size = 64
+
+    session.write_rows({"nid": i, "v": "x" * 10} for i in range(20))
+
+    text = (tmp_path / "live.csv").read_bytes().decode()
+    assert text.endswith("\r\n")  # ends on a complete row
+    on_disk = list(csv.DictReader(text.splitlines()))
+    assert 0 < len(on_disk) <= 20
+    assert [r["nid"] for r in on_disk] == [str(i) for i in range(len(on_disk))]
+
+    session.close()
+    with (tmp_path / "live.csv").open() as f:
+        assert len(list(csv.DictReader(f))) == 20
+
+
+def test_gzip_session_is_readable_before_close(tmp_path):
+    """.csv.gz output: each flush is a sync point, readable mid-run."""
+    import gzip
+    import zlib
+
+    writer = csv_writer.CSVWriter(output_dir=str(tmp_path), fieldnames=["nid"])
+    with writer.open("rows.csv.gz") as session:
+        session.write_rows({"nid": i} for i in range(5))
+        session.flush()
+        partial = zlib.decompressobj(31).decompress(
+            (tmp_path / "rows.csv.gz").read_bytes()
+        )
+        assert partial.decode().split() == ["nid", "0", "1", "2", "3", "4"]
+
+    with gzip.open(tmp_path / "rows.csv.gz", "rt") as f:
+        assert len(list(csv.DictReader(f))) == 5
+
+
+def test_declared_header_without_rows_writes_header_only(tmp_path):
+    writer = csv_writer.CSVWriter(output_dir=str(tmp_path), fieldnames=["a", "b"])
+    with writer.open("empty.csv"):
+        pass
+    assert (tmp_path / "empty.csv").read_bytes() == b"a,b\r\n"
@@ -0,0 +1,119 @@
+import pytest
+
+from aged_care_pipeline.cli import _make_writer
+from aged_care_pipeline.writers import parquet_writer
+
+
+def rows(n, start=0):
+    for i in range(start, start + n):
+        yield {
+            "nid": i,
+            "state": "NSW" if i % 2 else "VIC",
+            "income": i * 1.5,
+            "note": None,
+        }
+
+
+def test_missing_pyarrow_is_a_clear_error(monkeypatch, tmp_path):
+    monkeypatch.setattr(parquet_writer, "pa", None)
+    with pytest.raises(RuntimeError, match="pyarrow"):
+        parquet_writer.ParquetWriter(output_dir=str(tmp_path))
+
+
+def test_cli_rejects_parquet_without_pyarrow_before_starting(monkeypatch, tmp_path):
+    from aged_care_pipeline import cli
+
+    monkeypatch.setattr(parquet_writer, "pa", None)
+    monkeypatch.setattr(cli.gs, "JOURNAL_DIR", str(tmp_path / "journal"))
+    monkeypatch.setattr(
+        "sys.argv", ["aged-care-pipeline", "operations", "run", "--format", "parquet"]
+    )
+
+    with pytest.raises(SystemExit) as exited:
+        cli.main()
+
+    assert exited.value.code == 2
+    assert not (tmp_path / "journal").exists()
+
+
+def test_cli_picks_writer_by_format(tmp_path):
+    writer, ext = _make_writer("csv", str(tmp_path))
+    # compared by name: test_csv_writer reloads the csv_writer module
+    assert type(writer).__name__ == "CSVWriter" and ext == "csv"
+
+
+TYPES = {"nid": int, "income": float}
+
+
+def test_typed_row_groups_and_dictionary_columns(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    writer = parquet_writer.ParquetWriter(
+        output_dir=str(tmp_path),
+        column_types=TYPES,
+        row_group_size=4,
+        dictionary_columns=["state"],
+    )
+
+    writer.write(rows(10), "out.parquet")
+
+    meta = pq.ParquetFile(tmp_path / "out.parquet").metadata
+    assert meta.num_rows == 10
+    assert meta.num_row_groups == 3
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert table.column_names == ["nid", "state", "income", "note"]
+    assert str(table.schema.field("nid").type) == "int64"
+    assert str(table.schema.field("income").type) == "double"
+    assert str(table.schema.field("note").type) == "string"  # undeclared
+    encodings = meta.row_group(0).column(1).encodings
+    assert any("DICTIONARY" in e for e in encodings)
+    assert table.column("nid").to_pylist() == list(range(10))
+
+
+def test_schema_comes_from_the_declared_columns_not_the_data(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    writer = parquet_writer.ParquetWriter(
+        output_dir=str(tmp_path),
+        fieldnames=["nid", "state", "income"],
+        column_types=TYPES,
+        row_group_size=2,
+    )
+    records = [{"nid": 1}, {"nid": 2}] + list(rows(2, start=3))  # all-null group
+
+    writer.write(records, "out.parquet")
+
+    table = pq.read_table(tmp_path / "out.parquet")
+    assert str(table.schema.field("income").type) == "double"
+    assert table.column("income").to_pylist() == [None, None, 4.5, 6.0]
+
+
+def test_values_that_dont_fit_are_written_as_null(tmp_path, caplog):
+    pq = pytest.importorskip("pyarrow.parquet")
+    writer = parquet_writer.ParquetWriter(
+        output_dir=str(tmp_path), column_types=TYPES, row_group_size=2
+    )
+    records = list(rows(2)) + [{"nid": "not a number", "state": "WA"}]
+
+    writer.write(records, "odd.parquet")
+
+    assert pq.read_table(tmp_path / "odd.parquet").column("nid").to_pylist() == [
+        0,
+        1,
+        None,
+    ]
+    assert writer.unfit == {"nid": 1}
+    assert "1 value(s) in nid" in caplog.text
+
+
+def test_fit_converts_to_the_declared_type():
+    fit = parquet_writer.fit
+    assert fit(3.0, int) == 3 and fit("1,250.5", float) == 1250.5
+    assert fit({"a": 1}, str) == '{"a":1}' and fit(None, float) is None
+    for value, kind in ((2.5, int), ("91-100%", float), (True, int), (1, bool)):
+        with pytest.raises(ValueError):
+            fit(value, kind)
+
+
+def test_empty_input_writes_nothing(tmp_path):
+    pytest.importorskip("pyarrow")
+    parquet_writer.ParquetWriter(output_dir=str(tmp_path)).write([], "x.parquet")
+    assert not (tmp_path / "x.parquet").exists()
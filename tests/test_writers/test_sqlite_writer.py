@@ -0,0 +1,104 @@
+import sqlite3
+
+import pytest
+
+from aged_care_pipeline.writers.sqlite_writer import SQLiteWriter, parse_target
+
+
+def ops_rows(n, income=1.5):
+    return [
+        {"nid": i, "state": "NSW", "postcode": "2000", "income": i * income}
+        for i in range(1, n + 1)
+    ]
+
+
+def query(writer, sql):
+    with sqlite3.connect(writer.db_path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("operations_18_10_2026.sqlite", ("operations", "2026-10-18")),
+        ("operations_20261018.csv", ("operations", "2026-10-18")),
+        ("rads_02_01_2025.sqlite", ("rads", "2025-01-02")),
+    ],
+)
+def test_table_and_snapshot_come_from_the_filename(filename, expected):
+    assert parse_target(filename) == expected
+
+
+def test_rewriting_a_snapshot_upserts(tmp_path):
+    writer = SQLiteWriter(output_dir=str(tmp_path), batch_size=3)
+
+    writer.write(ops_rows(10), "operations_01_01_2026.sqlite")
+    writer.write(ops_rows(10, income=2.0), "operations_01_01_2026.sqlite")
+    writer.write(ops_rows(4), "operations_01_02_2026.sqlite")
+
+    assert query(writer, "SELECT count(*) FROM operations") == [(14,)]
+    assert query(
+        writer,
+        "SELECT income FROM operations WHERE nid = 3 AND snapshot_date = '2026-01-01'",
+    ) == [(6.0,)]
+    assert query(writer, "PRAGMA journal_mode") == [("wal",)]
+
+
+def test_nid_state_and_postcode_are_indexed(tmp_path):
+    writer = SQLiteWriter(output_dir=str(tmp_path))
+    writer.write(ops_rows(3), "operations_01_01_2026.sqlite")
+
+    indexed = {
+        row[0]
+        for row in query(
+            writer,
+            "SELECT ii.name FROM sqlite_master m, pragma_index_info(m.name) ii "
+            "WHERE m.type = 'index' AND m.tbl_name = 'operations'",
+        )
+    }
+    assert {"nid", "state", "postcode"} <= indexed
+    plan = query(writer, "EXPLAIN QUERY PLAN SELECT * FROM operations WHERE nid = 2")
+    assert "USING INDEX" in plan[0][-1]
+
+
+def test_multi_row_keys_with_nulls_still_upsert(tmp_path):
+    writer = SQLiteWriter(output_dir=str(tmp_path), key_columns=("nid", "room_type"))
+    rows = [
+        {"nid": 1, "room_type": "Single", "maximumRAD": 500000},
+        {"nid": 1, "room_type": None, "maximumRAD": None},
+        {"nid": 1, "room_type": "Single", "maximumRAD": 650000},  # listed twice
+    ]
+
+    writer.write(rows, "rads_01_01_2026.sqlite")
+    writer.write(rows, "rads_01_01_2026.sqlite")
+
+    assert query(
+        writer, "SELECT room_type, key_rank, maximumRAD FROM rads ORDER BY rowid"
+    ) == [("Single", 1, 500000), (None, 1, None), ("Single", 2, 650000)]
+
+
+def test_history_returns_the_last_snapshots_newest_first(tmp_path):
+    writer = SQLiteWriter(output_dir=str(tmp_path))
+    for month in range(1, 6):
+        rows = [{"nid": 7, "state": "WA", "income": float(month)}]
+        writer.write(rows, f"operations_01_{month:02d}_2026.sqlite")
+
+    history = writer.history("operations", 7, last=3)
+
+    assert [h["snapshot_date"] for h in history] == [
+        "2026-05-01",
+        "2026-04-01",
+        "2026-03-01",
+    ]
+    assert [h["income"] for h in history] == [5.0, 4.0, 3.0]
+
+
+def test_new_columns_are_added_to_an_existing_table(tmp_path):
+    writer = SQLiteWriter(output_dir=str(tmp_path))
+    writer.write([{"nid": 1, "a": 1}], "operations_01_01_2026.sqlite")
+    writer.write([{"nid": 1, "a": 2, "b": "x"}], "operations_01_02_2026.sqlite")
+
+    assert query(writer, "SELECT nid, a, b FROM operations ORDER BY snapshot_date") == [
+        (1, 1, None),
+        (1, 2, "x"),
+    ]